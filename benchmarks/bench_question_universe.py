@@ -0,0 +1,102 @@
+"""
+Benchmark question sampling from enumerated universes.
+
+Compares the rejection loops the comparison and number line exercises used to
+draw fractions with sampling from core.question_universe. For each
+generator it reports the time per draw, the number of random draws per
+question, and how unevenly the distinct questions come up (the ratio of the
+most to the least frequent question; 1.0 is perfectly uniform).
+
+Usage:
+    python benchmarks/bench_question_universe.py [--samples 200000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.question_universe import fraction_universe
+
+COMPARISON_DENOMINATORS = (2, 3, 4, 5, 6, 8, 9, 10, 12)
+HARD_DENOMINATORS = (2, 3, 4, 5, 6, 7, 8, 9, 10, 12)
+NUMBER_LINE_DENOMINATORS = tuple(range(2, 16))
+
+
+class CountingRandom(random.Random):
+    """Random source that counts how many numbers were drawn."""
+
+    draws = 0
+
+    def random(self):
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k):
+        self.draws += 1
+        return super().getrandbits(k)
+
+
+def legacy_pair(rng, denominators):
+    """FractionComparisonExercise._generate_fraction_pair before enumeration."""
+    while True:
+        d1 = rng.choice(denominators)
+        n1 = rng.randint(1, d1 - 1)
+        frac1 = Fraction(n1, d1)
+        d2 = rng.choice(denominators)
+        n2 = rng.randint(1, d2 - 1)
+        frac2 = Fraction(n2, d2)
+        if frac1 != frac2:
+            return frac1, frac2
+
+
+def legacy_number_line_fraction(rng):
+    """Fraction branch of NumberLineExercise.generate_question before enumeration."""
+    numerator = rng.randint(1, 14)
+    denominator = rng.randint(numerator + 1, 15)
+    return Fraction(numerator, denominator)
+
+
+def measure(name: str, draw, samples: int, universe_size: int):
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(samples):
+        draw(rng)
+    elapsed = time.perf_counter() - start
+
+    # Draw counts and frequencies come from a second, slower pass
+    rng = CountingRandom(0)
+    counts = Counter(draw(rng) for _ in range(samples))
+    skew = max(counts.values()) / min(counts.values()) if len(counts) == universe_size else float("inf")
+    print(f"{name:<44} {elapsed / samples * 1e6:>8.2f} us {rng.draws / samples:>8.2f} "
+          f"{len(counts):>7}/{universe_size:<7} {skew:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200000, help="Questions drawn per generator")
+    args = parser.parse_args()
+
+    comparison = fraction_universe(COMPARISON_DENOMINATORS)
+    hard = fraction_universe(HARD_DENOMINATORS, 1.5)
+    number_line = fraction_universe(NUMBER_LINE_DENOMINATORS)
+
+    print(f"{'generator':<44} {'per draw':>11} {'draws':>8} {'seen/universe':>15} {'max/min':>7}")
+    measure("comparison pair, rejection loop", lambda rng: legacy_pair(rng, COMPARISON_DENOMINATORS),
+            args.samples, comparison.pair_count())
+    measure("comparison pair, universe", comparison.sample_pair, args.samples, comparison.pair_count())
+    measure("advanced hard pair, rejection loop", lambda rng: legacy_pair(rng, HARD_DENOMINATORS),
+            args.samples, hard.pair_count())
+    measure("advanced hard pair, universe", hard.sample_pair, args.samples, hard.pair_count())
+    measure("number line fraction, nested randint", legacy_number_line_fraction,
+            args.samples, len(number_line))
+    measure("number line fraction, universe", number_line.sample, args.samples, len(number_line))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark CPU use of the game loop in both render modes.
+
+Runs the game headless (SDL dummy video driver) for a fixed time while a timer
+posts mouse movement, then reports process CPU time as a share of wall time and
+how many frames were drawn. "continuous" is the old 60 FPS full redraw loop,
+"event" waits for events and redraws only dirty areas.
+
+Usage:
+    python benchmarks/bench_render_loop.py [--seconds 5] [--motion-hz 20]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from core.exercise_catalog import ExerciseCatalog
+from core.game_manager import GameManager
+from core.progress_logger import ProgressLogger
+from learn_pygame_solid import CATALOG_FILE, run_continuous_loop, run_event_loop
+
+LOOPS = {"continuous": run_continuous_loop, "event": run_event_loop}
+
+# Mouse positions cycled by the motion timer; they cross the answer areas of
+# every exercise so hover changes happen regularly
+MOTION_PATH = [(x, y) for y in (150, 200, 250, 300) for x in range(50, 800, 50)]
+
+
+def measure(mode: str, seconds: float, motion_hz: int, log_file: str) -> dict:
+    """Run one render mode for a number of seconds and return its statistics."""
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    fonts = {
+        'main': pygame.font.Font(None, 36),
+        'small': pygame.font.Font(None, 24),
+        'font': pygame.font.Font(None, 36),
+    }
+    catalog = ExerciseCatalog(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                           CATALOG_FILE))
+    game_manager = GameManager.from_catalog(catalog, screen, fonts, logger=ProgressLogger(log_file))
+    game_manager.next_question()
+
+    frames = 0
+    render = game_manager.render
+
+    def counting_render():
+        nonlocal frames
+        frames += 1
+        render()
+
+    game_manager.render = counting_render
+
+    # The loops only return on QUIT, so motion and the end of the run are timer events
+    motion_event = pygame.USEREVENT + 1
+    if motion_hz:
+        pygame.time.set_timer(motion_event, max(1, 1000 // motion_hz))
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), loops=1)
+
+    step = 0
+    handle_input = game_manager.handle_input
+
+    def handle_with_motion(event):
+        nonlocal step
+        if event.type == motion_event:
+            step += 1
+            pos = MOTION_PATH[step % len(MOTION_PATH)]
+            event = pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+        return handle_input(event)
+
+    game_manager.handle_input = handle_with_motion
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    LOOPS[mode](game_manager)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    pygame.time.set_timer(motion_event, 0)
+    pygame.quit()
+    return {"wall": wall, "cpu": cpu, "frames": frames, "motion_events": step}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare CPU use of the game render modes.")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Run time per mode")
+    parser.add_argument("--motion-hz", type=int, default=20,
+                        help="Simulated mouse movements per second (0 for an idle game)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.log")
+        for mode in LOOPS:
+            stats = measure(mode, args.seconds, args.motion_hz, log_file)
+            print(f"{mode:<10} CPU {stats['cpu']:.2f}s / {stats['wall']:.2f}s "
+                  f"({stats['cpu'] / stats['wall'] * 100:5.1f}%)  "
+                  f"{stats['frames']} frames drawn, {stats['motion_events']} mouse moves")
+
+
+if __name__ == "__main__":
+    main()
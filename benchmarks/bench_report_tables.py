@@ -0,0 +1,142 @@
+"""
+Benchmark the Exercise Summary tables of the progress report.
+
+Compares the vectorized renderer in core.reporting with the previous
+iterrows/.loc implementation on a synthetic multi-year log, and checks that
+both produce the same HTML.
+
+Usage:
+    python benchmarks/bench_report_tables.py [--years 5] [--attempts-per-day 40]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.report_aggregates import TIMESCALES, ReportAggregates
+from core.reporting import _exercise_summary_html
+
+EXERCISE_TYPES = ["number_line", "fraction_comparison", "advanced_fraction_comparison",
+                  "multiplication", "multiplication_choice"]
+
+
+def synthetic_log(years: int, attempts_per_day: int, seed: int = 0) -> pd.DataFrame:
+    """Build cleaned log rows spread over the given number of years."""
+    rng = np.random.default_rng(seed)
+    days = 365 * years
+    rows = days * attempts_per_day
+    start = np.datetime64("2020-01-01T08:00:00")
+    offsets = np.sort(rng.integers(0, days * 86400, rows)).astype("timedelta64[s]")
+    return pd.DataFrame({
+        "timestamp": start + offsets,
+        "exercise_type": rng.choice(EXERCISE_TYPES, rows),
+        "thinking_time": rng.gamma(2.0, 2.5, rows),
+        "accuracy": rng.random(rows),
+        "question": rng.integers(0, 500, rows).astype(str),
+        "is_correct": rng.random(rows) < 0.8,
+    })
+
+
+def legacy_exercise_summary_html(scale: pd.DataFrame) -> str:
+    """The Exercise Summary renderer as it was before vectorization."""
+    report_html = ""
+    total_completed = scale['count'].unstack(fill_value=0)
+    correctly_completed = scale['correct'].unstack(fill_value=0)
+    avg_time_exercise = (scale['time_sum'] / scale['count']).unstack(fill_value=np.nan)
+
+    if not total_completed.empty:
+        report_html += '''
+            <table>
+            <thead>
+            <tr>
+                <th>Date</th>
+                <th>Exercise Type</th>
+                <th>Attempts</th>
+                <th>Correct ✅</th>
+                <th>Accuracy</th>
+                <th>Avg Time</th>
+                <th>Rating</th>
+            </tr>
+            </thead>
+            <tbody>
+            '''
+        for period, period_data in total_completed.iterrows():
+            for exercise_type, total in period_data.items():
+                if total > 0:
+                    correct = correctly_completed.loc[period, exercise_type] if period in correctly_completed.index and exercise_type in correctly_completed.columns else 0
+                    avg_t = avg_time_exercise.loc[period, exercise_type] if period in avg_time_exercise.index and exercise_type in avg_time_exercise.columns else np.nan
+                    accuracy_pct = (correct / total * 100) if total > 0 else 0
+
+                    if accuracy_pct >= 90:
+                        rating = '😊 Excellent!'
+                        rating_class = 'good'
+                    elif accuracy_pct >= 70:
+                        rating = '😐 Good job!'
+                        rating_class = 'ok'
+                    else:
+                        rating = '😞 Keep practicing!'
+                        rating_class = 'needs-improvement'
+
+                    report_html += f'''
+                        <tr>
+                            <td>{period.strftime("%Y-%m-%d")}</td>
+                            <td><strong>{exercise_type.replace('_', ' ').title()}</strong></td>
+                            <td>{total}</td>
+                            <td>{correct}</td>
+                            <td>{accuracy_pct:.1f}%</td>
+                            <td>{avg_t:.1f}s</td>
+                            <td class="{rating_class}">{rating}</td>
+                        </tr>
+                        '''
+        report_html += '</tbody>\n</table>\n'
+    else:
+        report_html += '<p>No exercise data for this period.</p>\n'
+    return report_html
+
+
+def best_of(func, scale: pd.DataFrame, repeat: int) -> float:
+    """Return the fastest of several runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(scale)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the report summary tables.")
+    parser.add_argument("--years", type=int, default=5, help="Years of synthetic attempts")
+    parser.add_argument("--attempts-per-day", type=int, default=40, help="Attempts per day")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    data = synthetic_log(args.years, args.attempts_per_day)
+    aggregates = ReportAggregates.from_frame(data)
+    print(f"{len(data)} attempts over {args.years} years")
+
+    total_legacy = total_new = 0.0
+    for freq, name in TIMESCALES:
+        scale = aggregates.timescale(freq)
+        if legacy_exercise_summary_html(scale) != _exercise_summary_html(scale):
+            raise SystemExit(f"{name} tables differ between the legacy and vectorized renderers")
+
+        legacy = best_of(legacy_exercise_summary_html, scale, args.repeat)
+        new = best_of(_exercise_summary_html, scale, args.repeat)
+        total_legacy += legacy
+        total_new += new
+        print(f"{name:<8} {len(scale):>6} rows  legacy {legacy * 1000:9.1f} ms  "
+              f"vectorized {new * 1000:7.1f} ms  ({legacy / new:.1f}x)")
+
+    print(f"{'Total':<8} {'':>11}  legacy {total_legacy * 1000:9.1f} ms  "
+          f"vectorized {total_new * 1000:7.1f} ms  ({total_legacy / total_new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
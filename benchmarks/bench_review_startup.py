@@ -0,0 +1,83 @@
+"""
+Benchmark building the review schedule at startup.
+
+Writes a synthetic progress log of questions from the default exercises and
+times ReviewScheduler.load in three situations: without a snapshot (one
+streaming pass over the whole log), from a snapshot of the whole log, and from
+a snapshot after a session appended more attempts.
+
+Usage:
+    python benchmarks/bench_review_startup.py [--attempts 300000] [--session 200]
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.review_scheduler import ReviewScheduler
+from exercises.registry import create_exercises
+
+CONFIG = [
+    {"type": "number_line"},
+    {"type": "fraction_comparison"},
+    {"type": "advanced_fraction_comparison", "params": {"difficulty": "hard"}},
+    {"type": "multiplication_choice", "params": {"max_number": 7}},
+]
+
+
+def write_attempts(log_file: str, attempts: int, start: datetime.datetime, rng: random.Random) -> datetime.datetime:
+    """Append attempts in the text log format, 5 seconds apart. Returns the time after the last one."""
+    exercises = create_exercises(CONFIG)
+    questions = [(exercise.get_type(), exercise.question_at(i)[0])
+                 for exercise in exercises for i in range(exercise.question_count())]
+    when = start
+    step = datetime.timedelta(seconds=5)
+    with open(log_file, "a", encoding="utf-8") as f:
+        for _ in range(attempts):
+            exercise_type, question = rng.choice(questions)
+            accuracy = 1.0 if rng.random() < 0.8 else 0.0
+            f.write(f"{when.isoformat()}, {exercise_type}, 4.00, 0.000, {accuracy:.2f}, {question}, 1, 1\n")
+            when += step
+    return when
+
+
+def measure(name: str, log_file: str, snapshot_file: str) -> ReviewScheduler:
+    start = time.perf_counter()
+    scheduler = ReviewScheduler.load(log_file, snapshot_file)
+    elapsed = time.perf_counter() - start
+    stats = scheduler.load_stats()
+    print(f"{name:<28} {elapsed * 1000:>9.1f} ms {stats['attempts_read']:>10} {stats['snapshot_items']:>10} "
+          f"{stats['items']:>8}")
+    return scheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--attempts", type=int, default=300000, help="Attempts in the historical log")
+    parser.add_argument("--session", type=int, default=200, help="Attempts appended by one session")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.log")
+        snapshot_file = os.path.join(tmp, "review_snapshot.json")
+        when = write_attempts(log_file, args.attempts, datetime.datetime(2024, 1, 1, 8, 0), rng)
+        print(f"Log: {args.attempts} attempts, {os.path.getsize(log_file) / 1e6:.1f} MB")
+
+        print(f"{'load':<28} {'time':>12} {'log read':>10} {'snapshot':>10} {'items':>8}")
+        # No snapshot exists yet, so the first load reads the whole log
+        measure("full log, no snapshot", log_file, snapshot_file).save()
+        print(f"Snapshot: {os.path.getsize(snapshot_file) / 1e6:.1f} MB")
+        measure("snapshot", log_file, snapshot_file)
+        write_attempts(log_file, args.session, when, rng)
+        measure(f"snapshot + {args.session} new attempts", log_file, snapshot_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Startup import-time benchmark with a regression budget.
+
+Runs each launch mode's imports in a fresh interpreter under
+``python -X importtime`` and prints the slowest top-level imports. Fails
+(exit code 1) when a mode goes over its time budget or pulls in a module it
+should not need, e.g. pandas on the game path.
+
+Usage:
+    python benchmarks/bench_startup.py [--mode launcher|game|report] [--repeat 3]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# mode -> (statement to import, budget in ms, modules that must not be imported)
+MODES = {
+    "launcher": ("import main", 150, ["pygame", "pandas", "numpy", "matplotlib"]),
+    "game": ("import main, learn_pygame_solid", 1000, ["pandas", "matplotlib"]),
+    "report": ("import main, core.reporting", 2500, ["pygame", "matplotlib"]),
+}
+
+
+def measure(statement: str) -> Tuple[float, Dict[str, int], List[str]]:
+    """
+    Import a statement in a fresh interpreter.
+
+    Returns:
+        (total ms, cumulative microseconds per top-level import, all imported modules)
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"{statement!r} failed: {errors[-1] if errors else result.returncode}")
+
+    top_level: Dict[str, int] = {}
+    modules: List[str] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        # Top-level imports are the ones without indentation after the "|"
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = top_level.get(name.strip(), 0) + int(cumulative_us)
+    return sum(top_level.values()) / 1000, top_level, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time of each launch mode.")
+    parser.add_argument("--mode", choices=sorted(MODES), action="append",
+                        help="Mode to measure (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (best is kept)")
+    parser.add_argument("--top", type=int, default=8, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    failures = []
+    for mode in args.mode or list(MODES):
+        statement, budget_ms, forbidden = MODES[mode]
+        try:
+            runs = [measure(statement) for _ in range(max(1, args.repeat))]
+        except RuntimeError as e:
+            failures.append(f"{mode}: {e}")
+            continue
+        total_ms, top_level, modules = min(runs, key=lambda run: run[0])
+
+        print(f"{mode}: {statement!r} {total_ms:.1f} ms (budget {budget_ms} ms)")
+        for name, cumulative_us in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+        if total_ms > budget_ms:
+            failures.append(f"{mode} took {total_ms:.1f} ms, over its {budget_ms} ms budget")
+        unwanted = sorted({name.split(".")[0] for name in modules} & set(forbidden))
+        if unwanted:
+            failures.append(f"{mode} imported {', '.join(unwanted)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
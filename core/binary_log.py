@@ -0,0 +1,319 @@
+"""
+Compact binary attempt log.
+
+An alternative to the comma-joined text log written by ProgressLogger. The log
+is made of two append-only files:
+
+* ``<log>``: a 16-byte header followed by fixed-width little-endian records,
+  one per attempt (see RECORD_FIELDS).
+* ``<log>.strings``: the string dictionary. Each entry is a 4-byte length and
+  UTF-8 bytes. ``exercise_type``, ``question`` and ``catalog_entry`` are stored
+  in the record as indices into this dictionary, so each distinct string is
+  written only once.
+
+Version 1 records have no ``catalog_entry``. Version 1 logs are still read,
+and appended to in their own layout.
+
+``correct`` and ``guess`` are stored as float64, the same values the logger
+already uses to compute ``distance``. Values that are not numbers are stored
+as NaN.
+
+BinaryLogReader memory-maps the record file. It exposes each column as a NumPy
+view and does not copy any data.
+"""
+
+import datetime
+import math
+import os
+import struct
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from core.progress_logger import split_text_entry
+
+MAGIC = b"LFBLOG"
+VERSION = 2
+HEADER = struct.Struct("<6sHH6x")
+
+# (name, struct code, numpy dtype) in on-disk order
+RECORD_FIELDS = [
+    ("timestamp", "q", "<i8"),       # microseconds since 1970-01-01, local wall-clock time
+    ("correct", "d", "<f8"),
+    ("guess", "d", "<f8"),
+    ("exercise_type", "I", "<u4"),   # index into the string dictionary
+    ("question", "I", "<u4"),        # index into the string dictionary
+    ("thinking_time", "f", "<f4"),
+    ("distance", "f", "<f4"),
+    ("accuracy", "f", "<f4"),
+    ("catalog_entry", "I", "<u4"),   # index into the string dictionary; "" if not from a catalog
+]
+# Fields of the record layouts that can be read
+RECORD_FIELDS_BY_VERSION = {1: RECORD_FIELDS[:8], 2: RECORD_FIELDS}
+RECORD_STRUCTS = {
+    version: struct.Struct("<" + "".join(code for _, code, _ in fields))
+    for version, fields in RECORD_FIELDS_BY_VERSION.items()
+}
+RECORD = RECORD_STRUCTS[VERSION]
+STRING_LENGTH = struct.Struct("<I")
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def strings_path(log_file) -> Path:
+    """Return the path of the string dictionary that belongs to a binary log."""
+    return Path(str(log_file) + ".strings")
+
+
+def _read_header(log_file) -> Tuple[int, struct.Struct]:
+    """
+    Check the header of a binary log.
+
+    Returns:
+        The log's version and record struct
+
+    Raises:
+        ValueError: If the file is not a binary log of a known version
+    """
+    with open(log_file, "rb") as f:
+        magic, version, record_size = HEADER.unpack(f.read(HEADER.size))
+    record = RECORD_STRUCTS.get(version)
+    if magic != MAGIC or record is None or record_size != record.size:
+        raise ValueError(f"{log_file} is not a binary progress log of a known version")
+    return version, record
+
+
+def record_size(log_file) -> int:
+    """Return the record size of a binary log, which depends on its version."""
+    return _read_header(log_file)[1].size
+
+
+def is_binary_log(log_file) -> bool:
+    """Check whether a file starts with the binary log header."""
+    try:
+        with open(log_file, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _to_float(value: Any) -> float:
+    """Convert an answer (int, float, Fraction, "7/8"-style string) to float, NaN if impossible."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return float(Fraction(str(value).strip()))
+    except (ValueError, ZeroDivisionError):
+        return math.nan
+
+
+def _read_strings(path: Path) -> Tuple[List[str], int]:
+    """Read the string dictionary. Returns the strings and the byte length of complete entries."""
+    strings: List[str] = []
+    if not path.exists():
+        return strings, 0
+
+    data = path.read_bytes()
+    pos = 0
+    while pos + STRING_LENGTH.size <= len(data):
+        (length,) = STRING_LENGTH.unpack_from(data, pos)
+        end = pos + STRING_LENGTH.size + length
+        if end > len(data):
+            break  # torn write at the end of the file
+        strings.append(data[pos + STRING_LENGTH.size:end].decode("utf-8"))
+        pos = end
+    return strings, pos
+
+
+class BinaryLogWriter:
+    """Appends attempt records to a binary log, creating it if needed."""
+
+    def __init__(self, log_file):
+        self.log_file = Path(log_file)
+        self._strings_file = strings_path(self.log_file)
+
+        strings, strings_size = _read_strings(self._strings_file)
+        self._codes: Dict[str, int] = {s: i for i, s in enumerate(strings)}
+
+        # Drop partially written entries left behind by an interrupted write
+        if self._strings_file.exists() and self._strings_file.stat().st_size != strings_size:
+            os.truncate(self._strings_file, strings_size)
+        self._strings = open(self._strings_file, "ab")
+
+        if not self.log_file.exists() or self.log_file.stat().st_size == 0:
+            with open(self.log_file, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            self.version, self._record = VERSION, RECORD
+        else:
+            self.version, self._record = _read_header(self.log_file)
+            size = self.log_file.stat().st_size
+            torn = (size - HEADER.size) % self._record.size
+            if torn:
+                os.truncate(self.log_file, size - torn)
+        self._records = open(self.log_file, "ab")
+
+    def _code(self, text: str) -> int:
+        """Return the dictionary index of a string, appending it if it is new."""
+        code = self._codes.get(text)
+        if code is None:
+            code = len(self._codes)
+            encoded = text.encode("utf-8")
+            self._strings.write(STRING_LENGTH.pack(len(encoded)) + encoded)
+            self._codes[text] = code
+        return code
+
+    def append(self, records: Iterable[tuple]):
+        """
+        Append attempt records.
+
+        Args:
+            records: Tuples of (timestamp, exercise_type, thinking_time, distance,
+                accuracy, question, correct, guess, catalog_entry), where
+                timestamp is a datetime and catalog_entry may be None. Version 1
+                logs drop catalog_entry.
+        """
+        chunks = []
+        pack = self._record.pack
+        with_entry = self.version >= 2
+        for (timestamp, exercise_type, thinking_time, distance, accuracy, question, correct, guess,
+             catalog_entry) in records:
+            micros = (timestamp - _EPOCH) // datetime.timedelta(microseconds=1)
+            fields = (
+                micros, _to_float(correct), _to_float(guess),
+                self._code(str(exercise_type)), self._code(str(question)),
+                thinking_time, distance, accuracy,
+            )
+            if with_entry:
+                fields += (self._code(catalog_entry or ""),)
+            chunks.append(pack(*fields))
+        # Strings go to disk first so records never point at missing entries
+        self._strings.flush()
+        self._records.write(b"".join(chunks))
+
+    def flush(self):
+        self._strings.flush()
+        self._records.flush()
+
+    def close(self):
+        self._strings.close()
+        self._records.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BinaryLogReader:
+    """
+    Memory-mapped, read-only view of a binary log.
+
+    ``column(name)`` returns a NumPy view into the mapped file. ``timestamp``
+    is viewed as ``datetime64[us]``. ``exercise_type``, ``question`` and
+    ``catalog_entry`` come back as integer codes into ``strings``. Version 1
+    logs have no ``catalog_entry`` column.
+    """
+
+    def __init__(self, log_file):
+        import numpy as np
+
+        self.log_file = Path(log_file)
+        self.version, record = _read_header(self.log_file)
+        self.record_size = record.size
+        self.fields = [name for name, _, _ in RECORD_FIELDS_BY_VERSION[self.version]]
+
+        self.dtype = np.dtype([(name, dtype) for name, _, dtype in RECORD_FIELDS_BY_VERSION[self.version]])
+        count = (self.log_file.stat().st_size - HEADER.size) // record.size
+        if count:
+            self.records = np.memmap(self.log_file, dtype=self.dtype, mode="r",
+                                     offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=self.dtype)
+        self.strings, _ = _read_strings(strings_path(self.log_file))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def column(self, name: str):
+        """Return a zero-copy NumPy view of one column."""
+        values = self.records[name]
+        if name == "timestamp":
+            return values.view("datetime64[us]")
+        return values
+
+    def to_dataframe(self, start: int = 0, stop: int = None):
+        """
+        Build a pandas DataFrame with the same columns as the text log.
+
+        Numeric columns wrap the mapped views. String columns are Categoricals
+        built from the codes and the dictionary, so the strings are not
+        expanded per row.
+
+        Args:
+            start, stop: Optional record range to include
+        """
+        import pandas as pd
+
+        categories = pd.Index(self.strings, dtype=object)
+        columns = {}
+        for name in self.fields:
+            values = self.column(name)[start:stop]
+            if name in ("exercise_type", "question", "catalog_entry"):
+                columns[name] = pd.Categorical.from_codes(values.astype("int64"), categories=categories)
+            else:
+                columns[name] = pd.Series(values, copy=False)
+        order = ["timestamp", "exercise_type", "thinking_time", "distance",
+                 "accuracy", "question", "correct", "guess", "catalog_entry"]
+        return pd.DataFrame({name: columns[name] for name in order if name in columns}, copy=False)
+
+
+def convert_text_log(text_file, binary_file) -> int:
+    """
+    Append the attempts of a text progress log to a binary log.
+
+    Args:
+        text_file: Path of the comma-joined text log
+        binary_file: Path of the binary log to create or extend
+
+    Returns:
+        Number of attempts converted
+    """
+    converted = 0
+    batch = []
+    with open(text_file, "r", encoding="utf-8") as src, BinaryLogWriter(binary_file) as writer:
+        for line in src:
+            fields = split_text_entry(line)
+            if fields is None:
+                continue
+            timestamp, exercise_type, thinking_time, distance, accuracy = fields[:5]
+            try:
+                record = (
+                    datetime.datetime.fromisoformat(timestamp), exercise_type,
+                    float(thinking_time), float(distance), float(accuracy), *fields[5:],
+                )
+            except ValueError:
+                continue
+            batch.append(record)
+            if len(batch) >= 10000:
+                writer.append(batch)
+                converted += len(batch)
+                batch = []
+        writer.append(batch)
+        converted += len(batch)
+    return converted
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert a text progress log to the binary format.")
+    parser.add_argument("text_log", help="Text log to read")
+    parser.add_argument("binary_log", help="Binary log to create or append to")
+    args = parser.parse_args()
+    count = convert_text_log(args.text_log, args.binary_log)
+    print(f"Converted {count} attempts into {args.binary_log}")
@@ -1,10 +1,37 @@
+import random
 from abc import ABC, abstractmethod
-from typing import Tuple, Any
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from core.surface_cache import render_text
+
+
+class InputHandlers(NamedTuple):
+    """
+    Input callbacks of an exercise for the current question.
+
+    ``click(pos, target)`` is called for every click while the question is
+    open, with the target of the hit region under the mouse (None if no
+    region was hit). ``key(event)`` is called for KEYDOWN events. Both return
+    the guess, or None if the input was not a guess.
+    """
+    click: Optional[Callable[[tuple, Any], Any]] = None
+    key: Optional[Callable[[Any], Any]] = None
+
+
+def click_target(pos: tuple, target: Any) -> Any:
+    """Click handler for exercises whose region targets are the guesses themselves."""
+    return target
 
 
 class Exercise(ABC):
     """Abstract base class for all exercise types in the fractions learning app."""
 
+    # Attributes generate_question sets; together they are the state of one
+    # question. Exercises that list them can have questions generated ahead of
+    # time (see generate_questions). generate_question must assign new objects
+    # to them rather than modify the old ones in place.
+    QUESTION_STATE: Tuple[str, ...] = ()
+
     @abstractmethod
     def generate_question(self) -> Tuple[str, Any]:
         """
@@ -39,6 +66,178 @@ class Exercise(ABC):
         """
         pass
 
+    def question_count(self) -> int:
+        """
+        Return the number of distinct questions the exercise can ask.
+
+        Exercises that enumerate their questions return the size of the
+        universe and implement question_at. Default implementation returns 0
+        (questions are not enumerable).
+        """
+        return 0
+
+    def enumerates_questions(self) -> bool:
+        """
+        Check whether the exercise implements question_count and question_at.
+
+        Only such exercises can draw from a scheduler (use_scheduler) or ask a
+        question again by its text (find_question).
+        """
+        return type(self).question_at is not Exercise.question_at and self.question_count() > 0
+
+    def question_at(self, index: int) -> Tuple[str, Any]:
+        """
+        Make the question with the given index the current question.
+
+        Args:
+            index: Question index, 0 <= index < question_count()
+
+        Returns:
+            Tuple of (question_text, correct_answer)
+
+        Raises:
+            NotImplementedError: If the exercise does not enumerate its
+                questions (see enumerates_questions)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not enumerate its questions")
+
+    def find_question(self, question_text: str) -> Optional[int]:
+        """
+        Return the index of the question with the given text.
+
+        The index of every question text is built on first use, without
+        changing the current question.
+
+        Returns:
+            Question index for question_at, or None if the exercise cannot ask it
+        """
+        index = getattr(self, '_question_index', None)
+        if index is None:
+            if not self.enumerates_questions():
+                return None
+            current = self.save_question_state()
+            index = {self.question_at(i)[0]: i for i in range(self.question_count())}
+            self.load_question_state(current)
+            self._question_index = index
+        return index.get(question_text)
+
+    def use_scheduler(self, scheduler):
+        """
+        Draw question indices from a scheduler instead of uniformly at random.
+
+        Args:
+            scheduler: Object whose next() returns the next question index,
+                e.g. core.question_scheduler.PermutationScheduler
+
+        Raises:
+            ValueError: If the exercise does not enumerate its questions
+        """
+        if not self.enumerates_questions():
+            raise ValueError(f"{type(self).__name__} does not enumerate its questions")
+        self._scheduler = scheduler
+
+    def return_questions(self, question_texts: List[str]):
+        """
+        Hand questions that were generated but never asked back to the scheduler.
+
+        Prefetching draws questions from the scheduler ahead of time; without
+        this, questions still waiting in the pool when the game closes would
+        count as asked. Does nothing if no scheduler is set.
+
+        Args:
+            question_texts: Texts of the unasked questions, in the order they were generated
+        """
+        scheduler = getattr(self, '_scheduler', None)
+        if scheduler is None:
+            return
+        indices = [self.find_question(text) for text in question_texts]
+        scheduler.give_back([index for index in indices if index is not None])
+
+    def _next_question_index(self) -> int:
+        """Return the index of the next question: from the scheduler if one is set, else uniform."""
+        scheduler = getattr(self, '_scheduler', None)
+        if scheduler is not None:
+            return scheduler.next()
+        return random.randrange(self.question_count())
+
+    def save_question_state(self) -> Dict[str, Any]:
+        """Return the current question's state (the QUESTION_STATE attributes)."""
+        return {name: getattr(self, name) for name in self.QUESTION_STATE}
+
+    def load_question_state(self, state: Dict[str, Any]):
+        """Make a state returned by save_question_state the current question."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def generate_questions(self, n: int) -> List[Tuple[str, Any, Dict[str, Any]]]:
+        """
+        Generate questions ahead of time without changing the current question.
+
+        Args:
+            n: Number of questions
+
+        Returns:
+            List of (question_text, correct_answer, state); pass the state to
+            load_question_state when the question is asked
+        """
+        current = self.save_question_state()
+        questions = []
+        for _ in range(n):
+            question_text, correct_answer = self.generate_question()
+            questions.append((question_text, correct_answer, self.save_question_state()))
+        self.load_question_state(current)
+        return questions
+
+    def use_resources(self, resources):
+        """
+        Use a shared ResourceManager for fonts and layouts.
+
+        Called by GameManager. Exercises used on their own fall back to
+        ResourceManager.shared().
+
+        Args:
+            resources: core.resources.ResourceManager
+        """
+        self._resources = resources
+        self._layout = None
+
+    @property
+    def resources(self):
+        """The ResourceManager this exercise draws with."""
+        resources = getattr(self, '_resources', None)
+        if resources is None:
+            from core.resources import ResourceManager
+            resources = self._resources = ResourceManager.shared()
+        return resources
+
+    @property
+    def layout(self) -> Mapping[str, Any]:
+        """Precomputed layout rects, built once per exercise class (see build_layout)."""
+        layout = getattr(self, '_layout', None)
+        if layout is None:
+            layout = self._layout = self.resources.layout(type(self).__name__, self.build_layout)
+        return layout
+
+    def build_layout(self) -> Dict[str, Any]:
+        """
+        Compute the rects this exercise draws and hit-tests with.
+
+        Called once per exercise class; the result is shared and must not be
+        modified. Default implementation has no layout.
+
+        Returns:
+            Dictionary of name -> pygame.Rect or tuple of pygame.Rect
+        """
+        return {}
+
+    def warm_up(self):
+        """
+        Prepare caches before the first frame.
+
+        Called by GameManager at startup. Default implementation does nothing.
+        """
+        pass
+
     def render_question(self, screen, fonts: dict):
         """
         Render the question on the screen.
@@ -52,9 +251,45 @@ class Exercise(ABC):
         if hasattr(self, '_question_text'):
             font = fonts.get('main', fonts.get('font'))
             if font:
-                question_surf = font.render(self._question_text, True, (0, 0, 0))
+                question_surf = render_text(font, self._question_text, True, (0, 0, 0))
                 screen.blit(question_surf, (400 - question_surf.get_width()//2, 50))
 
+    def register_hit_regions(self, regions):
+        """
+        Register the clickable areas of the current question.
+
+        Called by GameManager after each generate_question. Regions added with
+        hover=True are redrawn when the mouse enters or leaves them. Default
+        implementation registers nothing.
+
+        Args:
+            regions: core.hit_regions.HitRegionIndex to add regions to
+        """
+        pass
+
+    def input_handlers(self) -> InputHandlers:
+        """
+        Return the input callbacks for the current question.
+
+        Called by GameManager once per question. The default adapts exercises
+        that only define the older handle_click, handle_input or
+        get_click_position methods.
+        """
+        handle_click = getattr(self, 'handle_click', None)
+        handle_input = getattr(self, 'handle_input', None)
+        click = None
+        if handle_click is not None:
+            click = lambda pos, target: handle_click(pos)
+        elif handle_input is not None:
+            import pygame
+            click = lambda pos, target: handle_input(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos))
+        elif hasattr(self, 'get_click_position'):
+            line_start_x = getattr(self, 'LINE_START_X', 100)
+            line_end_x = getattr(self, 'LINE_END_X', 700)
+            click = lambda pos, target: (self.get_click_position(pos[0])
+                                         if line_start_x <= pos[0] <= line_end_x else None)
+        return InputHandlers(click=click, key=handle_input)
+
     def render_feedback(self, screen, guess: Any, correct: Any, fonts: dict):
         """
         Render feedback after a guess is made.
@@ -76,5 +311,5 @@ class Exercise(ABC):
 
             for i, line in enumerate(feedback_lines):
                 color = (0, 255, 0) if str(guess) == str(correct) else (0, 0, 0)
-                text_surf = small_font.render(line, True, color)
+                text_surf = render_text(small_font, line, True, color)
                 screen.blit(text_surf, (50, 350 + i * 25))
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""
+Weighted catalog of exercise variants.
+
+A catalog file lists the exercises on offer, each with constructor params and
+a weight, e.g. in JSON::
+
+    {"exercises": [
+        {"id": "times_5", "type": "multiplication_choice", "params": {"max_number": 5}, "weight": 2},
+        {"id": "number_line", "type": "number_line"}
+    ]}
+
+or the same keys as ``[[exercises]]`` tables in TOML (read with tomllib, so on
+Python 3.11+). ``weight`` defaults to 1; entries with weight 0 or
+``"enabled": false`` are kept in the file but never asked. ``id`` defaults to
+the type plus params and is recorded with every logged attempt, so it should
+stay stable once attempts have been logged.
+
+The weights compile to an alias table (Vose's method): picking the next
+exercise takes one random index and one random number, however many variants
+the catalog has. reload_if_changed() re-reads a modified file while the game
+runs.
+"""
+
+import json
+import math
+import os
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from core.exercise import Exercise
+
+
+class AliasTable:
+    """O(1) sampling of indices with given weights (Vose's alias method)."""
+
+    def __init__(self, weights: List[float]):
+        """
+        Build the table in O(n).
+
+        Raises:
+            ValueError: If no weight is positive
+        """
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("At least one weight must be positive")
+
+        # Each column holds its own index with probability prob[i], else alias[i]
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1.0 up to rounding error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, rng=random) -> int:
+        """Draw an index; index i has probability weights[i] / sum(weights)."""
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class CatalogEntry(NamedTuple):
+    """One exercise variant of a catalog."""
+    id: str
+    type: str
+    params: Dict[str, Any]
+    weight: float
+
+
+def _default_id(exercise_type: str, params: Dict[str, Any]) -> str:
+    if not params:
+        return exercise_type
+    return f"{exercise_type}[{','.join(f'{key}={params[key]}' for key in sorted(params))}]"
+
+
+def load_catalog_entries(path) -> List[CatalogEntry]:
+    """
+    Read and check the enabled entries of a catalog file.
+
+    Args:
+        path: ``.toml`` file, or JSON otherwise
+
+    Raises:
+        ValueError: If the file cannot be parsed or an entry is invalid
+    """
+    path = Path(path)
+    try:
+        if path.suffix == ".toml":
+            try:
+                import tomllib
+            except ImportError:
+                raise ValueError("TOML catalogs need Python 3.11 or newer; use a JSON catalog")
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Cannot read exercise catalog {path}: {e}") from e
+
+    from exercises.registry import EXERCISE_TYPES
+
+    entries = []
+    seen = set()
+    for raw in data.get("exercises", []) if isinstance(data, dict) else []:
+        exercise_type = raw.get("type")
+        if exercise_type not in EXERCISE_TYPES:
+            raise ValueError(f"Unknown exercise type in catalog: {exercise_type}")
+        params = dict(raw.get("params", {}))
+        entry_id = str(raw.get("id") or _default_id(exercise_type, params))
+        if entry_id in seen:
+            raise ValueError(f"Duplicate catalog entry id: {entry_id}")
+        if "\n" in entry_id or ", " in entry_id:
+            raise ValueError(f"Catalog entry ids must be one line without \", \": {entry_id!r}")
+        seen.add(entry_id)
+        weight = float(raw.get("weight", 1.0))
+        if not math.isfinite(weight) or weight < 0:
+            raise ValueError(f"Invalid weight {weight} for catalog entry {entry_id}")
+        if weight > 0 and raw.get("enabled", True):
+            entries.append(CatalogEntry(entry_id, exercise_type, params, weight))
+    if not entries:
+        raise ValueError(f"Exercise catalog {path} has no enabled entries")
+    return entries
+
+
+class ExerciseCatalog:
+    """The exercises of a catalog file, picked by weight and reloaded when the file changes."""
+
+    def __init__(self, path, check_interval: float = 1.0):
+        """
+        Load the catalog and create its exercises.
+
+        Args:
+            path: Catalog file (JSON, or TOML by extension)
+            check_interval: Least seconds between file checks in reload_if_changed
+
+        Raises:
+            ValueError: If the file is invalid or none of its exercises is available
+        """
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self.entries: List[CatalogEntry] = []
+        self.exercises: List[Exercise] = []
+        self._entry_ids: Dict[int, str] = {}
+        self._table: Optional[AliasTable] = None
+        self._signature = None
+        self._last_check = time.monotonic()
+        self.reloads = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def sample(self, rng=random) -> Exercise:
+        """Pick an exercise with probability proportional to its entry's weight."""
+        return self.exercises[self._table.sample(rng)]
+
+    def entry_id(self, exercise: Exercise) -> Optional[str]:
+        """Return the id of the entry an exercise was created for, or None if it is not in the catalog."""
+        return self._entry_ids.get(id(exercise))
+
+    def _file_signature(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self):
+        """Read the file and rebuild exercises and alias table, reusing the exercises of unchanged entries."""
+        signature = self._file_signature()
+        entries = load_catalog_entries(self.path)
+
+        from exercises.registry import create_exercise
+
+        previous = {(entry.id, entry.type, json.dumps(entry.params, sort_keys=True)): exercise
+                    for entry, exercise in zip(self.entries, self.exercises)}
+        kept_entries, exercises = [], []
+        for entry in entries:
+            exercise = previous.get((entry.id, entry.type, json.dumps(entry.params, sort_keys=True)))
+            if exercise is None:
+                exercise = create_exercise({"type": entry.type, "params": entry.params})
+            if exercise is not None:
+                kept_entries.append(entry)
+                exercises.append(exercise)
+        if not exercises:
+            raise ValueError(f"None of the exercises in {self.path} is available")
+
+        self._table = AliasTable([entry.weight for entry in kept_entries])
+        self.entries = kept_entries
+        self.exercises = exercises
+        self._entry_ids = {id(exercise): entry.id for entry, exercise in zip(kept_entries, exercises)}
+        self._signature = signature
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the catalog if its file was modified since it was last read.
+
+        The file is checked at most every check_interval seconds. If the new
+        file is invalid, the current catalog stays in use.
+
+        Returns:
+            True if the catalog was reloaded
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+        try:
+            if self._file_signature() == self._signature:
+                return False
+            self._load()
+        except (OSError, ValueError) as e:
+            print(f"Keeping the current exercise catalog: {e}")
+            # Do not report the same broken file again until it changes
+            try:
+                self._signature = self._file_signature()
+            except OSError:
+                pass
+            return False
+        self.reloads += 1
+        print(f"Reloaded exercise catalog {self.path}: {len(self.entries)} entries")
+        return True
@@ -1,17 +1,31 @@
 import datetime
 import random
-from typing import List, Any, Optional
+from typing import Any, Callable, Dict, List, Optional
 import pygame
 
-from core.exercise import Exercise
+from core.exercise import Exercise, InputHandlers
+from core.exercise_catalog import ExerciseCatalog
+from core.hit_regions import HitRegionIndex
 from core.progress_logger import ProgressLogger
+from core.question_pool import QuestionPool
+from core.question_scheduler import SchedulerStore
+from core.review_scheduler import ReviewScheduler
+from core.resources import ResourceManager
+from core.surface_cache import render_text
 
 
 class GameManager:
     """Main coordinator for the fractions learning game."""
 
     def __init__(self, exercises: List[Exercise], screen: pygame.Surface,
-                 fonts: dict):
+                 fonts: dict, logger: Optional[ProgressLogger] = None,
+                 resources: Optional[ResourceManager] = None,
+                 clock: Callable[[], datetime.datetime] = datetime.datetime.now,
+                 question_pool_size: int = 4,
+                 scheduler_store: Optional[SchedulerStore] = None,
+                 review_scheduler: Optional[ReviewScheduler] = None,
+                 catalog: Optional[ExerciseCatalog] = None,
+                 review_interval: int = 3):
         """
         Initialize the game manager.
 
@@ -19,13 +33,46 @@ class GameManager:
             exercises: List of available exercises
             screen: Pygame screen surface
             fonts: Dictionary of fonts
+            logger: Progress logger to record attempts with (defaults to a
+                synchronous ProgressLogger)
+            resources: Fonts, layouts and palettes shared with the exercises
+                (defaults to a ResourceManager around fonts)
+            clock: Returns the current time; thinking time is measured with it
+            question_pool_size: Questions prefetched per exercise (0 to
+                generate every question when it is asked)
+            scheduler_store: Saved question orders; exercises that enumerate
+                their questions then ask each one once per pass instead of
+                drawing them independently
+            review_scheduler: Spaced repetition of answered questions; a
+                question whose review is due is asked instead of a new one
+                when review_interval allows
+            catalog: Catalog the exercises come from (catalog.exercises);
+                exercises are then picked by their entry's weight, each
+                attempt is logged with its entry id, and reload_catalog picks
+                up changes to the catalog file
+            review_interval: Ask a due review at most every review_interval-th
+                question, so reviews are interleaved with new questions picked
+                by weight and scheduler (1 asks every due review first)
         """
-        self.exercises = exercises
+        self.exercises: List[Exercise] = []
         self.screen = screen
         self.fonts = fonts
+        self.clock = clock
+        self.resources = resources if resources is not None else ResourceManager(fonts=fonts)
+        self.colors = self.resources.palette('ui')
+        self.scheduler_store = scheduler_store
+        self.review_scheduler = review_scheduler
+        self.review_interval = max(1, review_interval)
+        # New questions asked since the last review; the first question may be one
+        self._new_since_review = self.review_interval - 1
+        self.catalog = catalog
+        self.question_pool = QuestionPool([], question_pool_size)
+        self._set_exercises(exercises)
+        self.question_pool.refill()
 
         # Game state
         self.current_exercise: Optional[Exercise] = None
+        self.current_entry: Optional[str] = None
         self.question_text = ""
         self.correct_answer: Any = None
         self.guess_made = False
@@ -34,7 +81,7 @@ class GameManager:
         self.accuracy: float = 0.0
 
         # Dependencies
-        self.logger = ProgressLogger()
+        self.logger = logger if logger is not None else ProgressLogger()
 
         # UI constants
         self.BUTTON_WIDTH = 150
@@ -42,14 +89,174 @@ class GameManager:
         self.BUTTON_X = 600  # WIDTH - 200, assuming WIDTH=800
         self.BUTTON_Y = 320  # HEIGHT - 80, assuming HEIGHT=400
 
+        # Redraw tracking for render_dirty: either the whole screen or a list
+        # of areas has to be redrawn
+        self._full_redraw = True
+        self._dirty_rects: List[pygame.Rect] = []
+        self._hover_rect: Optional[pygame.Rect] = None
+
+        # Input dispatch for the current question, set up in next_question
+        self._regions = HitRegionIndex(screen.get_rect())
+        self._input = InputHandlers()
+
+    @classmethod
+    def from_config(cls, config: List[Dict[str, Any]], screen: pygame.Surface,
+                    fonts: dict, logger: Optional[ProgressLogger] = None,
+                    resources: Optional[ResourceManager] = None,
+                    scheduler_store: Optional[SchedulerStore] = None,
+                    review_scheduler: Optional[ReviewScheduler] = None) -> "GameManager":
+        """
+        Create a game manager with the exercises listed in a config.
+
+        Only the enabled exercise types are imported. Exercises whose module is
+        missing are left out (see exercises.registry.create_exercises).
+
+        Args:
+            config: Exercise entries, e.g. [{"type": "number_line"}]
+            screen: Pygame screen surface
+            fonts: Dictionary of fonts
+            logger: Progress logger to record attempts with
+            resources: Fonts, layouts and palettes shared with the exercises
+            scheduler_store: Saved question orders (see __init__)
+            review_scheduler: Spaced repetition of answered questions (see __init__)
+
+        Raises:
+            ValueError: If none of the configured exercises is available
+        """
+        from exercises.registry import create_exercises
+
+        exercises = create_exercises(config)
+        if not exercises:
+            raise ValueError("None of the configured exercises is available")
+        return cls(exercises, screen, fonts, logger=logger, resources=resources,
+                   scheduler_store=scheduler_store, review_scheduler=review_scheduler)
+
+    @classmethod
+    def from_catalog(cls, catalog: ExerciseCatalog, screen: pygame.Surface,
+                     fonts: dict, logger: Optional[ProgressLogger] = None,
+                     resources: Optional[ResourceManager] = None,
+                     scheduler_store: Optional[SchedulerStore] = None,
+                     review_scheduler: Optional[ReviewScheduler] = None) -> "GameManager":
+        """
+        Create a game manager that picks exercises from a weighted catalog.
+
+        Args:
+            catalog: Loaded exercise catalog
+            screen, fonts, logger, resources, scheduler_store, review_scheduler:
+                See __init__
+        """
+        return cls(catalog.exercises, screen, fonts, logger=logger, resources=resources,
+                   scheduler_store=scheduler_store, review_scheduler=review_scheduler,
+                   catalog=catalog)
+
+    def _set_exercises(self, exercises: List[Exercise]):
+        """Offer a new list of exercises, preparing the ones not offered before."""
+        known = {id(exercise) for exercise in self.exercises}
+        for exercise in exercises:
+            if id(exercise) in known:
+                continue
+            exercise.use_resources(self.resources)
+            exercise.warm_up()
+            if self.scheduler_store is not None and exercise.enumerates_questions():
+                exercise.use_scheduler(self.scheduler_store.scheduler_for(exercise))
+        offered = {id(exercise) for exercise in exercises}
+        self._return_prefetched([exercise for exercise in self.exercises if id(exercise) not in offered])
+        self.exercises = exercises
+        self.question_pool.set_exercises(exercises)
+        self._exercises_by_type: Dict[str, List[Exercise]] = {}
+        for exercise in exercises:
+            self._exercises_by_type.setdefault(exercise.get_type(), []).append(exercise)
+
+    def _return_prefetched(self, exercises: Optional[List[Exercise]] = None):
+        """Give the prefetched questions of exercises (None for all) back to their schedulers."""
+        for exercise, questions in self.question_pool.drain(exercises):
+            exercise.return_questions([question[0] for question in questions])
+
+    def reload_catalog(self) -> bool:
+        """
+        Pick up changes to the catalog file, if there is a catalog.
+
+        Call this between events; the current question stays on screen.
+
+        Returns:
+            True if the catalog was reloaded
+        """
+        if self.catalog is None or not self.catalog.reload_if_changed():
+            return False
+        self._set_exercises(self.catalog.exercises)
+        return True
+
     def next_question(self):
-        """Generate the next random question."""
-        self.current_exercise = random.choice(self.exercises)
-        self.question_text, self.correct_answer = self.current_exercise.generate_question()
+        """
+        Ask the next question.
+
+        That is the most overdue review question if one is due and
+        review_interval allows, or else a new question of a randomly picked
+        exercise.
+        """
+        if self._new_since_review >= self.review_interval - 1 and self._ask_due_review():
+            self._new_since_review = 0
+        else:
+            self._new_since_review += 1
+            if self.catalog is not None:
+                self.current_exercise = self.catalog.sample()
+            else:
+                self.current_exercise = random.choice(self.exercises)
+            question = self.question_pool.take(self.current_exercise)
+            if question is not None:
+                self.question_text, self.correct_answer, state = question
+                self.current_exercise.load_question_state(state)
+            else:
+                self.question_text, self.correct_answer = self.current_exercise.generate_question()
+        if self.catalog is not None:
+            self.current_entry = self.catalog.entry_id(self.current_exercise)
         self.guess_made = False
         self.guess = None
         self.accuracy = 0.0
-        self.start_time = datetime.datetime.now()
+        self.start_time = self.clock()
+        self._regions.clear()
+        self.current_exercise.register_hit_regions(self._regions)
+        self._input = self.current_exercise.input_handlers()
+        self._hover_rect = None
+        self.mark_dirty()
+
+    def _ask_due_review(self) -> bool:
+        """
+        Make the most overdue review question the current question.
+
+        Returns:
+            True if a due question was found that one of the exercises can ask
+        """
+        if self.review_scheduler is None:
+            return False
+        now = self.clock()
+        while True:
+            item = self.review_scheduler.peek_due(now)
+            if item is None:
+                return False
+            for exercise in self._exercises_by_type.get(item.exercise_type, ()):
+                index = exercise.find_question(item.question)
+                if index is not None:
+                    self.current_exercise = exercise
+                    self.question_text, self.correct_answer = exercise.question_at(index)
+                    return True
+            # Logged by an exercise that is not enabled, or by an older version
+            self.review_scheduler.defer(item)
+
+    def refill_questions(self, max_questions: Optional[int] = None) -> int:
+        """
+        Prefetch questions for the question pool.
+
+        Call this when no events are waiting, so generating questions never
+        delays the reaction to an input.
+
+        Args:
+            max_questions: Most questions to generate in this call
+
+        Returns:
+            Number of questions generated
+        """
+        return self.question_pool.refill(max_questions)
 
     def make_guess(self, guess: Any) -> Optional[float]:
         """
@@ -64,7 +271,8 @@ class GameManager:
         if self.guess_made or self.current_exercise is None:
             return None
 
-        thinking_time = (datetime.datetime.now() - self.start_time).total_seconds()
+        now = self.clock()
+        thinking_time = (now - self.start_time).total_seconds()
         is_correct, self.accuracy = self.current_exercise.validate_guess(guess)
 
         # For advanced exercises, invalid guesses (like selecting "equal" when fractions are different)
@@ -80,17 +288,80 @@ class GameManager:
             correct=self.correct_answer,
             guess=guess,
             thinking_time=thinking_time,
-            accuracy=self.accuracy
+            accuracy=self.accuracy,
+            catalog_entry=self.current_entry
         )
+        if self.review_scheduler is not None:
+            self.review_scheduler.record(self.current_exercise.get_type(), self.question_text,
+                                         self.accuracy, now)
 
         self.guess_made = True
         self.guess = guess
+        self.mark_dirty()
         return self.accuracy
 
+    def shutdown(self):
+        """Flush pending log entries and save question orders. Call this when the game is closing."""
+        self.logger.close()
+        if self.scheduler_store is not None:
+            # Prefetched questions were never asked; they come first next session
+            self._return_prefetched()
+            self.scheduler_store.save()
+        # After the logger is closed, so the snapshot covers every logged attempt
+        if self.review_scheduler is not None:
+            self.review_scheduler.save()
+
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None):
+        """
+        Schedule a redraw for the next render_dirty call.
+
+        Args:
+            rect: Area that changed, or None to redraw the whole screen
+        """
+        if rect is None:
+            self._full_redraw = True
+            self._dirty_rects = []
+        elif not self._full_redraw:
+            # Layout rects are shared and never modified, so they are not copied
+            self._dirty_rects.append(rect if isinstance(rect, pygame.Rect) else pygame.Rect(rect))
+
+    @property
+    def needs_redraw(self) -> bool:
+        """True if something changed since the last render_dirty call."""
+        return self._full_redraw or bool(self._dirty_rects)
+
+    def render_dirty(self) -> List[pygame.Rect]:
+        """
+        Redraw only what changed since the last call.
+
+        Partial redraws are clipped to the changed areas, so only those pixels
+        are repainted.
+
+        Returns:
+            The screen areas that were redrawn, to pass to
+            pygame.display.update; empty if nothing changed
+        """
+        if self._full_redraw:
+            self.render()
+            rects = [self.screen.get_rect()]
+        elif self._dirty_rects:
+            rects = self._dirty_rects
+            self.screen.set_clip(rects[0].unionall(rects[1:]))
+            try:
+                self.render()
+            finally:
+                self.screen.set_clip(None)
+        else:
+            return []
+
+        self._full_redraw = False
+        self._dirty_rects = []
+        return rects
+
     def render(self):
         """Render the current game state."""
         # Clear screen
-        self.screen.fill((255, 255, 255))
+        self.screen.fill(self.colors['background'])
 
         if self.current_exercise:
             # Render the exercise
@@ -116,12 +387,41 @@ class GameManager:
         Returns:
             True if the event was handled
         """
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if event.type == pygame.MOUSEMOTION:
+            return self._handle_mouse_motion(event.pos)
+        elif event.type == pygame.WINDOWLEAVE:
+            return self._handle_mouse_motion((-1, -1))
+        elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                            pygame.WINDOWSIZECHANGED, pygame.VIDEOEXPOSE):
+            self.mark_dirty()
+            return True
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            # Exercises may change their state even for clicks that are not guesses
+            self.mark_dirty()
             return self._handle_mouse_click(event.pos[0], event.pos[1])
         elif event.type == pygame.KEYDOWN:
+            self.mark_dirty()
             return self._handle_keydown(event)
         return False
 
+    def _handle_mouse_motion(self, pos: tuple) -> bool:
+        """
+        Track which hover area the mouse is over.
+
+        Returns:
+            True if the hovered area changed and has to be redrawn
+        """
+        region = self._regions.at(pos)
+        hover_rect = region.rect if region is not None and region.hover else None
+
+        if hover_rect == self._hover_rect:
+            return False
+        for rect in (self._hover_rect, hover_rect):
+            if rect is not None:
+                self.mark_dirty(rect)
+        self._hover_rect = hover_rect
+        return True
+
     def _handle_mouse_click(self, mouse_x: int, mouse_y: int) -> bool:
         """
         Handle mouse click events.
@@ -139,30 +439,13 @@ class GameManager:
                 self.next_question()
                 return True
 
-        # Check if click is in exercise area (delegate to current exercise if it has click handling)
-        if not self.guess_made and self.current_exercise:
-            # For exercises with custom click handling (like fraction comparison)
-            if hasattr(self.current_exercise, 'handle_click'):
-                guess = self.current_exercise.handle_click((mouse_x, mouse_y))
-                if guess is not None:
-                    self.make_guess(guess)
-                    return True
-            # For exercises with unified input handling (like advanced fraction comparison)
-            elif hasattr(self.current_exercise, 'handle_input'):
-                # Create a mouse event and pass it to the exercise
-                mouse_event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'pos': (mouse_x, mouse_y)})
-                guess = self.current_exercise.handle_input(mouse_event)
-                if guess is not None:
-                    self.make_guess(guess)
-                    return True
-            # For number line exercise
-            elif hasattr(self.current_exercise, 'get_click_position'):
-                line_start_x = getattr(self.current_exercise, 'LINE_START_X', 100)
-                line_end_x = getattr(self.current_exercise, 'LINE_END_X', 700)
-                if line_start_x <= mouse_x <= line_end_x:
-                    guess_value = self.current_exercise.get_click_position(mouse_x)
-                    self.make_guess(guess_value)
-                    return True
+        # Delegate clicks in the exercise area to the current exercise
+        if not self.guess_made and self._input.click is not None:
+            region = self._regions.at((mouse_x, mouse_y))
+            guess = self._input.click((mouse_x, mouse_y), region.target if region is not None else None)
+            if guess is not None:
+                self.make_guess(guess)
+                return True
 
         return False
 
@@ -183,22 +466,22 @@ class GameManager:
                 return True
         else:
             # Let current exercise handle keyboard input
-            if self.current_exercise and hasattr(self.current_exercise, 'handle_input'):
-                guess = self.current_exercise.handle_input(event)
+            if self._input.key is not None:
+                guess = self._input.key(event)
                 if guess is not None:
                     self.make_guess(guess)
                     return True
         return False
 
     def _draw_button(self, text: str, x: int, y: int, width: int, height: int,
-                    color: tuple = (200, 200, 200)):
+                    color: Optional[tuple] = None):
         """Draw a button on the screen."""
-        pygame.draw.rect(self.screen, color, (x, y, width, height))
-        pygame.draw.rect(self.screen, (0, 0, 0), (x, y, width, height), 2)
+        pygame.draw.rect(self.screen, color or self.colors['button'], (x, y, width, height))
+        pygame.draw.rect(self.screen, self.colors['button_border'], (x, y, width, height), 2)
 
         font = self.fonts.get('main', self.fonts.get('font'))
         if font:
-            text_surf = font.render(text, True, (0, 0, 0))
+            text_surf = render_text(font, text, True, self.colors['text'])
             text_x = x + (width - text_surf.get_width()) // 2
             text_y = y + (height - text_surf.get_height()) // 2
             self.screen.blit(text_surf, (text_x, text_y))
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Spatial index of the clickable areas of the current question.
+
+Exercises register their answer areas once per question (see
+Exercise.register_hit_regions). GameManager then finds the area under the mouse
+for clicks and hover tracking by looking up a single grid bucket, instead of
+asking the exercise to test all of its rects on every event.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+
+class HitRegion(NamedTuple):
+    """A clickable screen area and the value an exercise attached to it."""
+    rect: pygame.Rect
+    target: Any
+    hover: bool
+
+
+class HitRegionIndex:
+    """
+    Uniform grid of buckets over the screen, each listing the regions that overlap it.
+
+    A lookup only tests the regions of one bucket, so its cost does not grow
+    with the number of regions on screen. Regions are returned in the order
+    they were added when they overlap.
+    """
+
+    def __init__(self, bounds, cell_size: int = 128):
+        """
+        Initialize an empty index.
+
+        Args:
+            bounds: Screen rect; parts of regions outside it are never hit
+            cell_size: Bucket size in pixels
+        """
+        self.bounds = pygame.Rect(bounds)
+        self.cell_size = cell_size
+        self._buckets: Dict[Tuple[int, int], List[HitRegion]] = {}
+        self._regions: List[HitRegion] = []
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __iter__(self):
+        return iter(self._regions)
+
+    def clear(self):
+        """Remove all regions, e.g. when a new question starts."""
+        self._buckets.clear()
+        self._regions.clear()
+
+    def add(self, rect, target: Any = None, hover: bool = False):
+        """
+        Register a clickable region.
+
+        Args:
+            rect: Screen area of the region
+            target: Value passed back to the exercise when the region is clicked
+            hover: True if the exercise highlights the region while hovered
+        """
+        region = HitRegion(rect if isinstance(rect, pygame.Rect) else pygame.Rect(rect), target, hover)
+        self._regions.append(region)
+
+        visible = region.rect.clip(self.bounds)
+        if not visible:
+            return
+        size = self.cell_size
+        for cy in range(visible.top // size, (visible.bottom - 1) // size + 1):
+            for cx in range(visible.left // size, (visible.right - 1) // size + 1):
+                self._buckets.setdefault((cx, cy), []).append(region)
+
+    def at(self, pos: tuple) -> Optional[HitRegion]:
+        """Return the region containing a screen position, or None."""
+        bucket = self._buckets.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if bucket:
+            for region in bucket:
+                if region.rect.collidepoint(pos):
+                    return region
+        return None
@@ -0,0 +1,62 @@
+"""
+Off-screen layers for the static parts of an exercise.
+
+Things like the number line and the empty multiplication grid look the same
+for a whole question, yet used to be drawn shape by shape every frame. A
+StaticLayer paints them once into an off-screen Surface and then only blits
+that Surface. It is repainted when its key changes, e.g. when a new question
+starts. Dynamic overlays (hover, guess markers, feedback) are still drawn on
+top every frame.
+"""
+
+from typing import Callable, Hashable, Optional
+
+import pygame
+
+_UNSET = object()
+
+
+class StaticLayer:
+    """A cached, opaque rendering of one screen area."""
+
+    def __init__(self, rect: pygame.Rect, background: tuple = (255, 255, 255)):
+        """
+        Initialize the layer.
+
+        Args:
+            rect: Screen area the layer covers; everything painted into the
+                layer must fall inside it
+            background: Color the area is cleared to before painting; must be
+                the color the screen has underneath
+        """
+        self.rect = pygame.Rect(rect)
+        self.background = background
+        self.repaints = 0
+        self._surface: Optional[pygame.Surface] = None
+        self._key: Hashable = _UNSET
+
+    def draw(self, screen: pygame.Surface, key: Hashable,
+             paint: Callable[[pygame.Surface, tuple], None]):
+        """
+        Blit the layer onto the screen, repainting it first if key changed.
+
+        Args:
+            screen: Surface to blit onto
+            key: Everything the layer's content depends on
+            paint: Called as paint(surface, origin) to paint the layer. It
+                draws in screen coordinates minus origin (the top-left corner
+                of the layer)
+        """
+        if self._surface is None or key != self._key:
+            if self._surface is None:
+                # Same pixel format as the screen, so blits need no conversion
+                self._surface = pygame.Surface(self.rect.size, 0, screen)
+            self._surface.fill(self.background)
+            paint(self._surface, self.rect.topleft)
+            self._key = key
+            self.repaints += 1
+        screen.blit(self._surface, self.rect)
+
+    def invalidate(self):
+        """Force a repaint on the next draw."""
+        self._key = _UNSET
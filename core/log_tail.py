@@ -0,0 +1,58 @@
+"""
+Detecting whether a progress log was only appended to.
+
+The report checkpoint and the review snapshot both cover a log up to a byte
+offset and are only reused if the bytes before that offset are unchanged.
+Hashing the whole prefix would cost as much as reading it again, so only the
+bytes just before the offset are hashed: a log that was rewritten or
+truncated almost always differs there.
+
+The offset saved must be the end of a complete line or record. A last line
+without its newline may still be being written, and would be read again from
+the middle on the next run.
+"""
+
+import hashlib
+import io
+from pathlib import Path
+
+# Bytes just before a saved offset that must be unchanged for it to be reused
+TAIL_HASH_BYTES = 256
+
+
+def tail_hash(log_path: Path, offset: int) -> str:
+    """Hash the bytes just before offset, used to detect a rewritten log."""
+    start = max(0, offset - TAIL_HASH_BYTES)
+    with open(log_path, "rb") as f:
+        f.seek(start)
+        return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def last_line_end(log_path: Path, offset: int = 0) -> int:
+    """
+    Return the offset just past the last newline at or after offset.
+
+    A last line without its newline may still be being written, so it is left
+    for the next run.
+    """
+    block_size = 64 * 1024
+    with open(log_path, "rb") as f:
+        end = f.seek(0, io.SEEK_END)
+        while end > offset:
+            start = max(offset, end - block_size)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            end = start
+    return offset
+
+
+def complete_log_end(log_path: Path) -> int:
+    """Return the offset just past the last complete line (text log) or record (binary log)."""
+    from core.binary_log import HEADER, is_binary_log, record_size
+
+    if is_binary_log(log_path):
+        size = record_size(log_path)
+        return HEADER.size + (Path(log_path).stat().st_size - HEADER.size) // size * size
+    return last_line_end(log_path)
@@ -1,15 +1,64 @@
+import atexit
 import datetime
-from typing import Any
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+# Marks the optional ninth text log column, the catalog entry an attempt came
+# from. Questions may contain ", ", so the column is recognized by its prefix
+# rather than by counting fields.
+CATALOG_ENTRY_PREFIX = "catalog="
+
+
+def split_text_entry(line: str) -> Optional[List[str]]:
+    """
+    Split a text log line into its fields.
+
+    Returns:
+        [timestamp, exercise_type, thinking_time, distance, accuracy, question,
+        correct, guess, catalog_entry] as stripped strings, catalog_entry being
+        None for lines without one, or None if the line is malformed
+    """
+    parts = line.rstrip("\r\n").split(", ")
+    catalog_entry = None
+    if len(parts) > 8 and parts[-1].startswith(CATALOG_ENTRY_PREFIX):
+        catalog_entry = parts.pop()[len(CATALOG_ENTRY_PREFIX):].strip()
+    if len(parts) < 8:
+        return None
+    if len(parts) > 8:
+        # The question itself contains ", ": it is everything between the
+        # five leading and the two trailing fields
+        parts[5:-2] = [", ".join(parts[5:-2])]
+    return [part.strip() for part in parts] + [catalog_entry]
 
 
 class ProgressLogger:
     """Handles logging of user progress and attempts."""
 
-    def __init__(self, log_file: str = "progress_pygame.log"):
+    def __init__(self, log_file: str = "progress_pygame.log", log_format: str = "text",
+                 clock: Callable[[], datetime.datetime] = datetime.datetime.now):
+        """
+        Initialize the logger.
+
+        Args:
+            log_file: Path of the log file to append to
+            log_format: "text" for the comma-joined log, or "binary" for the
+                compact format in core.binary_log
+            clock: Returns the timestamp of each attempt
+        """
+        if log_format not in ("text", "binary"):
+            raise ValueError(f"Unknown log format: {log_format}")
         self.log_file = log_file
+        self.log_format = log_format
+        self.clock = clock
+        # Binary writers read the string dictionary when opened, so one is
+        # kept open for the logger's lifetime rather than one per attempt
+        self._binary_writer = None
 
     def log_attempt(self, exercise_type: str, question: str, correct: Any,
-                   guess: Any, thinking_time: float, accuracy: float):
+                   guess: Any, thinking_time: float, accuracy: float,
+                   catalog_entry: Optional[str] = None):
         """
         Log a single attempt at an exercise.
 
@@ -20,17 +69,252 @@ class ProgressLogger:
             guess: The user's guess
             thinking_time: Time taken to answer in seconds
             accuracy: Accuracy score (0.0 to 1.0)
+            catalog_entry: Id of the exercise catalog entry that asked the
+                question, if the exercises come from a catalog
+        """
+        log_entry = self._format_entry(exercise_type, question, correct, guess,
+                                       thinking_time, accuracy, catalog_entry)
+        self._write([log_entry])
+
+    def close(self):
+        """Flush any pending attempts and release resources."""
+        if self._binary_writer is not None:
+            self._binary_writer.close()
+            self._binary_writer = None
+
+    def stats(self) -> dict:
+        """Return logger statistics (empty for the synchronous logger)."""
+        return {}
+
+    def _format_entry(self, exercise_type: str, question: str, correct: Any,
+                      guess: Any, thinking_time: float, accuracy: float,
+                      catalog_entry: Optional[str] = None) -> Any:
+        """
+        Build one log entry, timestamped at the moment of the call.
+
+        Returns:
+            A text line for the text format, or a record tuple for the binary format
         """
-        timestamp = datetime.datetime.now().isoformat()
+        timestamp = self.clock()
         distance = abs(float(guess) - float(correct)) if guess is not None and correct is not None else 0.0
 
-        log_entry = (
-            f"{timestamp}, {exercise_type}, {thinking_time:.2f}, "
-            f"{distance:.3f}, {accuracy:.2f}, {question}, {correct}, {guess}\n"
+        if self.log_format == "binary":
+            return (timestamp, exercise_type, thinking_time, distance, accuracy,
+                    question, correct, guess, catalog_entry)
+
+        entry = (
+            f"{timestamp.isoformat()}, {exercise_type}, {thinking_time:.2f}, "
+            f"{distance:.3f}, {accuracy:.2f}, {question}, {correct}, {guess}"
         )
+        if catalog_entry is not None:
+            entry += f", {CATALOG_ENTRY_PREFIX}{catalog_entry}"
+        return entry + "\n"
+
+    def _open(self):
+        """Open the log file for appending."""
+        if self.log_format == "binary":
+            from core.binary_log import BinaryLogWriter
+            return BinaryLogWriter(self.log_file)
+        return open(self.log_file, 'a', encoding='utf-8')
+
+    def _append(self, log_handle, entries: List[Any]):
+        """Write entries through a handle returned by _open."""
+        if self.log_format == "binary":
+            log_handle.append(entries)
+        else:
+            log_handle.write("".join(entries))
+        log_handle.flush()
+
+    def _write(self, entries: List[Any]):
+        """
+        Append entries to the log file.
+
+        Text logs are opened and closed each time. Binary logs keep their
+        writer open until close(), and reopen it after an error.
+        """
+        if self.log_format == "binary":
+            try:
+                if self._binary_writer is None:
+                    self._binary_writer = self._open()
+                self._append(self._binary_writer, entries)
+            except Exception as e:
+                print(f"Error logging progress: {e}")
+                if self._binary_writer is not None:
+                    self._binary_writer.close()
+                    self._binary_writer = None
+            return
 
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            log_handle = self._open()
+            try:
+                self._append(log_handle, entries)
+            finally:
+                log_handle.close()
         except Exception as e:
-            print(f"Error logging progress: {e}")
\ No newline at end of file
+            print(f"Error logging progress: {e}")
+
+
+class BackgroundProgressLogger(ProgressLogger):
+    """
+    Progress logger that hands attempts to a background writer thread.
+
+    ``log_attempt`` only formats the entry and puts it on a bounded queue, so the
+    caller (the pygame event thread) never waits on disk. The writer thread keeps
+    the log file open and writes entries in batches, flushing when ``batch_size``
+    entries are pending or ``flush_interval`` seconds have passed since the first
+    pending entry. If the queue is full, ``log_attempt`` blocks until the writer
+    catches up rather than dropping attempts.
+    """
+
+    _STOP = object()
+
+    def __init__(self, log_file: str = "progress_pygame.log", log_format: str = "text",
+                 max_queue_size: int = 1000, batch_size: int = 50, flush_interval: float = 1.0,
+                 clock: Callable[[], datetime.datetime] = datetime.datetime.now):
+        """
+        Initialize the logger and start the writer thread.
+
+        Args:
+            log_file: Path of the log file to append to
+            log_format: "text" or "binary" (see ProgressLogger)
+            max_queue_size: Maximum number of entries waiting to be written
+            batch_size: Number of pending entries that triggers a flush
+            flush_interval: Maximum seconds an entry waits before being flushed
+            clock: Returns the timestamp of each attempt
+        """
+        super().__init__(log_file, log_format, clock)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_queue_size))
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._max_queue_depth = 0
+        self._records_written = 0
+        self._records_dropped = 0
+        self._batches_flushed = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="progress-logger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log_attempt(self, exercise_type: str, question: str, correct: Any,
+                   guess: Any, thinking_time: float, accuracy: float,
+                   catalog_entry: Optional[str] = None):
+        """Queue a single attempt for the writer thread (see ProgressLogger.log_attempt)."""
+        if self._closed:
+            # Late attempts after shutdown are still written, just synchronously
+            super().log_attempt(exercise_type, question, correct, guess, thinking_time, accuracy,
+                                catalog_entry)
+            return
+
+        log_entry = self._format_entry(exercise_type, question, correct, guess,
+                                       thinking_time, accuracy, catalog_entry)
+        self._queue.put(log_entry)
+
+        depth = self._queue.qsize()
+        if depth > self._max_queue_depth:
+            self._max_queue_depth = depth
+
+    def close(self):
+        """Drain the queue, flush everything to disk and stop the writer thread."""
+        if self._closed:
+            # Release the writer of attempts logged after shutdown
+            super().close()
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def stats(self) -> dict:
+        """
+        Return queue and flush statistics.
+
+        Returns:
+            Dictionary with current and maximum queue depth, number of records
+            written and batches flushed, number of records dropped because
+            they could not be written, and last/average/maximum flush latency
+            in milliseconds.
+        """
+        with self._stats_lock:
+            batches = self._batches_flushed
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_queue_depth': self._max_queue_depth,
+                'records_written': self._records_written,
+                'records_dropped': self._records_dropped,
+                'batches_flushed': batches,
+                'last_flush_ms': self._last_flush_ms,
+                'avg_flush_ms': self._total_flush_ms / batches if batches else 0.0,
+                'max_flush_ms': self._max_flush_ms,
+            }
+
+    def _run(self):
+        """Writer thread: collect entries into batches and flush them."""
+        log_handle = None
+        pending: List[Any] = []
+        deadline: Optional[float] = None
+        stopping = False
+
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                stopping = True
+            elif item is not None:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if pending and (stopping or len(pending) >= self.batch_size
+                            or time.monotonic() >= deadline):
+                log_handle = self._flush(log_handle, pending)
+                pending = []
+                deadline = None
+
+        if log_handle is not None:
+            log_handle.close()
+
+    def _flush(self, log_handle, entries: List[Any]):
+        """
+        Write a batch through the open file handle, reopening it if needed.
+
+        If the write fails, the file is reopened and the batch written once
+        more; a batch that fails twice is dropped and counted in stats().
+        """
+        start = time.perf_counter()
+        for attempt in range(2):
+            try:
+                if log_handle is None:
+                    log_handle = self._open()
+                self._append(log_handle, entries)
+                break
+            except Exception as e:
+                print(f"Error logging progress: {e}")
+                if log_handle is not None:
+                    try:
+                        log_handle.close()
+                    except Exception:
+                        pass
+                    log_handle = None
+        else:
+            print(f"Dropped {len(entries)} progress log entries")
+            with self._stats_lock:
+                self._records_dropped += len(entries)
+            return None
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._stats_lock:
+            self._records_written += len(entries)
+            self._batches_flushed += 1
+            self._last_flush_ms = elapsed_ms
+            self._total_flush_ms += elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+        return log_handle
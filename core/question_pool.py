@@ -0,0 +1,134 @@
+"""
+Prefetched questions per exercise.
+
+GameManager.next_question takes a question from the pool when one is ready,
+so moving on to the next question only restores a saved question state. The
+pool is refilled between events (see GameManager.refill_questions), where
+generating questions does not delay a reaction to the user.
+
+Questions are generated on the event thread, not in a worker thread:
+generate_question updates the exercise's state and draws from the global
+random module, neither of which is safe to share with the thread that
+renders the exercise.
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from core.exercise import Exercise
+
+# (question_text, correct_answer, state for Exercise.load_question_state)
+Question = Tuple[str, Any, Any]
+
+
+class QuestionPool:
+    """Small queues of pregenerated questions, one per exercise."""
+
+    def __init__(self, exercises: List[Exercise], size: int = 4):
+        """
+        Initialize empty queues.
+
+        Args:
+            exercises: Exercises to prefetch for; exercises that cannot save
+                their question state are skipped
+            size: Number of questions kept ready per exercise
+        """
+        self.size = max(0, size)
+        self._queues: Dict[int, Deque[Question]] = {
+            id(exercise): deque() for exercise in exercises if exercise.QUESTION_STATE}
+        self._exercises = [exercise for exercise in exercises if id(exercise) in self._queues]
+        self._hits = 0
+        self._misses = 0
+        self._refills = 0
+        self._generated = 0
+        self._last_refill_ms = 0.0
+        self._total_refill_ms = 0.0
+        self._max_refill_ms = 0.0
+
+    def set_exercises(self, exercises: List[Exercise]):
+        """Prefetch for a new list of exercises, keeping the questions of exercises still in it."""
+        self._queues = {id(exercise): self._queues.get(id(exercise), deque())
+                        for exercise in exercises if exercise.QUESTION_STATE}
+        self._exercises = [exercise for exercise in exercises if id(exercise) in self._queues]
+
+    def drain(self, exercises: Optional[List[Exercise]] = None) -> List[Tuple[Exercise, List[Question]]]:
+        """
+        Remove the prefetched questions of some exercises without asking them.
+
+        Args:
+            exercises: Exercises to empty the queues of (None for all)
+
+        Returns:
+            (exercise, questions) for every exercise that had questions ready
+        """
+        drained = []
+        for exercise in self._exercises if exercises is None else exercises:
+            queue = self._queues.get(id(exercise))
+            if queue:
+                drained.append((exercise, list(queue)))
+                queue.clear()
+        return drained
+
+    def take(self, exercise: Exercise) -> Optional[Question]:
+        """Return the next prefetched question of an exercise, or None if its queue is empty."""
+        queue = self._queues.get(id(exercise))
+        if queue:
+            self._hits += 1
+            return queue.popleft()
+        self._misses += 1
+        return None
+
+    def refill(self, max_questions: Optional[int] = None) -> int:
+        """
+        Top up the queues that are below their size.
+
+        Args:
+            max_questions: Most questions to generate in this call, to bound the
+                time it takes (None for no limit)
+
+        Returns:
+            Number of questions generated
+        """
+        budget = max_questions if max_questions is not None else len(self._exercises) * self.size
+        start = time.perf_counter()
+        generated = 0
+        for exercise in self._exercises:
+            queue = self._queues[id(exercise)]
+            missing = min(self.size - len(queue), budget - generated)
+            if missing > 0:
+                queue.extend(exercise.generate_questions(missing))
+                generated += missing
+            if generated >= budget:
+                break
+
+        if generated:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._refills += 1
+            self._generated += generated
+            self._last_refill_ms = elapsed_ms
+            self._total_refill_ms += elapsed_ms
+            self._max_refill_ms = max(self._max_refill_ms, elapsed_ms)
+        return generated
+
+    def stats(self) -> dict:
+        """
+        Return pool statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit rate, questions generated and
+            ready, number of refills and last/average/maximum refill time in
+            milliseconds
+        """
+        requests = self._hits + self._misses
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / requests if requests else 0.0,
+            'generated': self._generated,
+            'ready': sum(len(queue) for queue in self._queues.values()),
+            'refills': self._refills,
+            'last_refill_ms': self._last_refill_ms,
+            'avg_refill_ms': self._total_refill_ms / self._refills if self._refills else 0.0,
+            'max_refill_ms': self._max_refill_ms,
+        }
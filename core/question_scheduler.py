@@ -0,0 +1,221 @@
+"""
+No-repeat question order.
+
+A PermutationScheduler walks the question indices of an exercise (see
+Exercise.question_count) in a pseudo-random order that visits every question
+once before any question comes up again. The order is a keyed Feistel
+permutation, computed on the fly, so a scheduler costs the same memory for
+ten questions as for a million and never materializes a shuffled list. After
+each pass a new key gives a new order, and a cooldown window keeps the last
+few questions of one pass from reappearing at the start of the next.
+
+SchedulerStore keeps one scheduler per exercise and saves their positions to
+a JSON file, so a learner continues the same pass in the next session.
+"""
+
+import json
+import random
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Optional, Sequence
+
+STORE_VERSION = 1
+
+_MASK32 = 0xFFFFFFFF
+_ROUNDS = 4
+
+
+def _mix(value: int) -> int:
+    """32-bit integer hash (murmur3 finalizer)."""
+    value &= _MASK32
+    value ^= value >> 16
+    value = (value * 0x85EBCA6B) & _MASK32
+    value ^= value >> 13
+    value = (value * 0xC2B2AE35) & _MASK32
+    value ^= value >> 16
+    return value
+
+
+class PermutationScheduler:
+    """Serves the indices 0 to size - 1 in shuffled passes without repeats."""
+
+    def __init__(self, size: int, cooldown: int = 0, seed: Optional[int] = None):
+        """
+        Start a scheduler at the beginning of its first pass.
+
+        Args:
+            size: Number of questions
+            cooldown: Number of most recent questions that are never served
+                again, also across passes (capped at size - 1)
+            seed: Key of the permutations (random if not given)
+        """
+        if size < 1:
+            raise ValueError("A scheduler needs at least one question")
+        self.size = size
+        self.cooldown = max(0, min(cooldown, size - 1))
+        self.seed = random.getrandbits(32) if seed is None else seed & _MASK32
+        self.epoch = 0
+        self.position = 0
+        self._recent: Deque[int] = deque()
+        self._recent_set = set()
+        self._deferred: Deque[int] = deque()
+
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+        self._set_keys()
+
+    def _set_keys(self):
+        """Derive the round keys of the current pass."""
+        base = _mix(self.seed ^ _mix(self.epoch * 0x9E3779B9 + 1))
+        self._keys = [_mix(base + r * 0x632BE5AB) for r in range(_ROUNDS)]
+
+    def _feistel(self, value: int) -> int:
+        """Bijection on [0, 4 ** half_bits), the smallest even-bit domain holding size."""
+        bits, mask = self._half_bits, self._half_mask
+        left, right = value >> bits, value & mask
+        for key in self._keys:
+            left, right = right, left ^ (_mix(right ^ key) & mask)
+        return (left << bits) | right
+
+    def permute(self, position: int) -> int:
+        """
+        Return the index at a position of the current pass.
+
+        Cycle-walks values that fall outside [0, size), which keeps the result
+        a permutation of [0, size). The domain is less than four times size,
+        so this takes fewer than four steps on average.
+        """
+        value = self._feistel(position)
+        while value >= self.size:
+            value = self._feistel(value)
+        return value
+
+    def _draw(self) -> int:
+        """Return the next index of the permutation, starting a new pass when one ends."""
+        if self.position >= self.size:
+            self.epoch += 1
+            self.position = 0
+            self._set_keys()
+        index = self.permute(self.position)
+        self.position += 1
+        return index
+
+    def next(self) -> int:
+        """Return the next question index."""
+        if self._deferred and self._deferred[0] not in self._recent_set:
+            index = self._deferred.popleft()
+        else:
+            index = self._draw()
+            # Only possible right after a new pass started: hold the index
+            # back until it has left the cooldown window
+            while index in self._recent_set:
+                self._deferred.append(index)
+                index = self._draw()
+
+        if self.cooldown:
+            self._recent.append(index)
+            self._recent_set.add(index)
+            if len(self._recent) > self.cooldown:
+                self._recent_set.discard(self._recent.popleft())
+        return index
+
+    def give_back(self, indices: Sequence[int]):
+        """
+        Return indices that were served but never asked, e.g. prefetched questions.
+
+        They are served again, in the same order, before any new index, and
+        leave the cooldown window they entered when they were served.
+        """
+        returned = set(indices)
+        if not returned:
+            return
+        self._recent = deque(index for index in self._recent if index not in returned)
+        self._recent_set -= returned
+        self._deferred.extendleft(reversed(indices))
+
+    def state(self) -> dict:
+        """Return JSON-compatible state for from_state."""
+        return {
+            "size": self.size,
+            "cooldown": self.cooldown,
+            "seed": self.seed,
+            "epoch": self.epoch,
+            "position": self.position,
+            "recent": list(self._recent),
+            "deferred": list(self._deferred),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "PermutationScheduler":
+        """Restore a scheduler saved with state()."""
+        scheduler = cls(int(state["size"]), int(state["cooldown"]), int(state["seed"]))
+        scheduler.epoch = int(state["epoch"])
+        scheduler.position = int(state["position"])
+        scheduler._set_keys()
+        scheduler._recent.extend(int(i) for i in state.get("recent", []))
+        scheduler._recent_set.update(scheduler._recent)
+        scheduler._deferred.extend(int(i) for i in state.get("deferred", []))
+        return scheduler
+
+
+class SchedulerStore:
+    """One PermutationScheduler per exercise, saved to and loaded from a JSON file."""
+
+    def __init__(self, path=None, cooldown: int = 20):
+        """
+        Load the saved schedulers.
+
+        Args:
+            path: JSON file to load from and save to (None to keep schedulers in memory only)
+            cooldown: Cooldown window of new schedulers
+        """
+        self.path = Path(path) if path is not None else None
+        self.cooldown = cooldown
+        self._states: Dict[str, dict] = {}
+        self._schedulers: Dict[str, PermutationScheduler] = {}
+
+        if self.path is not None and self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    saved = json.load(f)
+                if saved.get("version") == STORE_VERSION:
+                    self._states = dict(saved.get("schedulers", {}))
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"Ignoring unreadable question scheduler state: {e}")
+
+    @staticmethod
+    def key(exercise) -> str:
+        """Key of an exercise's scheduler; exercises with the same type but different universes get their own."""
+        return f"{exercise.get_type()}:{exercise.question_count()}"
+
+    def scheduler_for(self, exercise) -> PermutationScheduler:
+        """Return the scheduler of an exercise, restoring its saved state if there is one."""
+        key = self.key(exercise)
+        scheduler = self._schedulers.get(key)
+        if scheduler is None:
+            size = exercise.question_count()
+            state = self._states.get(key)
+            scheduler = None
+            if state is not None and state.get("size") == size:
+                try:
+                    scheduler = PermutationScheduler.from_state(state)
+                except (KeyError, TypeError, ValueError) as e:
+                    print(f"Ignoring saved question order of {key}: {e}")
+            if scheduler is None:
+                scheduler = PermutationScheduler(size, self.cooldown)
+            self._schedulers[key] = scheduler
+        return scheduler
+
+    def save(self):
+        """Write the state of every scheduler to the store's file."""
+        if self.path is None:
+            return
+        states = dict(self._states)
+        states.update({key: scheduler.state() for key, scheduler in self._schedulers.items()})
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": STORE_VERSION, "schedulers": states}, f)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            print(f"Could not save question scheduler state: {e}")
@@ -0,0 +1,93 @@
+"""
+Enumerated sets of the questions an exercise can ask.
+
+Instead of drawing numerators and denominators until a valid combination
+comes up, an exercise enumerates every distinct value once per configuration
+and samples by drawing one index. Sampling always takes one random draw, and
+every distinct value (or pair of values) is equally likely.
+
+Values are stored as compact ``array`` columns, so even large universes cost
+a few bytes per entry.
+"""
+
+import random
+from array import array
+from fractions import Fraction
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+
+class FractionUniverse:
+    """
+    The distinct proper fractions with the given denominators, in ascending order.
+
+    Equal values are listed once (2/4 is 1/2), so sample() is uniform over the
+    distinct values rather than over numerator/denominator combinations.
+    """
+
+    def __init__(self, denominators: Iterable[int], max_value: Optional[float] = None):
+        """
+        Enumerate the fractions.
+
+        Args:
+            denominators: Allowed denominators
+            max_value: Largest allowed value; numerators are also kept below
+                their denominator, so values above 1 are never included
+        """
+        values = set()
+        for d in denominators:
+            max_numerator = d - 1 if max_value is None else min(d - 1, int(max_value * d))
+            values.update(Fraction(n, d) for n in range(1, max_numerator + 1))
+        ordered = sorted(values)
+        self.numerators = array('H', (f.numerator for f in ordered))
+        self.denominators = array('H', (f.denominator for f in ordered))
+
+    def __len__(self) -> int:
+        return len(self.numerators)
+
+    def fraction(self, index: int) -> Fraction:
+        """Return the fraction at an index."""
+        return Fraction(self.numerators[index], self.denominators[index])
+
+    def sample(self, rng=random) -> Fraction:
+        """Draw one fraction; each distinct value has probability 1/len(self)."""
+        return self.fraction(rng.randrange(len(self.numerators)))
+
+    def pair(self, index: int) -> Tuple[Fraction, Fraction]:
+        """
+        Return the ordered pair of different fractions at an index.
+
+        Pairs are numbered 0 to n * (n - 1) - 1 for n fractions, without
+        storing them: the first fraction is index // (n - 1), the second is
+        one of the other n - 1 fractions.
+        """
+        others = len(self.numerators) - 1
+        first, second = divmod(index, others)
+        if second >= first:
+            second += 1
+        return self.fraction(first), self.fraction(second)
+
+    def pair_count(self) -> int:
+        """Number of ordered pairs of different fractions."""
+        n = len(self.numerators)
+        return n * (n - 1)
+
+    def sample_pair(self, rng=random) -> Tuple[Fraction, Fraction]:
+        """
+        Draw an ordered pair of different fractions.
+
+        Each of the pair_count() pairs has the same probability.
+
+        Raises:
+            ValueError: If there are fewer than two fractions
+        """
+        count = self.pair_count()
+        if count == 0:
+            raise ValueError("At least two different fractions are needed for a pair")
+        return self.pair(rng.randrange(count))
+
+
+@lru_cache(maxsize=None)
+def fraction_universe(denominators: Tuple[int, ...], max_value: Optional[float] = None) -> FractionUniverse:
+    """Return the shared FractionUniverse of a configuration, building it on first use."""
+    return FractionUniverse(denominators, max_value)
@@ -0,0 +1,220 @@
+import json
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.log_tail import tail_hash
+
+# (pandas frequency, display name) for every timescale shown in the report
+TIMESCALES = [("D", "Daily"), ("W", "Weekly"), ("ME", "Monthly")]
+
+DAY_INDEX = ["day", "exercise_type"]
+DAY_COLUMNS = ["count", "correct", "time_sum", "accuracy_sum"]
+
+CHECKPOINT_FILE = "report_checkpoint.json"
+CHECKPOINT_VERSION = 2
+
+# 1970-01-01 was a Thursday; weeks end on Sunday like pandas' "W" frequency
+_EPOCH_WEEKDAY = 3
+
+
+def _epoch_days(timestamps) -> np.ndarray:
+    """Convert timestamps to integer days since 1970-01-01 (local wall-clock dates)."""
+    return np.asarray(timestamps, dtype="datetime64[ns]").astype("datetime64[D]").astype("int64")
+
+
+def _period_ends(days: np.ndarray, freq: str) -> np.ndarray:
+    """
+    Map epoch days to the epoch day that labels their period.
+
+    Args:
+        days: Integer days since 1970-01-01
+        freq: "D", "W" (weeks ending on Sunday) or "ME" (month end)
+    """
+    if freq == "D":
+        return days
+    if freq == "W":
+        return days + 6 - (days + _EPOCH_WEEKDAY) % 7
+    if freq == "ME":
+        months = days.astype("datetime64[D]").astype("datetime64[M]")
+        return (months + 1).astype("datetime64[D]").astype("int64") - 1
+    raise ValueError(f"Unsupported timescale: {freq}")
+
+
+class ReportAggregates:
+    """
+    Mergeable partial aggregates of a progress log.
+
+    Holds everything generate_report needs, so a report can be rendered without
+    the raw rows:
+
+    * ``daily``: a cube of count, correct sum, thinking-time sum and accuracy
+      sum per (day, exercise_type), where day is an integer number of days
+      since 1970-01-01. Weekly and monthly views are rolled up from it.
+    * ``incorrect_questions``: number of incorrect attempts per question.
+
+    All values are sums. Aggregates of two disjoint parts of a log can be merged
+    by adding them, in any order.
+    """
+
+    def __init__(self, daily: Optional[pd.DataFrame] = None,
+                 incorrect_questions: Optional[pd.Series] = None):
+        if daily is None:
+            daily = pd.DataFrame(
+                {col: pd.Series(dtype="int64" if col in ("count", "correct") else "float64")
+                 for col in DAY_COLUMNS},
+                index=pd.MultiIndex.from_arrays(
+                    [np.array([], dtype="int64"), np.array([], dtype=object)], names=DAY_INDEX),
+            )
+        if incorrect_questions is None:
+            incorrect_questions = pd.Series(dtype="int64", name="count")
+            incorrect_questions.index.name = "question"
+        self.daily = daily
+        self.incorrect_questions = incorrect_questions
+        self._rollups: Dict[str, pd.DataFrame] = {}
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "ReportAggregates":
+        """
+        Aggregate cleaned log rows in a single pass.
+
+        Args:
+            data: Frame with timestamp, exercise_type, thinking_time, accuracy,
+                question and is_correct columns
+        """
+        if data.empty:
+            return cls()
+
+        days = pd.Series(_epoch_days(data["timestamp"]), index=data.index, name="day")
+        grouped = data.groupby([days, "exercise_type"], observed=True, sort=True)
+        daily = grouped.agg(
+            count=("is_correct", "size"),
+            correct=("is_correct", "sum"),
+            time_sum=("thinking_time", "sum"),
+            accuracy_sum=("accuracy", "sum"),
+        )
+        # Categorical exercise types (binary logs) would not merge with plain strings
+        daily.index = pd.MultiIndex.from_arrays(
+            [daily.index.get_level_values(0).astype("int64"),
+             daily.index.get_level_values(1).astype(object)],
+            names=DAY_INDEX,
+        )
+        daily = daily.astype({"count": "int64", "correct": "int64"})
+
+        incorrect = data.loc[~data["is_correct"], "question"].value_counts()
+        incorrect.index = incorrect.index.astype(object)
+        incorrect.index.name = "question"
+        return cls(daily, incorrect.rename("count"))
+
+    def merge(self, other: "ReportAggregates") -> "ReportAggregates":
+        """Return the aggregates of both parts combined."""
+        if other.daily.empty and other.incorrect_questions.empty:
+            return self
+        if self.daily.empty and self.incorrect_questions.empty:
+            return other
+
+        daily = pd.concat([self.daily, other.daily]).groupby(level=DAY_INDEX).sum()
+        incorrect = pd.concat([self.incorrect_questions, other.incorrect_questions])
+        incorrect = incorrect.groupby(level=0).sum()
+        incorrect.index.name = "question"
+        return ReportAggregates(daily, incorrect.rename("count"))
+
+    def timescale(self, freq: str) -> pd.DataFrame:
+        """
+        Return the per (period, exercise_type) rows of one timescale.
+
+        Periods are labelled like pandas' resampling: the day itself for "D",
+        the Sunday ending the week for "W" and the last day of the month for
+        "ME". Rollups are computed from the daily cube once and cached.
+        """
+        rollup = self._rollups.get(freq)
+        if rollup is not None:
+            return rollup
+
+        days = self.daily.index.get_level_values("day").to_numpy(dtype="int64")
+        periods = pd.DatetimeIndex(_period_ends(days, freq).astype("datetime64[D]")
+                                   .astype("datetime64[ns]"), name="period")
+        exercise_types = self.daily.index.get_level_values("exercise_type")
+        rollup = self.daily.set_axis(pd.MultiIndex.from_arrays(
+            [periods, exercise_types], names=["period", "exercise_type"]))
+        if freq != "D":
+            rollup = rollup.groupby(level=["period", "exercise_type"]).sum()
+        self._rollups[freq] = rollup
+        return rollup
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-compatible data."""
+        daily = self.daily
+        rows = [
+            [int(day), exercise_type, int(count), int(correct), float(time_sum), float(accuracy_sum)]
+            for (day, exercise_type), count, correct, time_sum, accuracy_sum in zip(
+                daily.index, daily["count"], daily["correct"], daily["time_sum"], daily["accuracy_sum"])
+        ]
+        return {
+            "daily": rows,
+            "incorrect_questions": {str(q): int(c) for q, c in self.incorrect_questions.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "ReportAggregates":
+        """Rebuild aggregates serialized with to_dict."""
+        rows = payload.get("daily", [])
+        if not rows and not payload.get("incorrect_questions"):
+            return cls()
+
+        frame = pd.DataFrame(rows, columns=DAY_INDEX + DAY_COLUMNS)
+        daily = frame.astype({
+            "day": "int64", "exercise_type": object, "count": "int64", "correct": "int64",
+            "time_sum": "float64", "accuracy_sum": "float64",
+        }).set_index(DAY_INDEX)
+        incorrect = pd.Series(payload.get("incorrect_questions", {}), dtype="int64", name="count")
+        incorrect.index.name = "question"
+        return cls(daily, incorrect)
+
+
+def load_checkpoint(output_path: Path, log_path: Path) -> Optional[Tuple[ReportAggregates, int]]:
+    """
+    Load the report checkpoint for a log, if it is still valid.
+
+    A checkpoint is only reused when it was written for the same log file, the
+    log is at least as long as the checkpointed offset, and the bytes before
+    that offset are unchanged (the log has only been appended to).
+
+    Returns:
+        (aggregates, offset) or None when the log has to be read from the start
+    """
+    checkpoint_path = output_path / CHECKPOINT_FILE
+    if not checkpoint_path.exists():
+        return None
+
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        offset = int(checkpoint["offset"])
+        if (checkpoint.get("version") != CHECKPOINT_VERSION
+                or checkpoint.get("log_file") != str(log_path.resolve())
+                or log_path.stat().st_size < offset
+                or checkpoint.get("tail_hash") != tail_hash(log_path, offset)):
+            return None
+        return ReportAggregates.from_dict(checkpoint["aggregates"]), offset
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Ignoring unreadable report checkpoint: {e}")
+        return None
+
+
+def save_checkpoint(output_path: Path, log_path: Path, aggregates: ReportAggregates, offset: int):
+    """Persist aggregates covering the first offset bytes of the log."""
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "log_file": str(log_path.resolve()),
+        "offset": offset,
+        "tail_hash": tail_hash(log_path, offset),
+        "aggregates": aggregates.to_dict(),
+    }
+    checkpoint_path = output_path / CHECKPOINT_FILE
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    tmp_path.replace(checkpoint_path)
@@ -1,76 +1,460 @@
+import glob
+import hashlib
+import html
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-import matplotlib.pyplot as plt
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 import numpy as np
 
-def generate_report(log_file: str, output_dir: str):
+from core.binary_log import HEADER, BinaryLogReader, is_binary_log, record_size
+from core.log_tail import last_line_end
+from core.progress_logger import split_text_entry
+from core.report_aggregates import TIMESCALES, ReportAggregates, load_checkpoint, save_checkpoint
+from core.svg_charts import render_bar_line_chart
+
+LOG_COLUMNS = [
+    "timestamp",
+    "exercise_type",
+    "thinking_time",
+    "distance",
+    "accuracy",
+    "question",
+    "correct",
+    "guess",
+    "catalog_entry",  # Optional; only in attempts asked from an exercise catalog
+]
+
+# Columns the report uses; correct and guess are never parsed
+REPORT_COLUMNS = LOG_COLUMNS[:6]
+
+# Below this many bytes per worker, process start-up costs more than it saves
+MIN_PARALLEL_RANGE = 1024 * 1024
+
+# Content hashes of the chart inputs from the last run, stored next to the report
+CHART_CACHE_FILE = "chart_cache.json"
+# Bump when the chart drawing code changes so cached charts are redrawn
+CHART_STYLE_VERSION = 1
+
+
+def generate_report(log_file: str, output_dir: str, incremental: bool = True,
+                    chunk_size: Optional[int] = None, workers: int = 1,
+                    chart_workers: Optional[int] = None, chart_format: str = "png"):
     """
     Generates a report from the progress log file.
 
+    Aggregates are checkpointed next to the report together with the byte
+    offset of the log they cover. When the log has only been appended to since
+    the last run, only the new lines are parsed and merged in.
+
     Args:
         log_file (str): The path to the log file.
         output_dir (str): The directory to save the report to.
+        incremental (bool): Reuse the checkpoint from a previous run if it is
+            still valid. Pass False to re-read the whole log.
+        chunk_size (int): Stream the log in chunks of this many rows, folding
+            each chunk into the aggregates, so memory use is bounded by the
+            chunk size instead of the log size. None reads it in one go.
+        workers (int): Number of processes to parse the log with. The log is
+            split into byte ranges at line boundaries and each range is
+            aggregated in its own process.
+        chart_workers (int): Number of processes to render the charts with;
+            defaults to one per chart, up to the number of CPUs.
+        chart_format (str): "png" renders charts with matplotlib; "svg" inlines
+            charts drawn by core.svg_charts, without importing matplotlib.
+
+    Returns:
+        The aggregates the report was built from, or None if it failed
     """
     log_path = Path(log_file)
     output_path = Path(output_dir)
 
     if not log_path.exists():
         print(f"Error: Log file not found at {log_path}")
-        return
+        return None
 
     # Create output directory if it doesn't exist
     output_path.mkdir(exist_ok=True)
 
-    # Load the data
+    aggregates = ReportAggregates()
+    offset = 0
+    if incremental:
+        checkpoint = load_checkpoint(output_path, log_path)
+        if checkpoint is not None:
+            aggregates, offset = checkpoint
+
+    # Load the new part of the log
     try:
-        data = pd.read_csv(
-            log_path,
-            header=None,
-            names=[
-                "timestamp",
-                "exercise_type",
-                "thinking_time",
-                "distance",
-                "accuracy",
-                "question",
-                "correct",
-                "guess",
-            ],
-            parse_dates=["timestamp"],
-        )
+        new_aggregates, new_rows, end_offset = _aggregate_log(log_path, offset, chunk_size, workers)
     except Exception as e:
         print(f"Error reading log file: {e}")
+        return None
+
+    if offset:
+        print(f"Resuming from checkpoint: {new_rows} new attempts")
+
+    aggregates = aggregates.merge(new_aggregates)
+    save_checkpoint(output_path, log_path, aggregates, end_offset)
+
+    _write_report(aggregates, output_path, chart_workers=chart_workers, chart_format=chart_format)
+    return aggregates
+
+
+def generate_batch_reports(log_source: str, output_dir: str, workers: Optional[int] = None,
+                           incremental: bool = True, chunk_size: Optional[int] = None,
+                           chart_format: str = "png"):
+    """
+    Generates one report per learner log plus a class rollup report.
+
+    Learner reports are generated in a process pool, so pandas and matplotlib
+    are imported once per worker rather than once per learner. Each worker
+    returns the learner's aggregates. The class report merges them and does
+    not read the logs again.
+
+    Args:
+        log_source (str): A directory of learner logs, or a glob pattern.
+        output_dir (str): The directory to save the reports to. Learner reports
+            go to one sub-directory per learner, the rollup to ``class/``.
+        workers (int): Number of processes; defaults to the number of CPUs.
+        incremental (bool): Reuse each learner's report checkpoint.
+        chunk_size (int): Stream each log in chunks of this many rows.
+        chart_format (str): "png" or "svg" (see generate_report).
+    """
+    learners = _find_learner_logs(log_source)
+    output_path = Path(output_dir)
+    if not learners:
+        print(f"Error: No log files found for {log_source}")
+        return
+
+    output_path.mkdir(exist_ok=True)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(learners)))
+
+    results: Dict[str, ReportAggregates] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            # Learners already run in parallel, so each renders its own charts serially
+            name: pool.submit(generate_report, str(log_path), str(output_path / name),
+                              incremental=incremental, chunk_size=chunk_size, workers=1,
+                              chart_workers=1, chart_format=chart_format)
+            for name, log_path in learners.items()
+        }
+        for name, future in futures.items():
+            try:
+                aggregates = future.result()
+            except Exception as e:
+                print(f"Error generating report for {name}: {e}")
+                continue
+            if aggregates is not None:
+                results[name] = aggregates
+
+    class_aggregates = ReportAggregates()
+    for aggregates in results.values():
+        class_aggregates = class_aggregates.merge(aggregates)
+
+    class_path = output_path / "class"
+    class_path.mkdir(exist_ok=True)
+    _write_report(class_aggregates, class_path, title="Class Progress Report",
+                  chart_format=chart_format)
+    _write_batch_index(results, output_path)
+
+
+def _find_learner_logs(log_source: str) -> Dict[str, Path]:
+    """Map learner names (log file stems) to log files in a directory or glob."""
+    source = Path(log_source)
+    if source.is_dir():
+        paths = sorted(p for p in source.iterdir() if p.suffix in (".log", ".bin"))
+    else:
+        paths = sorted(Path(p) for p in glob.glob(log_source))
+
+    learners: Dict[str, Path] = {}
+    for path in paths:
+        if not path.is_file() or path.name.endswith(".strings"):
+            continue
+        name = path.stem
+        if name in learners or name == "class":
+            name = f"{path.stem}_{path.suffix.lstrip('.')}"
+        learners[name] = path
+    return learners
+
+
+def _write_batch_index(results: Dict[str, ReportAggregates], output_path: Path):
+    """Write an index page linking the class report and every learner report."""
+    rows = []
+    for name, aggregates in sorted(results.items()):
+        daily = aggregates.timescale("D")
+        attempts = int(daily['count'].sum())
+        correct = int(daily['correct'].sum())
+        accuracy = correct / attempts * 100 if attempts else 0
+        avg_time = daily['time_sum'].sum() / attempts if attempts else 0
+        rows.append(
+            f'<tr><td><a href="{html.escape(name)}/report.html">{html.escape(name)}</a></td>'
+            f'<td>{attempts}</td><td>{accuracy:.1f}%</td><td>{avg_time:.1f}s</td></tr>'
+        )
+
+    index_html = f"""<!DOCTYPE html>
+<html>
+<head>
+    <title>Class Progress Reports</title>
+    <style>
+        body {{ font-family: 'Comic Sans MS', 'Chalkboard SE', sans-serif; margin: 2em; background-color: #f9f9f9; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
+        th {{ background-color: #4ECDC4; color: white; }}
+    </style>
+</head>
+<body>
+    <h1>Class Progress Reports</h1>
+    <p><a href="class/report.html">Class rollup report</a> covering {len(results)} learners.</p>
+    <table>
+    <thead><tr><th>Learner</th><th>Attempts</th><th>Accuracy</th><th>Avg Time</th></tr></thead>
+    <tbody>
+    {"".join(rows)}
+    </tbody>
+    </table>
+</body>
+</html>
+"""
+    index_path = output_path / "index.html"
+    with open(index_path, "w", encoding='utf-8') as f:
+        f.write(index_html)
+    print(f"Batch index generated at {index_path.resolve()}")
+
+
+def _aggregate_log(log_path: Path, offset: int = 0, chunk_size: Optional[int] = None,
+                   workers: int = 1) -> Tuple[ReportAggregates, int, int]:
+    """
+    Aggregate the log rows stored after a byte offset, one chunk at a time.
+
+    With more than one worker, the log is split into byte ranges that start
+    and end on line boundaries, and each range is aggregated in a separate
+    process. The partial aggregates are merged here.
+
+    Returns:
+        (aggregates, number of rows read, offset just past the last complete row)
+    """
+    if is_binary_log(log_path):
+        reader = BinaryLogReader(log_path)
+        end_offset = HEADER.size + len(reader) * reader.record_size
+    else:
+        end_offset = last_line_end(log_path, offset)
+
+    ranges = _split_ranges(log_path, offset, end_offset, workers)
+    if len(ranges) <= 1:
+        aggregates, rows = _aggregate_range(str(log_path), offset, end_offset, chunk_size)
+        return aggregates, rows, end_offset
+
+    aggregates = ReportAggregates()
+    rows = 0
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        futures = [pool.submit(_aggregate_range, str(log_path), start, end, chunk_size)
+                   for start, end in ranges]
+        for future in futures:
+            part, part_rows = future.result()
+            aggregates = aggregates.merge(part)
+            rows += part_rows
+    return aggregates, rows, end_offset
+
+
+def _split_ranges(log_path: Path, start: int, end: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Split bytes [start, end) of a log into up to ``workers`` ranges of whole rows.
+
+    Text logs are cut just after a newline. Binary logs are cut on record boundaries.
+    """
+    workers = max(1, min(workers, (end - start) // MIN_PARALLEL_RANGE))
+    if workers <= 1:
+        return [(start, end)]
+
+    binary_record_size = record_size(log_path) if is_binary_log(log_path) else None
+    step = (end - start) // workers
+    bounds = [start]
+    with open(log_path, "rb") as f:
+        for i in range(1, workers):
+            cut = start + i * step
+            if binary_record_size:
+                cut -= (cut - HEADER.size) % binary_record_size
+            else:
+                f.seek(cut - 1)
+                # Advance to just past the next newline (the byte before cut may be one)
+                while True:
+                    block = f.read(64 * 1024)
+                    newline = block.find(b"\n")
+                    if newline >= 0 or not block:
+                        break
+                    cut += len(block)
+                cut = min(end, cut + newline) if block else end
+            if bounds[-1] < cut < end:
+                bounds.append(cut)
+    bounds.append(end)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _aggregate_range(log_file: str, start: int, end: int,
+                     chunk_size: Optional[int]) -> Tuple[ReportAggregates, int]:
+    """Aggregate the rows in bytes [start, end) of a log. Runs in worker processes."""
+    aggregates = ReportAggregates()
+    rows = 0
+    for data in _read_log_chunks(Path(log_file), start, end, chunk_size):
+        rows += len(data)
+        aggregates = aggregates.merge(ReportAggregates.from_frame(data))
+    return aggregates, rows
+
+
+def _read_log_chunks(log_path: Path, start: int, end: int,
+                     chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read and clean the log rows stored in a byte range.
+
+    Args:
+        log_path: Text or binary log
+        start, end: Byte range holding whole rows
+        chunk_size: Rows per chunk, or None for a single chunk
+
+    Yields:
+        Cleaned row chunks
+    """
+    if is_binary_log(log_path):
+        reader = BinaryLogReader(log_path)
+        first = max(0, (start - HEADER.size) // reader.record_size)
+        stop = (end - HEADER.size) // reader.record_size
+        step = chunk_size or max(1, stop - first)
+        for i in range(first, stop, step):
+            yield _clean_log_data(reader.to_dataframe(i, min(i + step, stop))[REPORT_COLUMNS])
         return
 
+    yield from _read_text_chunks(log_path, start, end, chunk_size)
+
+
+def _read_text_chunks(log_path: Path, start: int, end: int,
+                      chunk_size: Optional[int]) -> Iterator[pd.DataFrame]:
+    """
+    Parse the text log lines between two byte offsets.
+
+    Lines with the usual number of commas are parsed by read_csv. A question
+    may itself contain commas, so the other lines are split with
+    split_text_entry, which takes the fixed fields off both ends.
+    """
+    if end <= start:
+        return
+    plain: List[bytes] = []
+    split_rows: List[List[str]] = []
+    with open(log_path, "rb") as f:
+        stream = _ByteRangeReader(f, start, end)
+        for line in _split_lines(stream):
+            commas = line.count(b",")
+            if commas == 7 or (commas == 8 and b", catalog=" in line):
+                plain.append(line)
+            elif line:
+                fields = split_text_entry(line.decode("utf-8", errors="replace"))
+                if fields is not None:
+                    split_rows.append(fields[:len(REPORT_COLUMNS)])
+            if chunk_size is not None and len(plain) + len(split_rows) >= chunk_size:
+                yield _text_chunk_frame(plain, split_rows)
+                plain, split_rows = [], []
+    if plain or split_rows or chunk_size is None:
+        yield _text_chunk_frame(plain, split_rows)
+
+
+def _split_lines(stream, block_size: int = 1 << 22) -> Iterator[bytes]:
+    """Yield the lines of a binary stream without their newline, reading it in large blocks."""
+    rest = b""
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        lines = (rest + block).split(b"\n")
+        rest = lines.pop()
+        yield from lines
+    if rest:
+        yield rest
+
+
+def _text_chunk_frame(plain: List[bytes], split_rows: List[List[str]]) -> pd.DataFrame:
+    """Build one cleaned frame from plain lines and lines already split into fields."""
+    frames = []
+    if plain:
+        frames.append(pd.read_csv(
+            io.BytesIO(b"\n".join(plain)),
+            header=None,
+            # Positional, as lines have eight or nine columns
+            names=REPORT_COLUMNS,
+            usecols=range(len(REPORT_COLUMNS)),
+            parse_dates=["timestamp"],
+            skipinitialspace=True,
+            on_bad_lines="warn",
+        ))
+    if split_rows:
+        split = pd.DataFrame(split_rows, columns=REPORT_COLUMNS)
+        split["timestamp"] = pd.to_datetime(split["timestamp"], format="ISO8601", errors="coerce")
+        frames.append(split.dropna(subset=["timestamp"]))
+    if not frames:
+        frames.append(pd.DataFrame({name: pd.Series(dtype=object) for name in REPORT_COLUMNS}))
+    data = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return _clean_log_data(data)
+
+
+class _ByteRangeReader(io.RawIOBase):
+    """Raw stream over bytes [start, end) of an open binary file."""
+
+    def __init__(self, f, start: int, end: int):
+        self._f = f
+        self._remaining = end - start
+        f.seek(start)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self._remaining]
+        count = self._f.readinto(view)
+        self._remaining -= count
+        return count
+
+
+def _clean_log_data(data: pd.DataFrame) -> pd.DataFrame:
+    """Coerce numeric columns, drop unusable rows and derive is_correct."""
     # Basic data cleaning
     data["thinking_time"] = pd.to_numeric(data["thinking_time"], errors="coerce")
     data["distance"] = pd.to_numeric(data["distance"], errors="coerce")
     data["accuracy"] = pd.to_numeric(data["accuracy"], errors="coerce")
     data.dropna(subset=["thinking_time", "distance", "accuracy"], inplace=True)
-    
+
     # Strip whitespace from string columns
     string_columns = ["exercise_type", "question", "correct", "guess"]
     for col in string_columns:
         if col in data.columns:
             data[col] = data[col].astype(str).str.strip()
-    
+
     # Determine correctness based on accuracy (1.0 = correct)
     data['is_correct'] = data['accuracy'] == 1.0
+    return data
+
 
+def _write_report(aggregates: ReportAggregates, output_path: Path,
+                  title: str = "Math Progress Report", chart_workers: Optional[int] = None,
+                  chart_format: str = "png"):
+    """Render the HTML report and charts from aggregates."""
     # Calculate key metrics for dashboard
-    total_attempts = len(data)
-    correct_attempts = data['is_correct'].sum()
+    daily = aggregates.timescale("D").groupby(level="period").sum()
+    total_attempts = int(daily['count'].sum())
+    correct_attempts = int(daily['correct'].sum())
     overall_accuracy = (correct_attempts / total_attempts * 100) if total_attempts > 0 else 0
-    avg_thinking_time = data['thinking_time'].mean()
-    
+    avg_thinking_time = daily['time_sum'].sum() / total_attempts if total_attempts > 0 else np.nan
+
     # Calculate daily progress
-    daily_stats = data.groupby(data['timestamp'].dt.date).agg({
-        'is_correct': ['count', 'sum'],
-        'thinking_time': 'mean'
+    daily_stats = pd.DataFrame({
+        'total': daily['count'],
+        'correct': daily['correct'],
+        'avg_time': daily['time_sum'] / daily['count'],
     })
-    daily_stats.columns = ['total', 'correct', 'avg_time']
+    daily_stats.index = daily_stats.index.date
     daily_stats['accuracy'] = (daily_stats['correct'] / daily_stats['total'] * 100)
-    
+
     # Find best day
     if not daily_stats.empty:
         best_day = daily_stats['accuracy'].idxmax()
@@ -84,7 +468,7 @@ def generate_report(log_file: str, output_dir: str):
     report_html = f"""<!DOCTYPE html>
 <html>
 <head>
-    <title>Math Progress Report 🎯</title>
+    <title>{title} 🎯</title>
     <style>
         body {{ font-family: 'Comic Sans MS', 'Chalkboard SE', sans-serif; margin: 2em; background-color: #f9f9f9; }}
         h1 {{ color: #FF6B6B; text-align: center; font-size: 2.5em; }}
@@ -127,7 +511,7 @@ def generate_report(log_file: str, output_dir: str):
     </style>
 </head>
 <body>
-    <h1>🎯 Math Progress Report 🎯</h1>
+    <h1>🎯 {title} 🎯</h1>
     <p class="date">Report generated on {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
     <p>📊 Analyzed <strong>{total_attempts}</strong> math problems from your practice sessions!</p>
     
@@ -162,143 +546,40 @@ def generate_report(log_file: str, output_dir: str):
 """
 
 
-    # Time-based analysis
-    for timescale, timescale_name in [("D", "Daily"), ("W", "Weekly"), ("ME", "Monthly")]:
+    # Time-based analysis; charts are rendered after the HTML is built
+    chart_jobs = []
+    for timescale, timescale_name in TIMESCALES:
         report_html += f"<h2>{timescale_name} Progress</h2>\n"
         
-        grouped = data.groupby(pd.Grouper(key='timestamp', freq=timescale))
+        scale = aggregates.timescale(timescale)
         
-        if grouped.ngroups == 0:
+        if scale.empty:
             report_html += "<p>No data for this period.</p>\n"
             continue
         
-        avg_accuracy = grouped['accuracy'].mean() * 100  # Convert to percentage
-        avg_time = grouped['thinking_time'].mean()
+        # Re-insert empty periods so gaps show up in the charts
+        per_period = scale.groupby(level='period').sum().asfreq(timescale)
+        avg_accuracy = per_period['accuracy_sum'] / per_period['count'] * 100  # Convert to percentage
+        avg_time = per_period['time_sum'] / per_period['count']
         
-        # Calculate accuracy rating and color
-        def get_accuracy_rating(acc_percent):
-            if acc_percent >= 90:
-                return 'EXC', '#4CAF50'  # Green for excellent
-            elif acc_percent >= 70:
-                return 'GOOD', '#FFC107'  # Yellow for good
-            else:
-                return 'PRAC', '#F44336'  # Red for needs practice
-        
-        def get_speed_rating(time_sec):
-            if time_sec < 5:
-                return 'FAST', '#2196F3'  # Blue for fast
-            elif time_sec < 15:
-                return 'MED', '#3F51B5'  # Indigo for medium
-            else:
-                return 'SLOW', '#9C27B0'  # Purple for slow
-
-        # Create plot
-        fig, ax1 = plt.subplots(figsize=(12, 6))
-        ax2 = ax1.twinx()
-        
-        # Plot accuracy as bars
-        bars = ax1.bar(avg_accuracy.index, avg_accuracy.values, alpha=0.7, label='Accuracy %', 
-                      color=[get_accuracy_rating(val)[1] for val in avg_accuracy.values])
-        
-        # Plot time as line
-        line = ax2.plot(avg_time.index, avg_time.values, 'o-', linewidth=3, markersize=8, 
-                       label='Thinking Time (s)', color='#FF5722')
-        
-        # Add emoji annotations on bars
-        for i, (idx, acc_val) in enumerate(avg_accuracy.items()):
-            rating, _ = get_accuracy_rating(acc_val)
-            ax1.text(idx, acc_val + 1, rating, ha='center', fontsize=10, fontweight='bold')
-        
-        # Add emoji annotations on line points
-        for i, (idx, time_val) in enumerate(avg_time.items()):
-            rating, _ = get_speed_rating(time_val)
-            ax2.text(idx, time_val + 0.5, rating, ha='center', fontsize=10, fontweight='bold')
-
-        ax1.set_xlabel('Date', fontsize=12)
-        ax1.set_ylabel('Accuracy %', fontsize=12, color='#333')
-        ax2.set_ylabel('Thinking Time (seconds)', fontsize=12, color='#FF5722')
-        ax1.set_title(f'{timescale_name} Progress Chart', fontsize=16, fontweight='bold', pad=20)
-        
-        # Add grid and legend
-        ax1.grid(True, alpha=0.3)
-        ax1.set_ylim(0, 110)  # Leave room for emojis above 100%
-        
-        # Add legend
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
-        
-        fig.tight_layout()
-        
-        chart_path = output_path / f"{timescale_name.lower()}_progress.png"
-        plt.savefig(chart_path)
-        plt.close(fig)
-        
-        report_html += f'<img src="{chart_path.name}" alt="{timescale_name} Progress" />\n'
+        if chart_format == "svg":
+            report_html += _svg_progress_chart(timescale_name, avg_accuracy, avg_time) + "\n"
+        else:
+            chart_name = f"{timescale_name.lower()}_progress.png"
+            chart_jobs.append((chart_name, timescale_name, avg_accuracy, avg_time))
+            report_html += f'<img src="{chart_name}" alt="{timescale_name} Progress" />\n'
         
         # Breakdown by exercise type - simplified for kids
         report_html += f"<h3>{timescale_name} Exercise Summary 📝</h3>\n"
         
-        exercise_grouped = data.groupby([pd.Grouper(key='timestamp', freq=timescale), 'exercise_type'])
-        
-        total_completed = exercise_grouped.size().unstack(fill_value=0)
-        correctly_completed = exercise_grouped['is_correct'].sum().unstack(fill_value=0)
-        avg_time_exercise = exercise_grouped['thinking_time'].mean().unstack(fill_value=np.nan)
-
-        if not total_completed.empty:
-            report_html += '''
-            <table>
-            <thead>
-            <tr>
-                <th>Date</th>
-                <th>Exercise Type</th>
-                <th>Attempts</th>
-                <th>Correct ✅</th>
-                <th>Accuracy</th>
-                <th>Avg Time</th>
-                <th>Rating</th>
-            </tr>
-            </thead>
-            <tbody>
-            '''
-            for period, period_data in total_completed.iterrows():
-                for exercise_type, total in period_data.items():
-                    if total > 0:
-                        correct = correctly_completed.loc[period, exercise_type] if period in correctly_completed.index and exercise_type in correctly_completed.columns else 0
-                        avg_t = avg_time_exercise.loc[period, exercise_type] if period in avg_time_exercise.index and exercise_type in avg_time_exercise.columns else np.nan
-                        accuracy_pct = (correct / total * 100) if total > 0 else 0
-                        
-                        # Determine rating emoji
-                        if accuracy_pct >= 90:
-                            rating = '😊 Excellent!'
-                            rating_class = 'good'
-                        elif accuracy_pct >= 70:
-                            rating = '😐 Good job!'
-                            rating_class = 'ok'
-                        else:
-                            rating = '😞 Keep practicing!'
-                            rating_class = 'needs-improvement'
-                        
-                        report_html += f'''
-                        <tr>
-                            <td>{period.strftime("%Y-%m-%d")}</td>
-                            <td><strong>{exercise_type.replace('_', ' ').title()}</strong></td>
-                            <td>{total}</td>
-                            <td>{correct}</td>
-                            <td>{accuracy_pct:.1f}%</td>
-                            <td>{avg_t:.1f}s</td>
-                            <td class="{rating_class}">{rating}</td>
-                        </tr>
-                        '''
-            report_html += '</tbody>\n</table>\n'
-        else:
-            report_html += '<p>No exercise data for this period.</p>\n'
+        report_html += _exercise_summary_html(scale)
 
     # Challenging Problems - reframed positively
     report_html += "<h2>🎯 Challenging Problems to Practice</h2>\n"
-    incorrect_tasks = data[data['is_correct'] == False]
-    if not incorrect_tasks.empty:
-        top_5_incorrect = incorrect_tasks['question'].value_counts().nlargest(5)
+    if not aggregates.incorrect_questions.empty:
+        # Ties are ordered by question text so merged and full runs agree
+        top_5_incorrect = (aggregates.incorrect_questions.sort_index(kind='stable')
+                           .sort_values(ascending=False, kind='stable').head(5))
         report_html += '''
         <div style="background: #FFF3CD; padding: 20px; border-radius: 10px; border-left: 5px solid #FFC107;">
             <p>These problems were a bit tricky. Try them again to improve! 💪</p>
@@ -364,6 +645,9 @@ def generate_report(log_file: str, output_dir: str):
     </html>
     '''
 
+    if chart_jobs:
+        _render_charts(chart_jobs, output_path, chart_workers)
+
     # Save the report
     report_file_path = output_path / "report.html"
     with open(report_file_path, "w", encoding='utf-8') as f:
@@ -371,6 +655,225 @@ def generate_report(log_file: str, output_dir: str):
 
     print(f"Report successfully generated at {report_file_path.resolve()}")
 
+_SUMMARY_TABLE_HEAD = '''
+            <table>
+            <thead>
+            <tr>
+                <th>Date</th>
+                <th>Exercise Type</th>
+                <th>Attempts</th>
+                <th>Correct ✅</th>
+                <th>Accuracy</th>
+                <th>Avg Time</th>
+                <th>Rating</th>
+            </tr>
+            </thead>
+            <tbody>
+            '''
+
+_SUMMARY_ROW = '''
+                        <tr>
+                            <td>{}</td>
+                            <td><strong>{}</strong></td>
+                            <td>{}</td>
+                            <td>{}</td>
+                            <td>{:.1f}%</td>
+                            <td>{:.1f}s</td>
+                            <td class="{}">{}</td>
+                        </tr>
+                        '''.format
+
+# (minimum accuracy %, CSS class, rating text), best first
+_SUMMARY_RATINGS = [
+    (90, 'good', '😊 Excellent!'),
+    (70, 'ok', '😐 Good job!'),
+    (-np.inf, 'needs-improvement', '😞 Keep practicing!'),
+]
+
+
+def _exercise_summary_frame(scale: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the Exercise Summary table of one timescale as a single aligned frame.
+
+    Args:
+        scale: Aggregates indexed by (period, exercise_type)
+
+    Returns:
+        One row per period and exercise type with attempts, correct, accuracy,
+        avg_time, rating_class and rating columns, ordered by period then
+        exercise type
+    """
+    table = scale[scale['count'] > 0].sort_index()
+    periods = table.index.get_level_values('period')
+    exercise_types = table.index.get_level_values('exercise_type')
+    accuracy = (table['correct'] / table['count'] * 100).to_numpy()
+
+    # Ratings are the first threshold each accuracy reaches
+    rating_index = np.select([accuracy >= minimum for minimum, _, _ in _SUMMARY_RATINGS],
+                             list(range(len(_SUMMARY_RATINGS))))
+    names = {name: name.replace('_', ' ').title() for name in exercise_types.unique()}
+
+    return pd.DataFrame({
+        'date': periods.strftime("%Y-%m-%d"),
+        'exercise': exercise_types.map(names),
+        'attempts': table['count'].to_numpy(),
+        'correct': table['correct'].to_numpy(),
+        'accuracy': accuracy,
+        'avg_time': (table['time_sum'] / table['count']).to_numpy(),
+        'rating_class': np.array([cls for _, cls, _ in _SUMMARY_RATINGS], dtype=object)[rating_index],
+        'rating': np.array([text for _, _, text in _SUMMARY_RATINGS], dtype=object)[rating_index],
+    })
+
+
+def _exercise_summary_html(scale: pd.DataFrame) -> str:
+    """Render the Exercise Summary table of one timescale."""
+    if scale.empty:
+        return '<p>No exercise data for this period.</p>\n'
+
+    frame = _exercise_summary_frame(scale)
+    rows = map(_SUMMARY_ROW, frame['date'], frame['exercise'], frame['attempts'],
+               frame['correct'], frame['accuracy'], frame['avg_time'],
+               frame['rating_class'], frame['rating'])
+    return _SUMMARY_TABLE_HEAD + "".join(rows) + '</tbody>\n</table>\n'
+
+
+def _render_charts(chart_jobs: list, output_path: Path, workers: Optional[int] = None):
+    """
+    Render chart PNGs, skipping those whose input series are unchanged.
+
+    A content hash of each chart's input series is kept in CHART_CACHE_FILE.
+    A chart is only redrawn when its hash differs from the last run or the PNG
+    is missing. Charts that need drawing are rendered in parallel worker
+    processes when there is more than one of them.
+
+    Args:
+        chart_jobs: (file name, timescale name, accuracy series, time series) tuples
+        output_path: Directory the charts are saved to
+        workers: Number of processes; defaults to one per chart, up to the CPU count
+    """
+    cache_path = output_path / CHART_CACHE_FILE
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    pending = []
+    for job in chart_jobs:
+        chart_name = job[0]
+        digest = _chart_hash(*job[1:])
+        if cache.get(chart_name) != digest or not (output_path / chart_name).exists():
+            pending.append((job, digest))
+
+    workers = min(len(pending), workers or os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(pool.submit(_render_progress_chart, str(output_path / job[0]), *job[1:]), job, digest)
+                       for job, digest in pending]
+            for future, job, digest in futures:
+                future.result()
+                cache[job[0]] = digest
+    else:
+        for job, digest in pending:
+            _render_progress_chart(str(output_path / job[0]), *job[1:])
+            cache[job[0]] = digest
+
+    if len(pending) < len(chart_jobs):
+        print(f"Reused {len(chart_jobs) - len(pending)} unchanged chart(s)")
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+
+def _chart_hash(timescale_name: str, avg_accuracy: pd.Series, avg_time: pd.Series) -> str:
+    """Content hash of everything a progress chart is drawn from."""
+    digest = hashlib.sha256(f"{CHART_STYLE_VERSION}:{timescale_name}".encode("utf-8"))
+    for series in (avg_accuracy, avg_time):
+        digest.update(pd.util.hash_pandas_object(series, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def _svg_progress_chart(timescale_name: str, avg_accuracy: pd.Series, avg_time: pd.Series) -> str:
+    """Inline SVG version of the progress chart."""
+    return render_bar_line_chart(
+        f'{timescale_name} Progress Chart',
+        list(avg_accuracy.index),
+        bar_values=avg_accuracy.tolist(),
+        bar_colors=[_get_accuracy_rating(val)[1] for val in avg_accuracy.values],
+        bar_labels=[_get_accuracy_rating(val)[0] for val in avg_accuracy.values],
+        line_values=avg_time.tolist(),
+        line_labels=[_get_speed_rating(val)[0] for val in avg_time.values],
+    )
+
+
+def _get_accuracy_rating(acc_percent):
+    """Calculate accuracy rating and color."""
+    if acc_percent >= 90:
+        return 'EXC', '#4CAF50'  # Green for excellent
+    elif acc_percent >= 70:
+        return 'GOOD', '#FFC107'  # Yellow for good
+    else:
+        return 'PRAC', '#F44336'  # Red for needs practice
+
+
+def _get_speed_rating(time_sec):
+    """Calculate speed rating and color."""
+    if time_sec < 5:
+        return 'FAST', '#2196F3'  # Blue for fast
+    elif time_sec < 15:
+        return 'MED', '#3F51B5'  # Indigo for medium
+    else:
+        return 'SLOW', '#9C27B0'  # Purple for slow
+
+
+def _render_progress_chart(chart_path: str, timescale_name: str,
+                           avg_accuracy: pd.Series, avg_time: pd.Series):
+    """Draw one accuracy/thinking-time chart and save it. Runs in worker processes."""
+    import matplotlib
+    matplotlib.use("Agg")  # Charts are only ever saved to files
+    import matplotlib.pyplot as plt
+
+    # Create plot
+    fig, ax1 = plt.subplots(figsize=(12, 6))
+    ax2 = ax1.twinx()
+
+    # Plot accuracy as bars
+    bars = ax1.bar(avg_accuracy.index, avg_accuracy.values, alpha=0.7, label='Accuracy %', 
+                  color=[_get_accuracy_rating(val)[1] for val in avg_accuracy.values])
+
+    # Plot time as line
+    line = ax2.plot(avg_time.index, avg_time.values, 'o-', linewidth=3, markersize=8, 
+                   label='Thinking Time (s)', color='#FF5722')
+
+    # Add emoji annotations on bars
+    for i, (idx, acc_val) in enumerate(avg_accuracy.items()):
+        rating, _ = _get_accuracy_rating(acc_val)
+        ax1.text(idx, acc_val + 1, rating, ha='center', fontsize=10, fontweight='bold')
+
+    # Add emoji annotations on line points
+    for i, (idx, time_val) in enumerate(avg_time.items()):
+        rating, _ = _get_speed_rating(time_val)
+        ax2.text(idx, time_val + 0.5, rating, ha='center', fontsize=10, fontweight='bold')
+
+    ax1.set_xlabel('Date', fontsize=12)
+    ax1.set_ylabel('Accuracy %', fontsize=12, color='#333')
+    ax2.set_ylabel('Thinking Time (seconds)', fontsize=12, color='#FF5722')
+    ax1.set_title(f'{timescale_name} Progress Chart', fontsize=16, fontweight='bold', pad=20)
+
+    # Add grid and legend
+    ax1.grid(True, alpha=0.3)
+    ax1.set_ylim(0, 110)  # Leave room for emojis above 100%
+
+    # Add legend
+    lines1, labels1 = ax1.get_legend_handles_labels()
+    lines2, labels2 = ax2.get_legend_handles_labels()
+    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
+
+    fig.tight_layout()
+
+    plt.savefig(chart_path)
+    plt.close(fig)
+
+
 if __name__ == '__main__':
     # This allows running the reporting script directly for testing
     # In the final implementation, this will be called from main.py
@@ -0,0 +1,108 @@
+"""
+Shared rendering resources: fonts, layout rects and color palettes.
+
+The GameManager owns one ResourceManager and hands it to every exercise, so
+fonts are loaded once and layout rects are computed once per exercise type
+instead of on every frame or hit test.
+"""
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import pygame
+
+# Font role -> point size (None font = pygame's default font)
+FONT_SIZES = {
+    'main': 36,
+    'small': 24,
+    'label': 24,
+}
+
+PALETTES = {
+    'ui': {
+        'background': (255, 255, 255),
+        'text': (0, 0, 0),
+        'button': (200, 200, 200),
+        'button_border': (0, 0, 0),
+    },
+}
+
+
+class ResourceManager:
+    """
+    Fonts by role, per-exercise layout rects and color palettes.
+
+    Layouts and palettes are read-only mappings. The rects inside a layout are
+    shared by every exercise of that type: use them for drawing and hit tests,
+    never move or resize them in place.
+    """
+
+    _shared: Optional["ResourceManager"] = None
+
+    def __init__(self, fonts: Optional[Dict[str, pygame.font.Font]] = None,
+                 font_sizes: Optional[Dict[str, int]] = None):
+        """
+        Initialize the manager and preload the fonts if pygame.font is ready.
+
+        Args:
+            fonts: Already loaded fonts by role, used as-is
+            font_sizes: Point size per role for fonts that have to be loaded
+                (defaults to FONT_SIZES)
+        """
+        self.font_sizes = dict(FONT_SIZES if font_sizes is None else font_sizes)
+        self._fonts: Dict[str, pygame.font.Font] = dict(fonts or {})
+        self._layouts: Dict[str, Mapping[str, Any]] = {}
+        self._palettes = {name: MappingProxyType(dict(colors)) for name, colors in PALETTES.items()}
+        if pygame.font.get_init():
+            self.preload()
+
+    @classmethod
+    def shared(cls) -> "ResourceManager":
+        """Return a process-wide manager for exercises used without a GameManager."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def preload(self):
+        """Load every configured font that is not loaded yet."""
+        for role in self.font_sizes:
+            self.font(role)
+
+    def font(self, role: str) -> pygame.font.Font:
+        """
+        Return the font for a role ('main', 'small', 'label', ...).
+
+        Unknown roles fall back to the 'main' font.
+        """
+        font = self._fonts.get(role)
+        if font is None:
+            if role not in self.font_sizes and role != 'main':
+                return self.font('main')
+            font = pygame.font.Font(None, self.font_sizes.get(role, FONT_SIZES['main']))
+            self._fonts[role] = font
+        return font
+
+    @property
+    def fonts(self) -> Dict[str, pygame.font.Font]:
+        """Fonts dictionary in the form exercises' render methods expect."""
+        fonts = {role: self.font(role) for role in self.font_sizes}
+        fonts.setdefault('font', fonts.get('main'))  # Alias for backward compatibility
+        return fonts
+
+    def layout(self, key: str, build: Callable[[], Dict[str, Any]]) -> Mapping[str, Any]:
+        """
+        Return the layout stored under key, building it on first use.
+
+        Args:
+            key: Layout name, usually the exercise class and its geometry
+            build: Called once to create the layout (name -> Rect or tuple of Rects)
+        """
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = MappingProxyType(dict(build()))
+            self._layouts[key] = layout
+        return layout
+
+    def palette(self, name: str) -> Mapping[str, tuple]:
+        """Return a read-only color palette."""
+        return self._palettes[name]
@@ -0,0 +1,268 @@
+"""
+Spaced repetition of questions the learner has already seen.
+
+Every question answered so far is a review item with an ease factor, a
+review interval and a due time, updated after each attempt in the style of
+SM-2: right answers push the next review further out (by the ease factor),
+wrong answers bring the question back within a minute. Items are kept in a
+heap ordered by due time, so recording an attempt and finding the most
+overdue item take O(log n).
+
+The items are rebuilt from the progress log by one streaming pass. To keep
+startup fast with long logs, the items are snapshotted together with the log
+offset they cover; the next launch loads the snapshot and only reads the
+attempts appended since. Like the report checkpoint, a snapshot is only
+reused when the log has only been appended to.
+"""
+
+import datetime
+import heapq
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from core.log_tail import complete_log_end, tail_hash
+from core.progress_logger import split_text_entry
+
+SNAPSHOT_VERSION = 1
+
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+RELEARN_INTERVAL = 60.0         # Seconds until a wrongly answered question comes back
+FIRST_INTERVAL = 10 * 60.0      # After the first right answer
+SECOND_INTERVAL = 24 * 3600.0   # After the second right answer in a row
+PASSING_ACCURACY = 0.6          # Lowest accuracy that counts as remembered
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+ItemKey = Tuple[str, str]
+
+
+def _seconds(when: datetime.datetime) -> float:
+    """Seconds since 1970-01-01 of a naive local timestamp, as written to the log."""
+    return (when - _EPOCH).total_seconds()
+
+
+class ReviewItem:
+    """Review state of one question."""
+
+    __slots__ = ("exercise_type", "question", "ease", "interval", "repetitions", "last_seen", "due")
+
+    def __init__(self, exercise_type: str, question: str, ease: float = INITIAL_EASE,
+                 interval: float = 0.0, repetitions: int = 0, last_seen: float = 0.0,
+                 due: float = 0.0):
+        self.exercise_type = exercise_type
+        self.question = question
+        self.ease = ease
+        self.interval = interval
+        self.repetitions = repetitions
+        self.last_seen = last_seen
+        self.due = due
+
+    @property
+    def key(self) -> ItemKey:
+        return self.exercise_type, self.question
+
+    def review(self, accuracy: float, seen: float):
+        """
+        Update the item after an attempt.
+
+        Args:
+            accuracy: Accuracy of the attempt, 0.0 to 1.0
+            seen: Time of the attempt in seconds since the epoch
+        """
+        quality = 5.0 * min(1.0, max(0.0, accuracy))
+        if accuracy >= PASSING_ACCURACY:
+            self.repetitions += 1
+            if self.repetitions == 1:
+                self.interval = FIRST_INTERVAL
+            elif self.repetitions == 2:
+                self.interval = SECOND_INTERVAL
+            else:
+                self.interval *= self.ease
+        else:
+            self.repetitions = 0
+            self.interval = RELEARN_INTERVAL
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5.0 - quality) * (0.08 + (5.0 - quality) * 0.02))
+        self.last_seen = seen
+        self.due = seen + self.interval
+
+
+def _read_attempts(log_path: Path, offset: int) -> Iterator[Tuple[float, str, str, float]]:
+    """
+    Stream (seconds, exercise_type, question, accuracy) from a log, starting at a byte offset.
+
+    Text and binary logs are supported. Lines that cannot be parsed are
+    skipped, as is an unterminated last line.
+    """
+    from core.binary_log import HEADER, BinaryLogReader, is_binary_log
+
+    if is_binary_log(log_path):
+        reader = BinaryLogReader(log_path)
+        first = max(0, (offset - HEADER.size) // reader.record_size)
+        timestamps = reader.column("timestamp")[first:].astype("int64")
+        columns = zip(timestamps, reader.column("exercise_type")[first:],
+                      reader.column("question")[first:], reader.column("accuracy")[first:])
+        strings = reader.strings
+        for micros, exercise_type, question, accuracy in columns:
+            yield int(micros) / 1e6, strings[exercise_type], strings[question], float(accuracy)
+        return
+
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            fields = split_text_entry(raw.decode("utf-8", errors="replace"))
+            if fields is None:
+                continue
+            try:
+                seen = _seconds(datetime.datetime.fromisoformat(fields[0]))
+                accuracy = float(fields[4])
+            except ValueError:
+                continue
+            yield seen, fields[1], fields[5], accuracy
+
+
+class ReviewScheduler:
+    """Review items of every question seen, with the most overdue one on top of a heap."""
+
+    def __init__(self, log_file=None, snapshot_file=None):
+        """
+        Initialize an empty scheduler. Use load() to build it from a log.
+
+        Args:
+            log_file: Progress log the items are derived from
+            snapshot_file: JSON file the items are saved to (None to not save)
+        """
+        self.log_file = Path(log_file) if log_file is not None else None
+        self.snapshot_file = Path(snapshot_file) if snapshot_file is not None else None
+        self.items: Dict[ItemKey, ReviewItem] = {}
+        self._heap: List[Tuple[float, ItemKey]] = []
+        self._deferred = set()
+        self._snapshot_items = 0
+        self._attempts_read = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @classmethod
+    def load(cls, log_file, snapshot_file=None) -> "ReviewScheduler":
+        """
+        Build the scheduler from a snapshot and the attempts logged after it.
+
+        Args:
+            log_file: Progress log (text or binary); a missing log means no history
+            snapshot_file: Snapshot to start from and to save to
+
+        Returns:
+            The scheduler; load_stats() tells how much of the log was read
+        """
+        scheduler = cls(log_file, snapshot_file)
+        offset = scheduler._load_snapshot()
+        scheduler._snapshot_items = len(scheduler.items)
+        if scheduler.log_file is not None and scheduler.log_file.exists():
+            items = scheduler.items
+            for seen, exercise_type, question, accuracy in _read_attempts(scheduler.log_file, offset):
+                key = (exercise_type, question)
+                item = items.get(key)
+                if item is None:
+                    item = items[key] = ReviewItem(exercise_type, question)
+                item.review(accuracy, seen)
+                scheduler._attempts_read += 1
+        scheduler._rebuild_heap()
+        return scheduler
+
+    def load_stats(self) -> dict:
+        """Items restored from the snapshot, attempts read from the log, and total items."""
+        return {
+            'snapshot_items': self._snapshot_items,
+            'attempts_read': self._attempts_read,
+            'items': len(self.items),
+        }
+
+    def record(self, exercise_type: str, question: str, accuracy: float, when: datetime.datetime):
+        """Update the item of a question after an attempt."""
+        key = (exercise_type, question)
+        item = self.items.get(key)
+        if item is None:
+            item = self.items[key] = ReviewItem(exercise_type, question)
+        item.review(accuracy, _seconds(when))
+        self._deferred.discard(key)
+        heapq.heappush(self._heap, (item.due, key))
+        # Every update leaves an outdated entry behind; drop them once they dominate
+        if len(self._heap) > 2 * len(self.items) + 64:
+            self._rebuild_heap()
+
+    def peek_due(self, now: datetime.datetime) -> Optional[ReviewItem]:
+        """Return the most overdue item, or None if no item is due at now."""
+        heap = self._heap
+        items = self.items
+        while heap:
+            due, key = heap[0]
+            item = items[key]
+            if item.due != due or key in self._deferred:
+                heapq.heappop(heap)  # Outdated entry
+                continue
+            return item if due <= _seconds(now) else None
+        return None
+
+    def defer(self, item: ReviewItem):
+        """Stop serving an item until it is answered again, e.g. when no exercise can ask it."""
+        self._deferred.add(item.key)
+
+    def _rebuild_heap(self):
+        self._heap = [(item.due, key) for key, item in self.items.items() if key not in self._deferred]
+        heapq.heapify(self._heap)
+
+    def _load_snapshot(self) -> int:
+        """Restore the items of a valid snapshot. Returns the log offset they cover."""
+        if self.snapshot_file is None or self.log_file is None or not self.snapshot_file.exists():
+            return 0
+        try:
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            offset = int(snapshot["offset"])
+            if (snapshot.get("version") != SNAPSHOT_VERSION
+                    or snapshot.get("log_file") != str(self.log_file.resolve())
+                    or not self.log_file.exists()
+                    or self.log_file.stat().st_size < offset
+                    or snapshot.get("tail_hash") != tail_hash(self.log_file, offset)):
+                return 0
+            self.items = {(row[0], row[1]): ReviewItem(*row) for row in snapshot["items"]}
+            return offset
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Ignoring unreadable review snapshot: {e}")
+            self.items = {}
+            return 0
+
+    def save(self):
+        """
+        Snapshot the items together with the log offset they cover.
+
+        Call this after the logger has been closed, so every attempt recorded
+        in memory is in the log as well. The offset is the end of the last
+        complete line or record, so a half-written one is read on the next
+        load rather than from its middle.
+        """
+        if self.snapshot_file is None or self.log_file is None or not self.log_file.exists():
+            return
+        offset = complete_log_end(self.log_file)
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "log_file": str(self.log_file.resolve()),
+            "offset": offset,
+            "tail_hash": tail_hash(self.log_file, offset),
+            "items": [
+                [item.exercise_type, item.question, item.ease, item.interval,
+                 item.repetitions, item.last_seen, item.due]
+                for item in self.items.values()
+            ],
+        }
+        tmp_path = self.snapshot_file.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            tmp_path.replace(self.snapshot_file)
+        except OSError as e:
+            print(f"Could not save review snapshot: {e}")
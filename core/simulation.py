@@ -0,0 +1,352 @@
+"""
+Headless simulation of learners playing the game.
+
+Drives GameManager without a window: the screen is a plain pygame.Surface
+that is never drawn on, and no events are created. Scripted BotLearners
+answer each question with a configurable accuracy and response time through
+next_question and make_guess, the same path a click takes. A ManualClock
+stands in for the wall clock, so simulated thinking times and log timestamps
+do not depend on how fast the simulation runs.
+
+Simulation.run reports the time spent generating questions, validating
+guesses, logging and prefetching questions between attempts, which makes
+the module usable as a load test for the engine and the loggers:
+
+    python -m core.simulation --attempts 1000000 --log-format binary
+"""
+
+import datetime
+import random
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import pygame
+
+from core.exercise import Exercise
+from core.game_manager import GameManager
+from core.progress_logger import ProgressLogger
+
+SCREEN_SIZE = (800, 600)
+
+
+class ManualClock:
+    """Clock that only moves when advanced. Pass it as the clock of GameManager and ProgressLogger."""
+
+    def __init__(self, start: Optional[datetime.datetime] = None):
+        self.now = start or datetime.datetime(2025, 1, 1, 8, 0)
+
+    def __call__(self) -> datetime.datetime:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += datetime.timedelta(seconds=seconds)
+
+
+def answer_for(exercise: Exercise, correct: Any, right: bool, rng: random.Random) -> Any:
+    """
+    Build a right or wrong guess in the form the current question expects.
+
+    Args:
+        exercise: Exercise the question was generated by
+        correct: The question's correct answer
+        right: Whether the guess should be right
+        rng: Random source for wrong guesses
+
+    Returns:
+        The guess, or None for a wrong guess on an exercise whose answers are unknown
+    """
+    grid_size = getattr(exercise, 'grid_size', None)
+    if grid_size is not None:
+        # Grid exercises are answered with a number of cells
+        total = grid_size[0] * grid_size[1]
+        cells = int(correct * total)
+        if right:
+            return cells
+        # Estimates within 10% of the grid count as right, so stay further away
+        margin = int(total * 0.1) + 1
+        below = max(0, cells - margin + 1)
+        above = max(0, total - (cells + margin) + 1)
+        if below + above == 0:
+            return None
+        x = rng.randrange(below + above)
+        return x if x < below else cells + margin + (x - below)
+
+    if hasattr(exercise, 'frac1'):
+        choices = (exercise.frac1, exercise.frac2)
+    else:
+        choices = getattr(exercise, 'options', None)
+    if choices:
+        if right:
+            return correct
+        wrong = [choice for choice in choices if choice != correct]
+        return rng.choice(wrong) if wrong else correct
+
+    if right:
+        return correct
+    if isinstance(correct, float) and 0.0 <= correct <= 1.0:
+        # Number line: any point at least 0.2 away counts as wrong
+        low, high = max(0.0, correct - 0.2), min(1.0, correct + 0.2)
+        x = rng.uniform(0.0, low + (1.0 - high))
+        return x if x < low else high + (x - low)
+    return None
+
+
+class BotLearner:
+    """Scripted learner with a fixed chance of answering right and a random response time."""
+
+    def __init__(self, name: str = "bot", accuracy: Union[float, Dict[str, float]] = 0.8,
+                 mean_time: float = 4.0, time_sd: float = 1.5, min_time: float = 0.5,
+                 seed: Optional[int] = None):
+        """
+        Initialize the learner.
+
+        Args:
+            name: Label used in the report
+            accuracy: Probability of a right answer, or a dict of probabilities
+                by exercise type prefix (e.g. {"multiplication": 0.6}) with an
+                optional "default" entry
+            mean_time, time_sd: Normal distribution of response times in seconds
+            min_time: Shortest response time in seconds
+            seed: Seed of the learner's random source
+        """
+        self.name = name
+        self.accuracy = accuracy
+        self.mean_time = mean_time
+        self.time_sd = time_sd
+        self.min_time = min_time
+        self.rng = random.Random(seed)
+        self._accuracy_by_type: Dict[str, float] = {}
+
+    def accuracy_for(self, exercise_type: str) -> float:
+        """Return the probability of answering a question of this type right."""
+        accuracy = self._accuracy_by_type.get(exercise_type)
+        if accuracy is None:
+            if isinstance(self.accuracy, dict):
+                matches = [prefix for prefix in self.accuracy if exercise_type.startswith(prefix)]
+                key = max(matches, key=len) if matches else "default"
+                accuracy = self.accuracy.get(key, 0.8)
+            else:
+                accuracy = self.accuracy
+            self._accuracy_by_type[exercise_type] = accuracy
+        return accuracy
+
+    def response_time(self) -> float:
+        """Draw the seconds the learner thinks before answering."""
+        return max(self.min_time, self.rng.gauss(self.mean_time, self.time_sd))
+
+    def guess(self, exercise: Exercise, correct: Any) -> Any:
+        """Answer the current question of an exercise."""
+        right = self.rng.random() < self.accuracy_for(exercise.get_type())
+        return answer_for(exercise, correct, right, self.rng)
+
+
+class NullLogger(ProgressLogger):
+    """Logger that discards attempts, to measure the engine without disk writes."""
+
+    def __init__(self):
+        super().__init__(log_file="")
+
+    def log_attempt(self, exercise_type: str, question: str, correct: Any,
+                    guess: Any, thinking_time: float, accuracy: float,
+                    catalog_entry: Optional[str] = None):
+        pass
+
+
+class _TimedLogger:
+    """Wraps a logger and adds up the time its log_attempt calls take."""
+
+    def __init__(self, logger: ProgressLogger):
+        self.logger = logger
+        self.seconds = 0.0
+
+    def log_attempt(self, *args, **kwargs):
+        start = time.perf_counter()
+        self.logger.log_attempt(*args, **kwargs)
+        self.seconds += time.perf_counter() - start
+
+    def close(self):
+        self.logger.close()
+
+    def stats(self) -> dict:
+        return self.logger.stats()
+
+
+class Simulation:
+    """Runs bot learners against a headless GameManager and measures each phase."""
+
+    def __init__(self, exercises: List[Exercise], bots: Sequence[BotLearner],
+                 logger: Optional[ProgressLogger] = None, clock: Optional[ManualClock] = None,
+                 pause: float = 1.0, review_scheduler=None, catalog=None, review_interval: int = 3):
+        """
+        Initialize the simulation.
+
+        Args:
+            exercises: Exercises to ask questions from
+            bots: Learners taking turns, one attempt each
+            logger: Logger that records the attempts (defaults to NullLogger).
+                Give it the same clock for simulated timestamps.
+            clock: Simulated clock (defaults to a new ManualClock)
+            pause: Simulated seconds between a guess and the next question
+            review_scheduler: Spaced repetition for the game (see GameManager)
+            catalog: Catalog the exercises come from, to pick them by weight
+                (see GameManager)
+            review_interval: Least questions from one review to the next (see GameManager)
+        """
+        if not bots:
+            raise ValueError("At least one bot learner is needed")
+        self.bots = list(bots)
+        self.clock = clock if clock is not None else ManualClock()
+        self.pause = pause
+        self._logger = _TimedLogger(logger if logger is not None else NullLogger())
+        self.game_manager = GameManager(exercises, pygame.Surface(SCREEN_SIZE), {},
+                                        logger=self._logger, clock=self.clock,
+                                        review_scheduler=review_scheduler, catalog=catalog,
+                                        review_interval=review_interval)
+
+    def run(self, attempts: int) -> dict:
+        """
+        Play a number of attempts and close the logger.
+
+        Returns:
+            Report with attempt counts, accuracy per exercise type and bot, and
+            the time spent per phase (see format_report)
+        """
+        game = self.game_manager
+        clock = self.clock
+        bots = self.bots
+        perf_counter = time.perf_counter
+        generate = answer = validate = refill = 0.0
+        logged = 0
+        by_type: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        by_bot: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+
+        simulated_start = clock.now
+        started = perf_counter()
+        for i in range(attempts):
+            bot = bots[i % len(bots)]
+            t0 = perf_counter()
+            game.next_question()
+            t1 = perf_counter()
+            clock.advance(bot.response_time())
+            guess = bot.guess(game.current_exercise, game.correct_answer)
+            t2 = perf_counter()
+            accuracy = game.make_guess(guess)
+            t3 = perf_counter()
+            # The pause before the next question is idle time for prefetching
+            game.refill_questions()
+            t4 = perf_counter()
+            clock.advance(self.pause)
+
+            generate += t1 - t0
+            answer += t2 - t1
+            validate += t3 - t2
+            refill += t4 - t3
+            if accuracy is not None:
+                logged += 1
+                for totals in (by_type[game.current_exercise.get_type()], by_bot[bot.name]):
+                    totals[0] += 1
+                    totals[1] += accuracy
+
+        logging = self._logger.seconds
+        close_start = perf_counter()
+        self._logger.close()
+        drain = perf_counter() - close_start
+        total = perf_counter() - started
+
+        return {
+            'attempts': attempts,
+            'logged': logged,
+            'skipped': attempts - logged,
+            'simulated_seconds': (clock.now - simulated_start).total_seconds(),
+            'total_seconds': total,
+            'phases': {
+                'generate': generate,
+                'bot': answer,
+                'validate': validate - logging,
+                'log': logging,
+                'log_drain': drain,
+                'refill': refill,
+            },
+            'accuracy_by_type': {name: s / n for name, (n, s) in sorted(by_type.items())},
+            'accuracy_by_bot': {name: s / n for name, (n, s) in by_bot.items()},
+            'logger': self._logger.stats(),
+            'question_pool': game.question_pool.stats(),
+        }
+
+
+def format_report(result: dict) -> str:
+    """Format a Simulation.run result as a plain-text throughput table."""
+    attempts = max(1, result['attempts'])
+    lines = [
+        f"Attempts: {result['attempts']} ({result['logged']} logged, {result['skipped']} skipped)",
+        f"Wall time: {result['total_seconds']:.2f} s, "
+        f"{result['attempts'] / max(result['total_seconds'], 1e-9):,.0f} attempts/s",
+        "",
+        f"{'phase':<10} {'seconds':>9} {'us/attempt':>11} {'per second':>12}",
+    ]
+    for phase, seconds in result['phases'].items():
+        rate = f"{attempts / seconds:,.0f}" if seconds > 0 and phase not in ('log_drain', 'refill') else "-"
+        lines.append(f"{phase:<10} {seconds:>9.3f} {seconds / attempts * 1e6:>11.2f} {rate:>12}")
+
+    lines.append("")
+    lines.append("Mean accuracy by exercise type:")
+    for name, accuracy in result['accuracy_by_type'].items():
+        lines.append(f"  {name:<40} {accuracy:.3f}")
+    lines.append("Mean accuracy by bot:")
+    for name, accuracy in result['accuracy_by_bot'].items():
+        lines.append(f"  {name:<40} {accuracy:.3f}")
+    pool = result['question_pool']
+    lines.append(f"Question pool: hit rate {pool['hit_rate']:.1%}, {pool['generated']} prefetched, "
+                 f"avg refill {pool['avg_refill_ms']:.3f} ms")
+    if result['logger']:
+        lines.append("Logger: " + ", ".join(
+            f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in result['logger'].items()))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import tempfile
+
+    from core.exercise_catalog import ExerciseCatalog
+    from core.progress_logger import BackgroundProgressLogger
+    from learn_pygame_solid import CATALOG_FILE
+
+    parser = argparse.ArgumentParser(description="Play the game with bot learners, without a display.")
+    parser.add_argument("--attempts", type=int, default=100000, help="Number of attempts to play")
+    parser.add_argument("--accuracy", type=float, nargs="+", default=[0.6, 0.75, 0.9],
+                        help="One bot is created per value, answering right with that probability")
+    parser.add_argument("--mean-time", type=float, default=4.0, help="Mean response time in seconds")
+    parser.add_argument("--log-format", choices=["text", "binary", "none"], default="text",
+                        help="Log format, or none to skip logging")
+    parser.add_argument("--log-file", help="Log to write (defaults to a temporary file)")
+    parser.add_argument("--sync-log", action="store_true",
+                        help="Use the synchronous ProgressLogger instead of the background writer")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for questions and bots")
+    parser.add_argument("--catalog", default=CATALOG_FILE, help="Exercise catalog to play")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    clock = ManualClock()
+    log_file = args.log_file
+    if args.log_format == "none":
+        logger = NullLogger()
+    else:
+        if log_file is None:
+            fd, log_file = tempfile.mkstemp(suffix=".log", prefix="simulation_")
+            os.close(fd)
+            os.remove(log_file)
+        logger_class = ProgressLogger if args.sync_log else BackgroundProgressLogger
+        logger = logger_class(log_file, args.log_format, clock=clock)
+
+    bots = [BotLearner(f"bot_{i + 1} (accuracy {accuracy:g})", accuracy, mean_time=args.mean_time,
+                       seed=args.seed + i)
+            for i, accuracy in enumerate(args.accuracy)]
+    catalog = ExerciseCatalog(args.catalog)
+    simulation = Simulation(catalog.exercises, bots, logger=logger, clock=clock, catalog=catalog)
+    print(format_report(simulation.run(args.attempts)))
+    if log_file:
+        print(f"Log written to {log_file}")
@@ -0,0 +1,97 @@
+"""
+Caches for rendered pygame surfaces.
+
+Rasterizing text with ``font.render`` is the most expensive part of drawing a
+frame, and the same strings are drawn again every frame. ``render_text`` is a
+drop-in for ``font.render`` that keeps recently rendered surfaces in a shared,
+size-capped LRU cache.
+
+Cached surfaces are shared between callers: blit them, never draw on them.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import pygame
+
+
+class LRUCache:
+    """Least-recently-used cache with a size cap and hit/miss counters."""
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept; the least recently used
+                entry is evicted beyond that
+        """
+        self.max_size = max(1, max_size)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, creating and caching it on a miss.
+
+        Args:
+            key: Cache key
+            create: Called without arguments to build the value on a miss
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = create()
+            self._entries[key] = value
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return value
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and
+            hit_rate (0.0 to 1.0)
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared by the game manager and every exercise
+text_cache = LRUCache(max_size=512)
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color,
+                background: Optional[Any] = None) -> pygame.Surface:
+    """
+    Render text through the shared cache; same arguments as font.render.
+
+    Returns:
+        The rendered surface. It may be shared, so do not draw on it.
+    """
+    key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+    return text_cache.get(key, lambda: font.render(text, antialias, color, background))
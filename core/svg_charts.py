@@ -0,0 +1,186 @@
+"""
+Dependency-free SVG charts for the progress report.
+
+Draws the same chart as the matplotlib PNGs: accuracy bars with rating labels
+and a thinking-time line on a twin y axis. The result is an SVG string that can
+be inlined into report.html. Only the standard library is used.
+"""
+
+import datetime
+import html
+import math
+from typing import List, Optional, Sequence
+
+WIDTH = 1200
+HEIGHT = 600
+MARGIN_LEFT = 80
+MARGIN_RIGHT = 80
+MARGIN_TOP = 70
+MARGIN_BOTTOM = 70
+
+ACCURACY_MAX = 110  # Leave room for rating labels above 100%
+TIME_COLOR = "#FF5722"
+MAX_X_LABELS = 12
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _to_datetime(value) -> datetime.datetime:
+    """Accept datetime, date or pandas Timestamp values."""
+    if isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime(value.year, value.month, value.day)
+
+
+def _nice_step(span: float, target_ticks: int = 5) -> float:
+    """Round span / target_ticks up to 1, 2 or 5 times a power of ten."""
+    raw = span / target_ticks if span > 0 else 1.0
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+def _text(x: float, y: float, content: str, size: int = 12, anchor: str = "middle",
+          color: str = "#000", bold: bool = False, rotate: Optional[float] = None) -> str:
+    weight = ' font-weight="bold"' if bold else ""
+    transform = f' transform="rotate({rotate} {x:.1f} {y:.1f})"' if rotate is not None else ""
+    return (f'<text x="{x:.1f}" y="{y:.1f}" font-size="{size}" text-anchor="{anchor}" '
+            f'fill="{color}"{weight}{transform}>{html.escape(content)}</text>')
+
+
+def render_bar_line_chart(title: str, periods: Sequence, bar_values: Sequence[float],
+                          bar_colors: Sequence[str], bar_labels: Sequence[str],
+                          line_values: Sequence[float], line_labels: Sequence[str],
+                          bar_axis_label: str = "Accuracy %",
+                          line_axis_label: str = "Thinking Time (seconds)",
+                          bar_legend: str = "Accuracy %",
+                          line_legend: str = "Thinking Time (s)") -> str:
+    """
+    Render bars (left axis, 0-110) and a line (right axis) over dated periods.
+
+    Args:
+        title: Chart title
+        periods: Period dates, one per value, in ascending order
+        bar_values: Bar heights; NaN/None bars are left out
+        bar_colors: Fill color per bar
+        bar_labels: Text drawn above each bar
+        line_values: Line values; NaN/None breaks the line
+        line_labels: Text drawn above each line point
+
+    Returns:
+        The SVG document as a string
+    """
+    plot_left = MARGIN_LEFT
+    plot_right = WIDTH - MARGIN_RIGHT
+    plot_top = MARGIN_TOP
+    plot_bottom = HEIGHT - MARGIN_BOTTOM
+    plot_width = plot_right - plot_left
+    plot_height = plot_bottom - plot_top
+
+    times = [_to_datetime(p) for p in periods]
+    origin = times[0] if times else datetime.datetime(1970, 1, 1)
+    offsets = [(t - origin).total_seconds() for t in times]
+    gaps = [b - a for a, b in zip(offsets, offsets[1:]) if b > a]
+    spacing = min(gaps) if gaps else 86400.0
+    span_start = (offsets[0] if offsets else 0.0) - spacing * 0.6
+    span_end = (offsets[-1] if offsets else 0.0) + spacing * 0.6
+    x_scale = plot_width / (span_end - span_start)
+    bar_width = max(1.0, spacing * 0.8 * x_scale)
+
+    def x_of(offset: float) -> float:
+        return plot_left + (offset - span_start) * x_scale
+
+    present_times = [v for v in line_values if not _is_missing(v)]
+    time_step = _nice_step(max(present_times) * 1.15 if present_times else 1.0)
+    # At least one step, so an all-zero series still gets an axis
+    time_max = time_step * max(1, math.ceil((max(present_times) * 1.15 if present_times else 1.0) / time_step))
+
+    def y_of_accuracy(value: float) -> float:
+        return plot_bottom - value / ACCURACY_MAX * plot_height
+
+    def y_of_time(value: float) -> float:
+        return plot_bottom - value / time_max * plot_height
+
+    parts: List[str] = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" '
+        f'width="100%" font-family="sans-serif" role="img" aria-label="{html.escape(title)}">',
+        f'<rect width="{WIDTH}" height="{HEIGHT}" fill="white"/>',
+        _text(WIDTH / 2, MARGIN_TOP / 2 + 6, title, size=20, bold=True),
+    ]
+
+    # Grid and left axis ticks
+    for tick in range(0, 101, 20):
+        y = y_of_accuracy(tick)
+        parts.append(f'<line x1="{plot_left}" y1="{y:.1f}" x2="{plot_right}" y2="{y:.1f}" '
+                     f'stroke="#000" stroke-opacity="0.1"/>')
+        parts.append(_text(plot_left - 8, y + 4, str(tick), anchor="end"))
+
+    # Right axis ticks
+    tick = 0.0
+    while tick <= time_max + 1e-9:
+        parts.append(_text(plot_right + 8, y_of_time(tick) + 4, f"{tick:g}", anchor="start",
+                           color=TIME_COLOR))
+        tick += time_step
+
+    # Bars with rating labels
+    for offset, value, color, label in zip(offsets, bar_values, bar_colors, bar_labels):
+        if _is_missing(value):
+            continue
+        x = x_of(offset)
+        y = y_of_accuracy(value)
+        parts.append(f'<rect x="{x - bar_width / 2:.1f}" y="{y:.1f}" width="{bar_width:.1f}" '
+                     f'height="{plot_bottom - y:.1f}" fill="{color}" fill-opacity="0.7"/>')
+        parts.append(_text(x, y_of_accuracy(value + 1) - 2, label, size=11, bold=True))
+
+    # Line, broken at missing values, with markers and labels
+    segment: List[str] = []
+    segments: List[List[str]] = []
+    markers: List[str] = []
+    for offset, value, label in zip(offsets, line_values, line_labels):
+        if _is_missing(value):
+            if segment:
+                segments.append(segment)
+            segment = []
+            continue
+        x, y = x_of(offset), y_of_time(value)
+        segment.append(f"{x:.1f},{y:.1f}")
+        markers.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="5" fill="{TIME_COLOR}"/>')
+        markers.append(_text(x, y_of_time(value + 0.5) - 8, label, size=11, bold=True))
+    if segment:
+        segments.append(segment)
+    for points in segments:
+        parts.append(f'<polyline points="{" ".join(points)}" fill="none" stroke="{TIME_COLOR}" '
+                     f'stroke-width="3"/>')
+    parts.extend(markers)
+
+    # Axes frame and x labels
+    parts.append(f'<rect x="{plot_left}" y="{plot_top}" width="{plot_width}" height="{plot_height}" '
+                 f'fill="none" stroke="#000"/>')
+    label_every = max(1, math.ceil(len(times) / MAX_X_LABELS))
+    for i in range(0, len(times), label_every):
+        x = x_of(offsets[i])
+        parts.append(f'<line x1="{x:.1f}" y1="{plot_bottom}" x2="{x:.1f}" y2="{plot_bottom + 5}" stroke="#000"/>')
+        parts.append(_text(x, plot_bottom + 20, times[i].strftime("%Y-%m-%d"), size=11))
+
+    parts.append(_text(WIDTH / 2, HEIGHT - 15, "Date"))
+    parts.append(_text(20, (plot_top + plot_bottom) / 2, bar_axis_label, color="#333", rotate=-90))
+    parts.append(_text(WIDTH - 20, (plot_top + plot_bottom) / 2, line_axis_label,
+                       color=TIME_COLOR, rotate=90))
+
+    # Legend
+    legend_x, legend_y = plot_left + 12, plot_top + 12
+    parts.append(f'<rect x="{legend_x}" y="{legend_y}" width="170" height="48" fill="white" '
+                 f'stroke="#ccc"/>')
+    parts.append(f'<rect x="{legend_x + 10}" y="{legend_y + 9}" width="20" height="10" '
+                 f'fill="#4CAF50" fill-opacity="0.7"/>')
+    parts.append(_text(legend_x + 38, legend_y + 18, bar_legend, anchor="start"))
+    parts.append(f'<line x1="{legend_x + 10}" y1="{legend_y + 35}" x2="{legend_x + 30}" '
+                 f'y2="{legend_y + 35}" stroke="{TIME_COLOR}" stroke-width="3"/>')
+    parts.append(_text(legend_x + 38, legend_y + 39, line_legend, anchor="start"))
+
+    parts.append("</svg>")
+    return "\n".join(parts)
@@ -1,11 +1,11 @@
 # Exercises module containing different exercise types
+#
+# Exercise classes are imported on first access (see exercises.registry), so
+# importing the package does not import every exercise module.
 
-from .number_line_exercise import NumberLineExercise
-from .fraction_comparison_exercise import FractionComparisonExercise
-from .advanced_fraction_comparison_exercise import AdvancedFractionComparisonExercise
-from .multiplication_exercise import MultiplicationExercise
-from .multiplication_exercise_num import MultiplicationExerciseNum
-from .double_number_line_exercise import DoubleNumberLineExercise
+from .registry import EXERCISE_TYPES
+
+_CLASS_MODULES = {class_name: module for module, class_name in EXERCISE_TYPES.values()}
 
 __all__ = [
     'NumberLineExercise',
@@ -15,3 +15,10 @@ __all__ = [
     'MultiplicationExerciseNum',
     'DoubleNumberLineExercise',
 ]
+
+
+def __getattr__(name):
+    if name in _CLASS_MODULES:
+        import importlib
+        return getattr(importlib.import_module(_CLASS_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
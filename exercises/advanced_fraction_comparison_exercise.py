@@ -1,14 +1,18 @@
-import random
 from fractions import Fraction
 from typing import Tuple, Any, Optional, List, Dict
 import pygame
 
-from core.exercise import Exercise
+from core.exercise import Exercise, InputHandlers
+from core.question_universe import fraction_universe
+from core.surface_cache import render_text
 
 
 class AdvancedFractionComparisonExercise(Exercise):
     """Advanced exercise for comparing fractions without visual aids - text-only multiple choice."""
 
+    QUESTION_STATE = ("frac1", "frac2", "correct_answer", "question_type", "options",
+                      "question_text", "invalid_selection")
+
     def __init__(self, difficulty: str = "medium"):
         self.frac1: Optional[Fraction] = None
         self.frac2: Optional[Fraction] = None
@@ -36,16 +40,30 @@ class AdvancedFractionComparisonExercise(Exercise):
         self.GRAY = (200, 200, 200)
         self.LIGHT_BLUE = (173, 216, 230)
 
+    QUESTION_TYPES = ("larger", "smaller")
+
     def generate_question(self) -> Tuple[str, Any]:
-        """Generate a text-only fraction comparison question."""
+        """
+        Generate a text-only fraction comparison question.
+
+        Every ordered pair of different fractions allowed by the difficulty
+        config, asked either way round, is equally likely (or comes from the
+        scheduler, see use_scheduler).
+        """
+        return self.question_at(self._next_question_index())
+
+    def question_count(self) -> int:
+        """Ordered pairs of different fractions times the two question types."""
+        return self._universe().pair_count() * len(self.QUESTION_TYPES)
+
+    def question_at(self, index: int) -> Tuple[str, Any]:
+        """Ask question number index (see question_count)."""
         # Reset state
         self.invalid_selection = False
 
-        # Generate two different fractions based on difficulty
-        self.frac1, self.frac2 = self._generate_fraction_pair()
-
-        # Randomly choose question type
-        self.question_type = random.choice(["larger", "smaller"])
+        pair, question_type = divmod(index, len(self.QUESTION_TYPES))
+        self.frac1, self.frac2 = self._universe().pair(pair)
+        self.question_type = self.QUESTION_TYPES[question_type]
 
         # Determine correct answer
         if self.question_type == "larger":
@@ -78,7 +96,7 @@ class AdvancedFractionComparisonExercise(Exercise):
         # Draw question text
         font = fonts.get('main', fonts.get('font'))
         if font:
-            question_surf = font.render(self.question_text, True, self.BLACK)
+            question_surf = render_text(font, self.question_text, True, self.BLACK)
             screen.blit(question_surf, (400 - question_surf.get_width()//2, 50))
 
         # Draw multiple choice options
@@ -89,7 +107,7 @@ class AdvancedFractionComparisonExercise(Exercise):
         small_font = fonts.get('small', fonts.get('font'))
         if small_font:
             instruction = "Press A, B, C, D or click on an option"
-            inst_surf = small_font.render(instruction, True, self.GRAY)
+            inst_surf = render_text(small_font, instruction, True, self.GRAY)
             screen.blit(inst_surf, (400 - inst_surf.get_width()//2, 350))
 
         # Show invalid selection feedback
@@ -97,7 +115,7 @@ class AdvancedFractionComparisonExercise(Exercise):
             invalid_font = fonts.get('small', fonts.get('font'))
             if invalid_font:
                 invalid_text = "Please choose A or B - the fractions are not equal!"
-                invalid_surf = invalid_font.render(invalid_text, True, self.RED)
+                invalid_surf = render_text(invalid_font, invalid_text, True, self.RED)
                 screen.blit(invalid_surf, (400 - invalid_surf.get_width()//2, 320))
 
     def render_feedback(self, screen, guess: Any, correct: Any, fonts: dict):
@@ -116,6 +134,26 @@ class AdvancedFractionComparisonExercise(Exercise):
         # Show result text
         self._draw_result_text(screen, fonts, guess == correct)
 
+    def register_hit_regions(self, regions):
+        """Every option is clickable and highlighted on hover."""
+        for i, rect in enumerate(self.layout["options"]):
+            regions.add(rect, i, hover=True)
+
+    def input_handlers(self) -> InputHandlers:
+        """Options are chosen by clicking them or with the A-D keys."""
+        return InputHandlers(click=self._select_option, key=self.handle_input)
+
+    def build_layout(self) -> dict:
+        """Rects of the four answer options."""
+        return {
+            "options": tuple(
+                pygame.Rect(self.OPTION_START_X,
+                            self.OPTION_START_Y + i * (self.OPTION_HEIGHT + self.OPTION_SPACING),
+                            self.OPTION_WIDTH, self.OPTION_HEIGHT)
+                for i in range(4)
+            ),
+        }
+
     def handle_input(self, event) -> Any:
         """Handle keyboard or mouse input for multiple choice selection."""
         # Reset invalid selection flag
@@ -137,21 +175,10 @@ class AdvancedFractionComparisonExercise(Exercise):
 
         return None
 
-    def _generate_fraction_pair(self) -> Tuple[Fraction, Fraction]:
-        """Generate two different fractions based on difficulty level."""
+    def _universe(self):
+        """Distinct fractions allowed by the difficulty config."""
         config = self._get_difficulty_config()
-
-        while True:
-            d1 = random.choice(config["denominators"])
-            n1 = random.randint(1, min(d1 - 1, int(config["max_value"] * d1)))
-            frac1 = Fraction(n1, d1)
-
-            d2 = random.choice(config["denominators"])
-            n2 = random.randint(1, min(d2 - 1, int(config["max_value"] * d2)))
-            frac2 = Fraction(n2, d2)
-
-            if frac1 != frac2:  # Ensure they're different
-                return frac1, frac2
+        return fraction_universe(tuple(config["denominators"]), config["max_value"])
 
     def _generate_options(self) -> List[str]:
         """Generate 4 multiple choice options."""
@@ -173,18 +200,17 @@ class AdvancedFractionComparisonExercise(Exercise):
 
     def _draw_option(self, screen, fonts: dict, option_text: str, index: int):
         """Draw a multiple choice option."""
-        y = self.OPTION_START_Y + index * (self.OPTION_HEIGHT + self.OPTION_SPACING)
+        rect = self._get_option_rect(index)
 
         # Draw option background
-        rect = pygame.Rect(self.OPTION_START_X, y, self.OPTION_WIDTH, self.OPTION_HEIGHT)
         pygame.draw.rect(screen, self.WHITE, rect)
         pygame.draw.rect(screen, self.BLACK, rect, 2)
 
         # Draw option text
         font = fonts.get('main', fonts.get('font'))
         if font:
-            text_surf = font.render(option_text, True, self.BLACK)
-            screen.blit(text_surf, (self.OPTION_START_X + 20, y + 10))
+            text_surf = render_text(font, option_text, True, self.BLACK)
+            screen.blit(text_surf, (rect.x + 20, rect.y + 10))
 
         # Highlight on hover
         mouse_pos = pygame.mouse.get_pos()
@@ -193,14 +219,20 @@ class AdvancedFractionComparisonExercise(Exercise):
 
     def _handle_mouse_click(self, pos: tuple) -> Any:
         """Handle mouse click on options."""
-        for i in range(4):
-            rect = self._get_option_rect(i)
+        for i, rect in enumerate(self.layout["options"]):
             if rect.collidepoint(pos):
-                if i >= 2:  # C or D clicked
-                    self.invalid_selection = True
-                return self._get_option_value(i)
+                return self._select_option(pos, i)
         return None
 
+    def _select_option(self, pos: tuple, index: Optional[int]) -> Any:
+        """Handle a click on the option with the given index (None for a click elsewhere)."""
+        self.invalid_selection = False
+        if index is None:
+            return None
+        if index >= 2:  # C or D clicked
+            self.invalid_selection = True
+        return self._get_option_value(index)
+
     def _get_option_value(self, index: int) -> Any:
         """Get the value of a selected option."""
         if index == 0:
@@ -212,13 +244,11 @@ class AdvancedFractionComparisonExercise(Exercise):
 
     def _get_option_rect(self, index: int) -> pygame.Rect:
         """Get the rectangle for an option."""
-        y = self.OPTION_START_Y + index * (self.OPTION_HEIGHT + self.OPTION_SPACING)
-        return pygame.Rect(self.OPTION_START_X, y, self.OPTION_WIDTH, self.OPTION_HEIGHT)
+        return self.layout["options"][index]
 
     def _highlight_option(self, screen, index: int, highlight_type: str):
         """Highlight a selected option."""
-        y = self.OPTION_START_Y + index * (self.OPTION_HEIGHT + self.OPTION_SPACING)
-        rect = pygame.Rect(self.OPTION_START_X, y, self.OPTION_WIDTH, self.OPTION_HEIGHT)
+        rect = self._get_option_rect(index)
 
         color = {
             "selected": self.ORANGE,
@@ -247,5 +277,5 @@ class AdvancedFractionComparisonExercise(Exercise):
 
         font = fonts.get('main', fonts.get('font'))
         if font:
-            text_surf = font.render(text, True, color)
+            text_surf = render_text(font, text, True, color)
             screen.blit(text_surf, (400 - text_surf.get_width()//2, 320))
\ No newline at end of file
@@ -1,15 +1,22 @@
-import random
 import math
 from fractions import Fraction
 from typing import Tuple, Any, Optional
 import pygame
 
-from core.exercise import Exercise
+from core.exercise import Exercise, InputHandlers, click_target
+from core.question_universe import fraction_universe
+from core.surface_cache import LRUCache, render_text
+
+# Rendered pies keyed by (fraction, size, colors); see _pie_surface
+_pie_cache = LRUCache(max_size=128)
 
 
 class FractionComparisonExercise(Exercise):
     """Exercise for comparing two fractions to determine which is larger or smaller."""
 
+    DENOMINATORS = [2, 3, 4, 5, 6, 8, 9, 10, 12]
+    QUESTION_STATE = ("frac1", "frac2", "correct_answer", "question_type", "question_text")
+
     def __init__(self):
         self.frac1: Optional[Fraction] = None
         self.frac2: Optional[Fraction] = None
@@ -33,13 +40,26 @@ class FractionComparisonExercise(Exercise):
         self.ORANGE = (255, 165, 0)
         self.GRAY = (200, 200, 200)
 
+    QUESTION_TYPES = ("larger", "smaller")
+
     def generate_question(self) -> Tuple[str, Any]:
-        """Generate a question asking which fraction is larger or smaller."""
-        # Generate two different fractions
-        self.frac1, self.frac2 = self._generate_fraction_pair()
+        """
+        Generate a question asking which fraction is larger or smaller.
 
-        # Randomly choose question type
-        self.question_type = random.choice(["larger", "smaller"])
+        Every ordered pair of different proper fractions, asked either way
+        round, is equally likely (or comes from the scheduler, see use_scheduler).
+        """
+        return self.question_at(self._next_question_index())
+
+    def question_count(self) -> int:
+        """Ordered pairs of different fractions times the two question types."""
+        return self._universe().pair_count() * len(self.QUESTION_TYPES)
+
+    def question_at(self, index: int) -> Tuple[str, Any]:
+        """Ask question number index (see question_count)."""
+        pair, question_type = divmod(index, len(self.QUESTION_TYPES))
+        self.frac1, self.frac2 = self._universe().pair(pair)
+        self.question_type = self.QUESTION_TYPES[question_type]
 
         # Determine correct answer
         if self.question_type == "larger":
@@ -69,7 +89,7 @@ class FractionComparisonExercise(Exercise):
         # Draw question text
         font = fonts.get('main', fonts.get('font'))
         if font:
-            question_surf = font.render(self.question_text, True, self.BLACK)
+            question_surf = render_text(font, self.question_text, True, self.BLACK)
             screen.blit(question_surf, (400 - question_surf.get_width()//2, 50))
 
         # Draw fraction 1
@@ -83,28 +103,48 @@ class FractionComparisonExercise(Exercise):
         # Draw hover effects
         mouse_pos = pygame.mouse.get_pos()
         if self._get_fraction_rect(1).collidepoint(mouse_pos):
-            self._draw_highlight(screen, self.FRAC1_X, self.FRAC_Y, self.BLUE)
+            self._draw_highlight(screen, 1, self.BLUE)
         if self._get_fraction_rect(2).collidepoint(mouse_pos):
-            self._draw_highlight(screen, self.FRAC2_X, self.FRAC_Y, self.BLUE)
+            self._draw_highlight(screen, 2, self.BLUE)
 
     def render_feedback(self, screen, guess: Any, correct: Any, fonts: dict):
         """Render feedback showing the selected and correct answers."""
         # Show selected answer
         if guess:
             if guess == self.frac1:
-                self._draw_selection_indicator(screen, self.FRAC1_X, self.FRAC_Y, "selected")
+                self._draw_selection_indicator(screen, 1, "selected")
             else:
-                self._draw_selection_indicator(screen, self.FRAC2_X, self.FRAC_Y, "selected")
+                self._draw_selection_indicator(screen, 2, "selected")
 
         # Show correct answer
         if correct == self.frac1:
-            self._draw_selection_indicator(screen, self.FRAC1_X, self.FRAC_Y, "correct")
+            self._draw_selection_indicator(screen, 1, "correct")
         else:
-            self._draw_selection_indicator(screen, self.FRAC2_X, self.FRAC_Y, "correct")
+            self._draw_selection_indicator(screen, 2, "correct")
 
         # Show result text
         self._draw_result_text(screen, fonts, guess == correct)
 
+    def register_hit_regions(self, regions):
+        """Both fractions are clickable and highlighted on hover."""
+        for rect, fraction in zip(self.layout["fractions"], (self.frac1, self.frac2)):
+            regions.add(rect, fraction, hover=True)
+
+    def input_handlers(self) -> InputHandlers:
+        """A click on a fraction selects it."""
+        return InputHandlers(click=click_target)
+
+    def build_layout(self) -> dict:
+        """Clickable areas of both fractions and the indicator frames around them."""
+        fractions = (
+            pygame.Rect(self.FRAC1_X, self.FRAC_Y, self.FRAC_WIDTH, self.FRAC_HEIGHT),
+            pygame.Rect(self.FRAC2_X, self.FRAC_Y, self.FRAC_WIDTH, self.FRAC_HEIGHT),
+        )
+        return {
+            "fractions": fractions,
+            "indicators": tuple(rect.inflate(10, 10) for rect in fractions),
+        }
+
     def handle_click(self, pos: tuple) -> Any:
         """Process mouse click and return selected fraction or None."""
         if self._get_fraction_rect(1).collidepoint(pos):
@@ -113,39 +153,44 @@ class FractionComparisonExercise(Exercise):
             return self.frac2
         return None
 
-    def _generate_fraction_pair(self) -> Tuple[Fraction, Fraction]:
-        """Generate two different fractions."""
-        denominators = [2, 3, 4, 5, 6, 8, 9, 10, 12]
-
-        while True:
-            d1 = random.choice(denominators)
-            n1 = random.randint(1, d1 - 1)  # Proper fraction
-            frac1 = Fraction(n1, d1)
-
-            d2 = random.choice(denominators)
-            n2 = random.randint(1, d2 - 1)
-            frac2 = Fraction(n2, d2)
-
-            if frac1 != frac2:  # Ensure they're different
-                return frac1, frac2
+    def _universe(self):
+        """Distinct proper fractions with the exercise's denominators."""
+        return fraction_universe(tuple(self.DENOMINATORS))
 
     def _get_fraction_rect(self, fraction_num: int) -> pygame.Rect:
         """Get clickable rectangle for a fraction."""
-        if fraction_num == 1:
-            return pygame.Rect(self.FRAC1_X, self.FRAC_Y,
-                              self.FRAC_WIDTH, self.FRAC_HEIGHT)
-        else:
-            return pygame.Rect(self.FRAC2_X, self.FRAC_Y,
-                              self.FRAC_WIDTH, self.FRAC_HEIGHT)
+        return self.layout["fractions"][0 if fraction_num == 1 else 1]
+
+    def warm_up(self):
+        """Render the pie of every fraction the exercise can ask about."""
+        universe = self._universe()
+        for index in range(len(universe)):
+            self._pie_surface(universe.fraction(index))
 
     def _draw_fraction_visual(self, screen, fraction: Fraction, x: int, y: int):
         """Draw pie chart representation of fraction."""
-        center_x = x + self.FRAC_WIDTH // 2
-        center_y = y + self.FRAC_HEIGHT // 2
+        screen.blit(self._pie_surface(fraction), (x, y))
+
+    def _pie_surface(self, fraction: Fraction) -> pygame.Surface:
+        """Return the cached pie of a fraction, rendering it on first use."""
+        key = (fraction, self.FRAC_WIDTH, self.FRAC_HEIGHT, self.BLACK, self.BLUE)
+        return _pie_cache.get(key, lambda: self._render_pie(fraction))
+
+    def _render_pie(self, fraction: Fraction) -> pygame.Surface:
+        """
+        Render a pie chart of a fraction on a transparent surface of the fraction area's size.
+
+        Shapes are drawn without antialiasing, so every pixel is either fully
+        opaque or fully transparent and blitting gives the same pixels as
+        drawing on the screen directly.
+        """
+        surface = pygame.Surface((self.FRAC_WIDTH, self.FRAC_HEIGHT), pygame.SRCALPHA)
+        center_x = self.FRAC_WIDTH // 2
+        center_y = self.FRAC_HEIGHT // 2
         radius = min(self.FRAC_WIDTH, self.FRAC_HEIGHT) // 2 - 10
 
         # Draw circle outline
-        pygame.draw.circle(screen, self.BLACK, (center_x, center_y), radius, 2)
+        pygame.draw.circle(surface, self.BLACK, (center_x, center_y), radius, 2)
 
         # Draw filled portion
         if float(fraction) > 0:
@@ -163,23 +208,24 @@ class FractionComparisonExercise(Exercise):
                 points.append((px, py))
 
             if len(points) > 2:
-                pygame.draw.polygon(screen, self.BLUE, points)
+                pygame.draw.polygon(surface, self.BLUE, points)
+
+        return surface
 
     def _draw_fraction_text(self, screen, fonts: dict, text: str, x: int, y: int):
         """Draw fraction text below visual."""
         font = fonts.get('main', fonts.get('font'))
         if font:
-            text_surf = font.render(text, True, self.BLACK)
+            text_surf = render_text(font, text, True, self.BLACK)
             text_x = x + (self.FRAC_WIDTH - text_surf.get_width()) // 2
             text_y = y + self.FRAC_HEIGHT + 10
             screen.blit(text_surf, (text_x, text_y))
 
-    def _draw_highlight(self, screen, x: int, y: int, color: tuple):
+    def _draw_highlight(self, screen, fraction_num: int, color: tuple):
         """Draw highlight border around clickable area."""
-        rect = pygame.Rect(x, y, self.FRAC_WIDTH, self.FRAC_HEIGHT)
-        pygame.draw.rect(screen, color, rect, 3)
+        pygame.draw.rect(screen, color, self._get_fraction_rect(fraction_num), 3)
 
-    def _draw_selection_indicator(self, screen, x: int, y: int, indicator_type: str):
+    def _draw_selection_indicator(self, screen, fraction_num: int, indicator_type: str):
         """Draw visual indicator around fraction."""
         color = {
             "selected": self.ORANGE,
@@ -187,7 +233,7 @@ class FractionComparisonExercise(Exercise):
             "incorrect": self.RED
         }.get(indicator_type, self.BLACK)
 
-        rect = pygame.Rect(x-5, y-5, self.FRAC_WIDTH+10, self.FRAC_HEIGHT+10)
+        rect = self.layout["indicators"][0 if fraction_num == 1 else 1]
         pygame.draw.rect(screen, color, rect, 4)
 
     def _draw_result_text(self, screen, fonts: dict, is_correct: bool):
@@ -201,5 +247,5 @@ class FractionComparisonExercise(Exercise):
 
         font = fonts.get('main', fonts.get('font'))
         if font:
-            text_surf = font.render(text, True, color)
+            text_surf = render_text(font, text, True, color)
             screen.blit(text_surf, (400 - text_surf.get_width()//2, 350))
\ No newline at end of file
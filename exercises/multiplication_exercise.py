@@ -1,36 +1,102 @@
-import random
 import math
 from fractions import Fraction
-from typing import Tuple, Any, Optional, List
+from typing import Tuple, Any, Optional, Set
 import pygame
 
-from core.exercise import Exercise
-
-
-class GridCell:
-    """Represents a single cell in the multiplication grid."""
-
-    def __init__(self, x: int, y: int, width: int, height: int):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.clicked = False
-        self.is_correct = False  # Part of the actual product area
-
-    def draw(self, screen: pygame.Surface, colors: dict):
-        """Draw the cell with appropriate color."""
-        if self.is_correct:
-            color = colors['correct']  # Green for correct area
-        elif self.clicked:
-            color = colors['clicked']  # Blue for user selection
+from core.exercise import Exercise, InputHandlers
+from core.layers import StaticLayer
+from core.surface_cache import render_text
+
+
+class GridModel:
+    """
+    Cell state of the multiplication grid.
+
+    Clicked and correct flags are kept in bytearrays, one byte per cell in
+    row-major order, so large grids cost no per-cell objects. The cell under a
+    point is found arithmetically and the number of clicked cells is updated
+    on every toggle, so a click takes the same time on any grid size.
+    """
+
+    def __init__(self, cols: int, rows: int, x: int, y: int, cell_width: int, cell_height: int):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cols, rows: Number of cells
+            x, y: Screen position of the top-left cell
+            cell_width, cell_height: Cell size in pixels
+        """
+        self.cols = cols
+        self.rows = rows
+        self.x = x
+        self.y = y
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.clicked = bytearray(cols * rows)
+        self.correct = bytearray(cols * rows)
+        self.clicked_count = 0
+        self.correct_count = 0
+        self.clicked_indices: Set[int] = set()
+
+    def __len__(self) -> int:
+        return self.cols * self.rows
+
+    def set_correct_area(self, correct_cols: int, correct_rows: int):
+        """Mark the top-left correct_cols x correct_rows cells as the correct area."""
+        correct_cols = max(0, min(correct_cols, self.cols))
+        correct_rows = max(0, min(correct_rows, self.rows))
+        self.correct = bytearray(self.cols * self.rows)
+        row_mask = b"\x01" * correct_cols
+        for row in range(correct_rows):
+            start = row * self.cols
+            self.correct[start:start + correct_cols] = row_mask
+        self.correct_count = correct_cols * correct_rows
+
+    def cell_at(self, pos: tuple) -> Optional[int]:
+        """Return the index of the cell containing a screen position, or None."""
+        dx = pos[0] - self.x
+        dy = pos[1] - self.y
+        if dx < 0 or dy < 0:
+            return None
+        col = dx // self.cell_width
+        row = dy // self.cell_height
+        if col >= self.cols or row >= self.rows:
+            return None
+        return row * self.cols + col
+
+    def toggle(self, index: int) -> bool:
+        """Toggle a cell's clicked state and return the new state."""
+        clicked = not self.clicked[index]
+        self.clicked[index] = clicked
+        if clicked:
+            self.clicked_count += 1
+            self.clicked_indices.add(index)
         else:
-            color = colors['empty']  # White for unselected
+            self.clicked_count -= 1
+            self.clicked_indices.discard(index)
+        return clicked
 
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, colors['border'], self.rect, 1)  # Border
+    def cell_rect(self, index: int, origin: tuple = (0, 0)) -> Tuple[int, int, int, int]:
+        """
+        Return (x, y, width, height) of a cell.
+
+        Args:
+            index: Cell index
+            origin: Screen position of the target surface's top-left corner
+        """
+        row, col = divmod(index, self.cols)
+        return (self.x + col * self.cell_width - origin[0],
+                self.y + row * self.cell_height - origin[1],
+                self.cell_width, self.cell_height)
 
 
 class MultiplicationExercise(Exercise):
     """Exercise for teaching fraction multiplication through visual grid representations."""
 
+    # The grid is part of the state: every question gets a new GridModel
+    QUESTION_STATE = ("frac1", "frac2", "correct_answer", "question_text", "grid")
+
     def __init__(self, difficulty: str = "easy"):
         self.difficulty = difficulty
 
@@ -47,6 +113,11 @@ class MultiplicationExercise(Exercise):
             "hard": {
                 "grid_size": (8, 8),  # 8x8 grid = 64 cells
                 "fractions": [(1, 2), (1, 3), (2, 3), (1, 4), (3, 4), (2, 5), (3, 5), (1, 6), (5, 6)]  # Complex fractions
+            },
+            "expert": {
+                "grid_size": (24, 24),  # 24x24 grid = 576 cells
+                "fractions": [(1, 12), (5, 12), (7, 12), (11, 12), (1, 8), (3, 8), (5, 8), (7, 8),
+                              (1, 6), (5, 6), (2, 3), (3, 4)]  # Twelfths and eighths
             }
         }
 
@@ -58,8 +129,8 @@ class MultiplicationExercise(Exercise):
 
         # Grid state
         self.grid_size = self.difficulty_config[difficulty]["grid_size"]
-        self.cells: List[GridCell] = []
-        self.clicked_cells = 0
+        self.grid: Optional[GridModel] = None
+        self._grid_layer: Optional[StaticLayer] = None
 
         # UI layout constants
         self.GRID_WIDTH = 400
@@ -79,12 +150,20 @@ class MultiplicationExercise(Exercise):
 
     def generate_question(self) -> Tuple[str, Any]:
         """Generate a multiplication question with visual grid."""
-        config = self.difficulty_config[self.difficulty]
-        fractions = config["fractions"]
+        return self.question_at(self._next_question_index())
+
+    def question_count(self) -> int:
+        """Every ordered pair of the difficulty's fractions."""
+        return len(self.difficulty_config[self.difficulty]["fractions"]) ** 2
 
-        # Generate two fractions
-        self.frac1 = random.choice(fractions)
-        self.frac2 = random.choice(fractions)
+    def question_at(self, index: int) -> Tuple[str, Any]:
+        """Ask question number index (see question_count)."""
+        fractions = self.difficulty_config[self.difficulty]["fractions"]
+
+        # Pick the two fractions
+        first, second = divmod(index, len(fractions))
+        self.frac1 = fractions[first]
+        self.frac2 = fractions[second]
 
         # Calculate correct answer (product)
         self.correct_answer = (self.frac1[0] * self.frac2[0]) / (self.frac1[1] * self.frac2[1])
@@ -128,14 +207,14 @@ class MultiplicationExercise(Exercise):
         # Draw question text
         main_font = fonts.get('main', fonts.get('font'))
         if main_font:
-            question_surf = main_font.render(self.question_text, True, self.colors['text'])
+            question_surf = render_text(main_font, self.question_text, True, self.colors['text'])
             screen.blit(question_surf, (400 - question_surf.get_width()//2, 50))
 
         # Draw instruction text
         small_font = fonts.get('small', fonts.get('font'))
         if small_font:
             instruction = "Click on cells to estimate the shaded area"
-            instruction_surf = small_font.render(instruction, True, self.colors['instruction'])
+            instruction_surf = render_text(small_font, instruction, True, self.colors['instruction'])
             screen.blit(instruction_surf, (400 - instruction_surf.get_width()//2, 100))
 
         # Draw the grid
@@ -144,7 +223,7 @@ class MultiplicationExercise(Exercise):
         # Draw estimation counter
         if small_font:
             estimate_text = f"Cells selected: {self.clicked_cells}"
-            estimate_surf = small_font.render(estimate_text, True, self.colors['text'])
+            estimate_surf = render_text(small_font, estimate_text, True, self.colors['text'])
             screen.blit(estimate_surf, (50, self.GRID_START_Y + self.GRID_HEIGHT + 20))
 
     def render_feedback(self, screen, guess: Any, correct: Any, fonts: dict):
@@ -166,69 +245,99 @@ class MultiplicationExercise(Exercise):
             ]
 
             for i, line in enumerate(feedback_lines):
-                text_surf = small_font.render(line, True, self.colors['text'])
+                text_surf = render_text(small_font, line, True, self.colors['text'])
                 screen.blit(text_surf, (50, self.GRID_START_Y + self.GRID_HEIGHT + 50 + i * 25))
 
+    @property
+    def clicked_cells(self) -> int:
+        """Number of cells the user has selected."""
+        return self.grid.clicked_count if self.grid else 0
+
     def handle_click(self, pos: tuple) -> Any:
         """Handle mouse click on the grid."""
-        for cell in self.cells:
-            if cell.rect.collidepoint(pos):
-                # Toggle cell selection
-                cell.clicked = not cell.clicked
-                self.clicked_cells = sum(1 for c in self.cells if c.clicked)
-                return self.clicked_cells  # Return current count as the guess
-        return None
+        if self.grid is None:
+            return None
+        index = self.grid.cell_at(pos)
+        if index is None:
+            return None
+        # Toggle cell selection
+        self.grid.toggle(index)
+        return self.grid.clicked_count  # Return current count as the guess
+
+    def register_hit_regions(self, regions):
+        """The grid is one clickable region; handle_click finds the cell."""
+        grid = self.grid
+        regions.add(pygame.Rect(grid.x, grid.y, grid.cols * grid.cell_width, grid.rows * grid.cell_height),
+                    "grid")
+
+    def input_handlers(self) -> InputHandlers:
+        """Clicks on the grid toggle cells."""
+        return InputHandlers(click=lambda pos, target: self.handle_click(pos) if target == "grid" else None)
 
     def _setup_grid(self):
         """Initialize the grid cells based on geometric fraction representation."""
-        self.cells = []
-        cell_width = self.GRID_WIDTH // self.grid_size[0]
-        cell_height = self.GRID_HEIGHT // self.grid_size[1]
+        cols, rows = self.grid_size
+        self.grid = GridModel(cols, rows, self.GRID_START_X, self.GRID_START_Y,
+                              self.GRID_WIDTH // cols, self.GRID_HEIGHT // rows)
 
         # Calculate the ratios for correct area
         frac1_ratio = self.frac1[0] / self.frac1[1]  # First fraction (width)
         frac2_ratio = self.frac2[0] / self.frac2[1]  # Second fraction (height)
 
-        # Create cells and mark correct ones based on geometric intersection
-        for row in range(self.grid_size[1]):
-            for col in range(self.grid_size[0]):
-                x = self.GRID_START_X + col * cell_width
-                y = self.GRID_START_Y + row * cell_height
-
-                cell = GridCell(x, y, cell_width, cell_height)
-                # A cell is correct if it's within the fraction ratios
-                cell.is_correct = (col < frac1_ratio * self.grid_size[0]) and (row < frac2_ratio * self.grid_size[1])
-                self.cells.append(cell)
-
-        # Reset clicked state
-        self.clicked_cells = 0
+        # A cell is correct if it's within the fraction ratios
+        correct_cols = sum(1 for col in range(cols) if col < frac1_ratio * cols)
+        correct_rows = sum(1 for row in range(rows) if row < frac2_ratio * rows)
+        self.grid.set_correct_area(correct_cols, correct_rows)
 
     def _draw_grid(self, screen):
         """Draw the multiplication grid."""
-        # Draw grid background
-        grid_rect = pygame.Rect(self.GRID_START_X, self.GRID_START_Y,
-                               self.GRID_WIDTH, self.GRID_HEIGHT)
-        pygame.draw.rect(screen, self.colors['border'], grid_rect, 2)
+        # The grid as it looks before any click is painted once per question
+        if self._grid_layer is None:
+            self._grid_layer = StaticLayer(self.layout["grid"], self.resources.palette('ui')['background'])
+        self._grid_layer.draw(screen, (self.frac1, self.frac2, self.grid_size), self._paint_grid)
 
-        # Draw all cells
-        for cell in self.cells:
-            cell.draw(screen, self.colors)
+        # Only the clicked cells change during a question; correct cells stay green
+        grid = self.grid
+        for index in grid.clicked_indices:
+            if not grid.correct[index]:
+                self._draw_cell(screen, index, self.colors['clicked'])
 
         # Draw fraction labels to show the concept
         if self.frac1 and self.frac2:
             self._draw_fraction_labels(screen)
 
+    def _paint_grid(self, surface: pygame.Surface, origin: tuple):
+        """Paint the grid outline and every cell in its unclicked state."""
+        outline = self.layout["grid"].move(-origin[0], -origin[1])
+        pygame.draw.rect(surface, self.colors['border'], outline, 2)
+
+        grid = self.grid
+        for index in range(len(grid)):
+            color = self.colors['correct'] if grid.correct[index] else self.colors['empty']
+            self._draw_cell(surface, index, color, origin)
+
+    def _draw_cell(self, surface: pygame.Surface, index: int, color: tuple, origin: tuple = (0, 0)):
+        """Fill one cell and draw its border."""
+        rect = self.grid.cell_rect(index, origin)
+        pygame.draw.rect(surface, color, rect)
+        pygame.draw.rect(surface, self.colors['border'], rect, 1)  # Border
+
+    def build_layout(self) -> dict:
+        """Outline of the grid."""
+        return {"grid": pygame.Rect(self.GRID_START_X, self.GRID_START_Y,
+                                    self.GRID_WIDTH, self.GRID_HEIGHT)}
+
     def _draw_fraction_labels(self, screen):
         """Draw labels showing which parts represent which fractions."""
         # Label for the "of" fraction (vertical division)
-        font = pygame.font.Font(None, 24)
+        font = self.resources.font('label')
         of_label = f"{self.frac2[0]}/{self.frac2[1]} of the area"
-        of_surf = font.render(of_label, True, self.colors['text'])
+        of_surf = render_text(font, of_label, True, self.colors['text'])
         screen.blit(of_surf, (self.GRID_START_X + self.GRID_WIDTH + 10, self.GRID_START_Y))
 
         # Label for the first fraction (horizontal division)
         frac_label = f"{self.frac1[0]}/{self.frac1[1]} of the width"
-        frac_surf = font.render(frac_label, True, self.colors['text'])
+        frac_surf = render_text(font, frac_label, True, self.colors['text'])
         screen.blit(frac_surf, (self.GRID_START_X, self.GRID_START_Y - 30))
 
     def _show_correct_answer(self, screen):
@@ -2,12 +2,15 @@ import random
 from typing import Tuple, Any, List, Optional
 import pygame
 
-from core.exercise import Exercise
+from core.exercise import Exercise, InputHandlers, click_target
+from core.surface_cache import render_text
 
 
 class MultiplicationExerciseNum(Exercise):
     """Multiple-choice multiplication exercise."""
 
+    QUESTION_STATE = ("a", "b", "correct_answer", "options", "question_text")
+
     def __init__(self, max_number: int = 12):
         self.max_number = max(1, min(max_number, 12))
 
@@ -34,8 +37,17 @@ class MultiplicationExerciseNum(Exercise):
 
     def generate_question(self) -> Tuple[str, Any]:
         """Generate a multiplication question with 4 choices."""
-        self.a = random.randint(2, self.max_number)
-        self.b = random.randint(2, self.max_number)
+        return self.question_at(self._next_question_index())
+
+    def question_count(self) -> int:
+        """Every ordered pair of factors from 2 to max_number."""
+        return (self.max_number - 1) ** 2
+
+    def question_at(self, index: int) -> Tuple[str, Any]:
+        """Ask question number index (see question_count)."""
+        factors = self.max_number - 1
+        self.a = 2 + index // factors
+        self.b = 2 + index % factors
         self.correct_answer = self.a * self.b
 
         self.options = self._generate_options(self.correct_answer)
@@ -60,7 +72,7 @@ class MultiplicationExerciseNum(Exercise):
 
         # Question text
         if font:
-            q_surf = font.render(self.question_text, True, self.BLACK)
+            q_surf = render_text(font, self.question_text, True, self.BLACK)
             screen.blit(q_surf, (400 - q_surf.get_width() // 2, 80))
 
         # Draw options
@@ -78,7 +90,7 @@ class MultiplicationExerciseNum(Exercise):
             text = f"{label}. {value}"
 
             if small_font:
-                text_surf = small_font.render(text, True, self.BLACK)
+                text_surf = render_text(small_font, text, True, self.BLACK)
                 screen.blit(
                     text_surf,
                     (
@@ -105,9 +117,29 @@ class MultiplicationExerciseNum(Exercise):
             text = "Correct! ✓" if is_correct else "Incorrect ✗"
             color = self.GREEN if is_correct else self.RED
 
-            text_surf = font.render(text, True, color)
+            text_surf = render_text(font, text, True, color)
             screen.blit(text_surf, (400 - text_surf.get_width() // 2, 360))
 
+    def register_hit_regions(self, regions):
+        """Every answer choice is clickable and highlighted on hover."""
+        for rect, value in zip(self.layout["options"], self.options):
+            regions.add(rect, value, hover=True)
+
+    def input_handlers(self) -> InputHandlers:
+        """A click on a choice selects its value."""
+        return InputHandlers(click=click_target)
+
+    def build_layout(self) -> dict:
+        """Rects of the four answer choices."""
+        return {
+            "options": tuple(
+                pygame.Rect(self.OPTION_START_X,
+                            self.OPTION_START_Y + i * (self.OPTION_HEIGHT + self.OPTION_GAP),
+                            self.OPTION_WIDTH, self.OPTION_HEIGHT)
+                for i in range(4)
+            ),
+        }
+
     def handle_click(self, pos: tuple) -> Any:
         """Return selected answer based on mouse click."""
         for i, value in enumerate(self.options):
@@ -134,9 +166,4 @@ class MultiplicationExerciseNum(Exercise):
 
     def _get_option_rect(self, index: int) -> pygame.Rect:
         """Get rectangle for option A/B/C/D."""
-        return pygame.Rect(
-            self.OPTION_START_X,
-            self.OPTION_START_Y + index * (self.OPTION_HEIGHT + self.OPTION_GAP),
-            self.OPTION_WIDTH,
-            self.OPTION_HEIGHT
-        )
+        return self.layout["options"][index]
@@ -1,32 +1,52 @@
-import random
-from fractions import Fraction
-from typing import Tuple, Any
+from typing import Tuple, Any, Optional
 import pygame
 
-from core.exercise import Exercise
+from core.exercise import Exercise, InputHandlers
+from core.question_universe import fraction_universe
+from core.layers import StaticLayer
+from core.surface_cache import render_text
 
 
 class NumberLineExercise(Exercise):
     """Exercise for placing fractions/decimals on a number line from 0 to 1."""
 
+    QUESTION_STATE = ("_question_text", "_correct_answer")
+    DENOMINATORS = tuple(range(2, 16))
+    DECIMAL_RANGE = (10, 90)  # Hundredths
+
     def __init__(self):
         self._question_text = ""
         self._correct_answer = None
         self.LINE_START_X = 100
         self.LINE_END_X = 700  # WIDTH - 100, assuming WIDTH=800
+        self._line_layer: Optional[StaticLayer] = None
 
     def generate_question(self) -> Tuple[str, Any]:
-        """Generate a random fraction or decimal between 0 and 1."""
-        if random.choice([True, False]):
-            # Generate a fraction
-            numerator = random.randint(1, 14)
-            denominator = random.randint(numerator + 1, 15)
-            frac = Fraction(numerator, denominator)
+        """
+        Generate a random fraction or decimal between 0 and 1.
+
+        Every distinct proper fraction with a denominator up to 15, and every
+        decimal from 0.10 to 0.90 in steps of 0.01, is equally likely (or
+        comes from the scheduler, see use_scheduler).
+        """
+        return self.question_at(self._next_question_index())
+
+    def question_count(self) -> int:
+        """The fractions followed by the decimals."""
+        low, high = self.DECIMAL_RANGE
+        return len(fraction_universe(self.DENOMINATORS)) + high - low + 1
+
+    def question_at(self, index: int) -> Tuple[str, Any]:
+        """Ask question number index (see question_count)."""
+        fractions = fraction_universe(self.DENOMINATORS)
+        if index < len(fractions):
+            # A fraction
+            frac = fractions.fraction(index)
             value = float(frac)
             display_text = str(frac)
         else:
-            # Generate a decimal
-            value = round(random.uniform(0.1, 0.9), 2)
+            # A decimal
+            value = (self.DECIMAL_RANGE[0] + index - len(fractions)) / 100
             display_text = str(value)
 
         self._question_text = f"Click where you think {display_text} is"
@@ -63,8 +83,13 @@ class NumberLineExercise(Exercise):
 
     def render_question(self, screen, fonts: dict):
         """Render the number line and question."""
-        # Draw the number line
-        self._draw_number_line(screen, fonts.get('small', fonts.get('font')))
+        # Draw the number line; it never changes, so it is painted once and blitted
+        font = fonts.get('small', fonts.get('font'))
+        if self._line_layer is None:
+            self._line_layer = StaticLayer(self.layout["line_layer"],
+                                           self.resources.palette('ui')['background'])
+        self._line_layer.draw(screen, font,
+                              lambda surface, origin: self._draw_number_line(surface, font, origin))
 
         # Draw the question text
         super().render_question(screen, fonts)
@@ -93,23 +118,49 @@ class NumberLineExercise(Exercise):
 
             for i, line in enumerate(feedback_lines):
                 color = (0, 255, 0) if distance < 0.1 else (0, 0, 0)
-                text_surf = small_font.render(line, True, color)
+                text_surf = render_text(small_font, line, True, color)
                 screen.blit(text_surf, (50, 300 + i * 25))
 
-    def _draw_number_line(self, screen, font):
-        """Draw the number line from 0 to 1 with tick marks."""
+    def register_hit_regions(self, regions):
+        """Clicks anywhere above or below the line, between its ends, place a guess."""
+        regions.add(pygame.Rect(self.LINE_START_X, regions.bounds.top,
+                                self.LINE_END_X - self.LINE_START_X + 1, regions.bounds.height),
+                    "line")
+
+    def input_handlers(self) -> InputHandlers:
+        """A click places the guess at the clicked x position."""
+        return InputHandlers(click=lambda pos, target: self.get_click_position(pos[0])
+                             if target == "line" else None)
+
+    def build_layout(self) -> dict:
+        """Area covered by the line, its ticks and their labels."""
+        return {"line_layer": pygame.Rect(self.LINE_START_X - 30, 185,
+                                          self.LINE_END_X - self.LINE_START_X + 60, 55)}
+
+    def _draw_number_line(self, screen, font, origin: tuple = (0, 0)):
+        """
+        Draw the number line from 0 to 1 with tick marks.
+
+        Args:
+            screen: Surface to draw on
+            font: Font for the tick labels
+            origin: Screen position of the surface's top-left corner
+        """
+        ox, oy = origin
+        start_x, end_x = self.LINE_START_X - ox, self.LINE_END_X - ox
+
         # Main line
-        pygame.draw.line(screen, (0, 0, 0), (self.LINE_START_X, 200), (self.LINE_END_X, 200), 3)
+        pygame.draw.line(screen, (0, 0, 0), (start_x, 200 - oy), (end_x, 200 - oy), 3)
 
         # Tick marks and labels
         if font:
             for i in range(11):
-                x = self.LINE_START_X + (self.LINE_END_X - self.LINE_START_X) * i // 10
-                pygame.draw.line(screen, (0, 0, 0), (x, 190), (x, 210), 2)
+                x = start_x + (end_x - start_x) * i // 10
+                pygame.draw.line(screen, (0, 0, 0), (x, 190 - oy), (x, 210 - oy), 2)
 
                 # Label
-                label = font.render(str(i/10), True, (0, 0, 0))
-                screen.blit(label, (x - label.get_width()//2, 215))
+                label = render_text(font, str(i/10), True, (0, 0, 0))
+                screen.blit(label, (x - label.get_width()//2, 215 - oy))
 
     def get_click_position(self, mouse_x: int, screen_width: int = 800) -> float:
         """
@@ -0,0 +1,97 @@
+"""
+Registry of exercise types.
+
+Maps exercise type ids to the module and class implementing them. Modules are
+only imported when an exercise of that type is created, so the game pays only
+for the exercises it enables, and a missing or broken module only disables
+that exercise.
+
+An exercise config is a list of entries such as::
+
+    {"type": "multiplication_choice", "params": {"max_number": 7}}
+
+where ``params`` are passed to the exercise class constructor.
+"""
+
+import importlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.exercise import Exercise
+
+# type id -> (module, class name)
+EXERCISE_TYPES: Dict[str, Tuple[str, str]] = {
+    "number_line": ("exercises.number_line_exercise", "NumberLineExercise"),
+    "fraction_comparison": ("exercises.fraction_comparison_exercise", "FractionComparisonExercise"),
+    "advanced_fraction_comparison": ("exercises.advanced_fraction_comparison_exercise",
+                                     "AdvancedFractionComparisonExercise"),
+    "multiplication": ("exercises.multiplication_exercise", "MultiplicationExercise"),
+    "multiplication_choice": ("exercises.multiplication_exercise_num", "MultiplicationExerciseNum"),
+    "double_number_line": ("exercises.double_number_line_exercise", "DoubleNumberLineExercise"),
+}
+
+# Imported classes, or None for types whose module failed to import
+_classes: Dict[str, Optional[type]] = {}
+
+
+def get_exercise_class(exercise_type: str) -> Optional[type]:
+    """
+    Import and return the class of an exercise type.
+
+    Args:
+        exercise_type: Type id, a key of EXERCISE_TYPES
+
+    Returns:
+        The exercise class, or None if its module cannot be imported
+    """
+    if exercise_type in _classes:
+        return _classes[exercise_type]
+    if exercise_type not in EXERCISE_TYPES:
+        raise ValueError(f"Unknown exercise type: {exercise_type}")
+
+    module_name, class_name = EXERCISE_TYPES[exercise_type]
+    try:
+        cls = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        print(f"Exercise '{exercise_type}' disabled: {e}")
+        cls = None
+    _classes[exercise_type] = cls
+    return cls
+
+
+def create_exercises(config: List[Dict[str, Any]]) -> List[Exercise]:
+    """
+    Build exercises from a config.
+
+    Args:
+        config: Entries with a "type" id and optional "params" for the
+            constructor. Entries with "enabled": False are skipped.
+
+    Returns:
+        The exercises that could be created, in config order
+    """
+    exercises = []
+    for entry in config:
+        if not entry.get("enabled", True):
+            continue
+        exercise = create_exercise(entry)
+        if exercise is not None:
+            exercises.append(exercise)
+    return exercises
+
+
+def create_exercise(entry: Dict[str, Any]) -> Optional[Exercise]:
+    """
+    Build the exercise of one config entry.
+
+    Returns:
+        The exercise, or None if its module is missing or the constructor
+        rejects the params
+    """
+    cls = get_exercise_class(entry["type"])
+    if cls is None:
+        return None
+    try:
+        return cls(**entry.get("params", {}))
+    except Exception as e:
+        print(f"Exercise '{entry['type']}' disabled: {e}")
+        return None
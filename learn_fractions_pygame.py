@@ -4,6 +4,8 @@ import sys
 import datetime
 from fractions import Fraction
 
+from core.layers import StaticLayer
+
 # Initialize Pygame
 pygame.init()
 
@@ -45,19 +47,30 @@ def random_number():
         value = round(random.uniform(0.1, 0.9), 2)
         return value, str(value)
 
-def draw_number_line():
-    """Draw the number line from 0 to 1"""
+# The number line never changes, so it is painted once off-screen and blitted
+number_line_layer = StaticLayer(
+    pygame.Rect(LINE_START_X - 30, LINE_Y - 15, LINE_END_X - LINE_START_X + 60, 55), WHITE)
+
+def paint_number_line(surface, origin):
+    """Paint the number line from 0 to 1, offset by the surface's screen position"""
+    ox, oy = origin
+    line_y = LINE_Y - oy
+
     # Main line
-    pygame.draw.line(screen, BLACK, (LINE_START_X, LINE_Y), (LINE_END_X, LINE_Y), 3)
+    pygame.draw.line(surface, BLACK, (LINE_START_X - ox, line_y), (LINE_END_X - ox, line_y), 3)
 
     # Tick marks and labels
     for i in range(11):
-        x = LINE_START_X + (LINE_END_X - LINE_START_X) * i // 10
-        pygame.draw.line(screen, BLACK, (x, LINE_Y - 10), (x, LINE_Y + 10), 2)
+        x = LINE_START_X - ox + (LINE_END_X - LINE_START_X) * i // 10
+        pygame.draw.line(surface, BLACK, (x, line_y - 10), (x, line_y + 10), 2)
 
         # Label
         label = small_font.render(str(i/10), True, BLACK)
-        screen.blit(label, (x - label.get_width()//2, LINE_Y + 15))
+        surface.blit(label, (x - label.get_width()//2, line_y + 15))
+
+def draw_number_line():
+    """Draw the number line from 0 to 1"""
+    number_line_layer.draw(screen, None, paint_number_line)
 
 def draw_button(text, x, y, width, height, color=GRAY):
     """Draw a button"""
@@ -1,17 +1,94 @@
 import pygame
 import sys
 
+from core.exercise_catalog import ExerciseCatalog
 from core.game_manager import GameManager
-from exercises.multiplication_exercise_num import MultiplicationExerciseNum
-from exercises.number_line_exercise import NumberLineExercise
-from exercises.fraction_comparison_exercise import FractionComparisonExercise
-from exercises.advanced_fraction_comparison_exercise import AdvancedFractionComparisonExercise
-from exercises.multiplication_exercise import MultiplicationExercise
-from exercises.double_number_line_exercise import DoubleNumberLineExercise
+from core.progress_logger import BackgroundProgressLogger
+from core.question_scheduler import SchedulerStore
+from core.review_scheduler import ReviewScheduler
+from core.resources import ResourceManager
+from core.surface_cache import text_cache
+
+# Exercises offered in the game, with their weights; see exercises.registry
+# for the available types. Edits to the file are picked up while the game runs.
+CATALOG_FILE = "exercise_catalog.json"
+
+# Where each exercise's position in its no-repeat question order is kept
+# between sessions, and how many recent questions are never asked again
+SCHEDULER_FILE = "question_scheduler.json"
+REPEAT_COOLDOWN = 20
+
+# Attempts are appended to LOG_FILE; the review schedule derived from it is
+# snapshotted to REVIEW_SNAPSHOT_FILE so startup only reads new attempts
+LOG_FILE = "progress_pygame.log"
+REVIEW_SNAPSHOT_FILE = "review_snapshot.json"
+
+# Longest time the event loop sleeps without an event
+IDLE_TIMEOUT_MS = 500
+
+
+def run_event_loop(game_manager: GameManager):
+    """
+    Run the game until the window is closed, redrawing only on changes.
+
+    Blocks on pygame.event.wait between events, so an idle game uses almost no
+    CPU. After each batch of events only the areas the game manager marked
+    dirty are redrawn and pushed to the display. Questions used up are
+    prefetched again, and catalog changes picked up, once no events are waiting.
+    """
+    running = True
+    while running:
+        event = pygame.event.wait(IDLE_TIMEOUT_MS)
+        events = [event] + pygame.event.get() if event.type != pygame.NOEVENT else []
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            else:
+                game_manager.handle_input(event)
+
+        dirty_rects = game_manager.render_dirty()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+
+        if not pygame.event.peek():
+            game_manager.reload_catalog()
+            game_manager.refill_questions()
+
+
+def run_continuous_loop(game_manager: GameManager):
+    """Run the game until the window is closed, redrawing every frame at 60 FPS."""
+    clock = pygame.time.Clock()
+    running = True
+
+    while running:
+        # Handle events
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            else:
+                # Let game manager handle all input events (mouse and keyboard)
+                game_manager.handle_input(event)
+
+        # Render everything
+        game_manager.render()
+
+        # Update display
+        pygame.display.flip()
+
+        # Prefetch questions in the rest of the frame
+        game_manager.reload_catalog()
+        game_manager.refill_questions()
+        clock.tick(60)
 
 
-def main():
-    """Main entry point for the refactored fractions learning game."""
+def main(render_mode: str = "event"):
+    """
+    Main entry point for the refactored fractions learning game.
+
+    Args:
+        render_mode: "event" to redraw only what changed, or "continuous" to
+            redraw the whole screen every frame
+    """
     # Initialize Pygame
     pygame.init()
 
@@ -30,56 +107,48 @@ def main():
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Learn Fractions - SOLID Refactored Edition")
 
-    # Fonts
-    fonts = {
-        'main': pygame.font.Font(None, 36),
-        'small': pygame.font.Font(None, 24),
-        'font': pygame.font.Font(None, 36),  # Alias for backward compatibility
-    }
-
-    # Create exercises
-    exercises = [
-        NumberLineExercise(),
-        FractionComparisonExercise(),
-        # AdvancedFractionComparisonExercise(difficulty="easy"),
-        # AdvancedFractionComparisonExercise(difficulty="medium"),
-        AdvancedFractionComparisonExercise(difficulty="hard"),
-        # MultiplicationExercise(difficulty="easy"),
-        MultiplicationExerciseNum(5),
-        MultiplicationExerciseNum(6),
-        MultiplicationExerciseNum(7),
-        # MultiplicationExercise(difficulty="medium"),
-        # MultiplicationExercise(difficulty="hard"),
-        DoubleNumberLineExercise(difficulty="easy"),
-        DoubleNumberLineExercise(difficulty="medium"),
-        # DoubleNumberLineExercise(difficulty="hard"),  # Commented out for initial testing
-    ]
-
-    # Create game manager
-    game_manager = GameManager(exercises, screen, fonts)
+    # Fonts, layouts and palettes, loaded once and shared with every exercise
+    resources = ResourceManager()
+
+    # Questions answered in earlier sessions come back when their review is due
+    review_scheduler = ReviewScheduler.load(LOG_FILE, REVIEW_SNAPSHOT_FILE)
+    review_stats = review_scheduler.load_stats()
+    print(f"Review schedule: {review_stats['items']} questions, {review_stats['snapshot_items']} "
+          f"from snapshot, {review_stats['attempts_read']} attempts read from the log")
+
+    # Create game manager with the catalog's exercises; attempts are written
+    # by a background thread so a slow disk never stalls the event loop
+    game_manager = GameManager.from_catalog(ExerciseCatalog(CATALOG_FILE), screen, resources.fonts,
+                                            logger=BackgroundProgressLogger(LOG_FILE),
+                                            resources=resources,
+                                            scheduler_store=SchedulerStore(SCHEDULER_FILE, REPEAT_COOLDOWN),
+                                            review_scheduler=review_scheduler)
 
     # Initialize first question
     game_manager.next_question()
 
     # Main game loop
-    clock = pygame.time.Clock()
-    running = True
-
-    while running:
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            else:
-                # Let game manager handle all input events (mouse and keyboard)
-                game_manager.handle_input(event)
-
-        # Render everything
-        game_manager.render()
-
-        # Update display
-        pygame.display.flip()
-        clock.tick(60)
+    if render_mode == "continuous":
+        run_continuous_loop(game_manager)
+    else:
+        run_event_loop(game_manager)
+
+    # Drain queued log entries before exiting
+    game_manager.shutdown()
+    stats = game_manager.logger.stats()
+    print(f"Progress log: {stats['records_written']} attempts in {stats['batches_flushed']} batches, "
+          f"max queue depth {stats['max_queue_depth']}, "
+          f"avg flush {stats['avg_flush_ms']:.2f} ms, max flush {stats['max_flush_ms']:.2f} ms")
+    if stats['records_dropped']:
+        print(f"Warning: {stats['records_dropped']} attempts could not be written to the progress log")
+    pool_stats = game_manager.question_pool.stats()
+    print(f"Question pool: {pool_stats['hits']} hits, {pool_stats['misses']} misses "
+          f"({pool_stats['hit_rate']:.0%}), {pool_stats['generated']} prefetched in "
+          f"{pool_stats['refills']} refills, avg refill {pool_stats['avg_refill_ms']:.2f} ms, "
+          f"max refill {pool_stats['max_refill_ms']:.2f} ms")
+    cache_stats = text_cache.stats()
+    print(f"Text cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+          f"({cache_stats['hit_rate']:.0%}), {cache_stats['size']}/{cache_stats['max_size']} surfaces")
 
     pygame.quit()
     sys.exit()
@@ -1,11 +1,15 @@
 import argparse
 from pathlib import Path
-from core.reporting import generate_report
+
+# Heavy dependencies (pygame for the game; pandas, numpy and matplotlib for
+# reports) are imported inside the mode that needs them, so each mode only pays
+# for its own imports. benchmarks/bench_startup.py checks this stays true.
 
 def main():
     """
     Main entry point for the application.
     Handles command-line arguments for different modes (game vs. reporting).
+    Without --report the game is started.
     """
     parser = argparse.ArgumentParser(description="Learn Fractions Application")
     parser.add_argument(
@@ -19,27 +23,94 @@ def main():
         default='progress_pygame.log',
         help='Specify the log file to process for the report.'
     )
+    parser.add_argument(
+        '--log-dir',
+        type=str,
+        default=None,
+        help='Directory (or glob pattern) of per-learner logs; generates one report '
+             'per learner plus a class rollup.'
+    )
     parser.add_argument(
         '--output-dir',
         type=str,
         default='reports',
         help='Specify the directory to save the report files.'
     )
+    parser.add_argument(
+        '--full-rebuild',
+        action='store_true',
+        help='Ignore the saved report checkpoint and re-read the whole log.'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=None,
+        help='Stream the log in chunks of this many rows to bound memory use.'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of processes used to parse the log for the report '
+             '(with --log-dir: number of learner reports generated in parallel, '
+             'default one per CPU).'
+    )
+    parser.add_argument(
+        '--chart-workers',
+        type=int,
+        default=None,
+        help='Number of processes used to render the report charts '
+             '(default: one per chart, up to the number of CPUs).'
+    )
+    parser.add_argument(
+        '--chart-format',
+        choices=['png', 'svg'],
+        default='png',
+        help='Render charts as PNG files with matplotlib, or as inline SVG '
+             '(no matplotlib needed).'
+    )
+    parser.add_argument(
+        '--render-mode',
+        choices=['event', 'continuous'],
+        default='event',
+        help='Game only: redraw only when something changes (event), or redraw '
+             'the whole screen every frame at 60 FPS (continuous).'
+    )
 
     args = parser.parse_args()
 
     project_root = Path(__file__).parent
     
-    if args.report:
+    if args.report and args.log_dir:
+        from core.reporting import generate_batch_reports
+
+        log_source = project_root / args.log_dir
+        output_dir_path = project_root / args.output_dir
+        print(f"Generating learner reports from {log_source} into {output_dir_path}...")
+        generate_batch_reports(str(log_source), str(output_dir_path),
+                               workers=args.workers,
+                               incremental=not args.full_rebuild,
+                               chunk_size=args.chunk_size,
+                               chart_format=args.chart_format)
+    elif args.report:
+        from core.reporting import generate_report
+
         log_file_path = project_root / args.log_file
         output_dir_path = project_root / args.output_dir
         print(f"Generating report from {log_file_path} into {output_dir_path}...")
-        generate_report(str(log_file_path), str(output_dir_path))
+        generate_report(str(log_file_path), str(output_dir_path),
+                        incremental=not args.full_rebuild,
+                        chunk_size=args.chunk_size,
+                        workers=args.workers or 1,
+                        chart_workers=args.chart_workers,
+                        chart_format=args.chart_format)
     else:
-        # TODO: Add the logic to run the game here
-        print("Starting the game... (Not implemented yet)")
-        # For now, you can run the game directly using:
-        # python learn-fractions/learn_fractions_pygame.py
+        try:
+            from learn_pygame_solid import main as run_game
+        except ImportError as e:
+            print(f"Could not start the game: {e}")
+            return
+        run_game(render_mode=args.render_mode)
 
 if __name__ == '__main__':
     main()
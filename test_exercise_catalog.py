@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Tests for the weighted exercise catalog in core/exercise_catalog.py."""
+
+import sys
+import os
+import datetime
+import json
+import random
+import tempfile
+from collections import Counter
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from core.binary_log import HEADER, MAGIC, RECORD_STRUCTS, BinaryLogReader, convert_text_log
+from core.exercise_catalog import AliasTable, ExerciseCatalog
+from core.game_manager import GameManager
+from core.progress_logger import ProgressLogger, split_text_entry
+
+CATALOG = {"exercises": [
+    {"id": "times_5", "type": "multiplication_choice", "params": {"max_number": 5}, "weight": 3},
+    {"id": "comparison", "type": "fraction_comparison", "weight": 1},
+    {"id": "grid", "type": "multiplication", "params": {"difficulty": "easy"}, "weight": 0},
+]}
+
+
+def _write_catalog(path, catalog):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f)
+
+
+def test_alias_table_matches_weights():
+    weights = [5, 0, 1, 2, 0.5, 1.5]
+    table = AliasTable(weights)
+    rng = random.Random(3)
+    samples = 200000
+    counts = Counter(table.sample(rng) for _ in range(samples))
+    assert counts[1] == 0
+    for i, weight in enumerate(weights):
+        assert abs(counts[i] / samples - weight / sum(weights)) < 0.005, (i, counts[i])
+
+
+def test_catalog_picks_by_weight_and_reloads_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.json")
+        _write_catalog(path, CATALOG)
+        catalog = ExerciseCatalog(path, check_interval=0)
+        assert [entry.id for entry in catalog.entries] == ["times_5", "comparison"]
+        counts = Counter(catalog.entry_id(catalog.sample(random.Random(i))) for i in range(4000))
+        assert 2800 < counts["times_5"] < 3200
+
+        times_5 = catalog.exercises[0]
+        changed = {"exercises": CATALOG["exercises"][:2] + [
+            {"id": "times_7", "type": "multiplication_choice", "params": {"max_number": 7}}]}
+        _write_catalog(path, changed)
+        os.utime(path, ns=(0, 10 ** 18))
+        assert catalog.reload_if_changed()
+        assert [entry.id for entry in catalog.entries] == ["times_5", "comparison", "times_7"]
+        # Unchanged entries keep their exercise (and its prefetched questions)
+        assert catalog.exercises[0] is times_5
+
+        # A broken file leaves the catalog as it was
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        os.utime(path, ns=(0, 2 * 10 ** 18))
+        assert not catalog.reload_if_changed()
+        assert len(catalog) == 3
+
+
+def test_attempts_are_logged_with_their_catalog_entry():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.json")
+        _write_catalog(path, CATALOG)
+        for log_format in ("text", "binary"):
+            log_file = os.path.join(tmp, f"progress_{log_format}.log")
+            game = GameManager.from_catalog(ExerciseCatalog(path), pygame.Surface((800, 600)), {},
+                                            logger=ProgressLogger(log_file, log_format))
+            entries = []
+            for _ in range(20):
+                game.next_question()
+                game.make_guess(game.correct_answer)
+                entries.append(game.current_entry)
+            if log_format == "text":
+                with open(log_file, encoding="utf-8") as f:
+                    logged = [split_text_entry(line)[8] for line in f]
+            else:
+                reader = BinaryLogReader(log_file)
+                logged = [reader.strings[code] for code in reader.column("catalog_entry")]
+            assert logged == entries and set(entries) <= {"times_5", "comparison"}
+
+
+def test_text_lines_with_and_without_entry_convert_to_binary():
+    with tempfile.TemporaryDirectory() as tmp:
+        text_log = os.path.join(tmp, "progress.log")
+        with open(text_log, "w", encoding="utf-8") as f:
+            f.write("2025-01-01T08:00:00, number_line, 2.00, 0.100, 0.80, Click where you think 1/2 is, 0.5, 0.6\n")
+            f.write("2025-01-01T08:00:05, multiplication_choice, 1.00, 0.000, 1.00, What is 2 × 3 ?, 6, 6, "
+                    "catalog=times_5\n")
+        assert convert_text_log(text_log, os.path.join(tmp, "progress.bin")) == 2
+        reader = BinaryLogReader(os.path.join(tmp, "progress.bin"))
+        assert [reader.strings[code] for code in reader.column("catalog_entry")] == ["", "times_5"]
+        assert list(reader.to_dataframe()["question"]) == ["Click where you think 1/2 is", "What is 2 × 3 ?"]
+
+
+def test_version_1_binary_logs_are_still_read_and_appended_to():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "old.bin")
+        record = RECORD_STRUCTS[1]
+        with open(log_file, "wb") as f:
+            f.write(HEADER.pack(MAGIC, 1, record.size))
+            f.write(record.pack(0, 6.0, 6.0, 0, 1, 2.0, 0.0, 1.0))
+        with open(log_file + ".strings", "wb") as f:
+            for text in ("multiplication_choice", "What is 2 × 3 ?"):
+                f.write(len(text.encode()).to_bytes(4, "little") + text.encode())
+
+        logger = ProgressLogger(log_file, "binary", clock=lambda: datetime.datetime(2025, 1, 1))
+        logger.log_attempt("multiplication_choice", "What is 2 × 3 ?", 6, 5, 3.0, 0.0, catalog_entry="times_5")
+        reader = BinaryLogReader(log_file)
+    assert reader.version == 1 and len(reader) == 2
+    assert "catalog_entry" not in reader.to_dataframe().columns
+    assert list(reader.column("accuracy")) == [1.0, 0.0]
+
+
+if __name__ == "__main__":
+    test_alias_table_matches_weights()
+    test_catalog_picks_by_weight_and_reloads_changes()
+    test_attempts_are_logged_with_their_catalog_entry()
+    test_text_lines_with_and_without_entry_convert_to_binary()
+    test_version_1_binary_logs_are_still_read_and_appended_to()
+    print("All exercise catalog tests passed!")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for the lazy exercise registry in exercises/registry.py."""
+
+import sys
+import os
+import subprocess
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from exercises.registry import EXERCISE_TYPES, create_exercises
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_importing_package_imports_no_exercise_modules():
+    """Exercise modules are only imported when an exercise is created."""
+    code = (
+        "import sys, exercises\n"
+        "loaded = [m for m, _ in exercises.EXERCISE_TYPES.values() if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+        "exercises.NumberLineExercise\n"
+        "assert 'exercises.number_line_exercise' in sys.modules\n"
+        "assert 'exercises.fraction_comparison_exercise' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_config_builds_enabled_exercises_in_order():
+    exercises = create_exercises([
+        {"type": "multiplication_choice", "params": {"max_number": 5}},
+        {"type": "number_line"},
+        {"type": "fraction_comparison", "enabled": False},
+        {"type": "advanced_fraction_comparison", "params": {"difficulty": "hard"}},
+    ])
+    assert [e.get_type() for e in exercises] == [
+        "multiplication_choice", "number_line", "advanced_fraction_comparison_hard"]
+
+
+def test_missing_module_only_disables_that_exercise():
+    EXERCISE_TYPES["missing_exercise"] = ("exercises.no_such_exercise", "NoSuchExercise")
+    try:
+        exercises = create_exercises([{"type": "missing_exercise"}, {"type": "number_line"}])
+    finally:
+        del EXERCISE_TYPES["missing_exercise"]
+    assert [e.get_type() for e in exercises] == ["number_line"]
+
+
+if __name__ == "__main__":
+    test_importing_package_imports_no_exercise_modules()
+    test_config_builds_enabled_exercises_in_order()
+    test_missing_module_only_disables_that_exercise()
+    print("All exercise registry tests passed!")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for the hit region index used to dispatch mouse input."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from core.hit_regions import HitRegionIndex
+from exercises.advanced_fraction_comparison_exercise import AdvancedFractionComparisonExercise
+
+
+def test_lookup_matches_rect_scan():
+    regions = HitRegionIndex((0, 0, 800, 600), cell_size=64)
+    rects = [pygame.Rect(x, y, 90, 35) for x in range(10, 700, 130) for y in range(20, 560, 60)]
+    rects.append(pygame.Rect(-50, -50, 100, 100))  # partly off screen
+    for i, rect in enumerate(rects):
+        regions.add(rect, i, hover=i % 2 == 0)
+
+    for y in range(0, 600, 7):
+        for x in range(0, 800, 7):
+            expected = next((i for i, rect in enumerate(rects) if rect.collidepoint(x, y)), None)
+            region = regions.at((x, y))
+            assert (region.target if region else None) == expected, (x, y)
+
+    assert regions.at((-5, -5)) is None  # off-screen parts are never hit
+
+    regions.clear()
+    assert len(regions) == 0 and regions.at((20, 30)) is None
+
+
+def test_exercise_click_goes_through_registered_targets():
+    exercise = AdvancedFractionComparisonExercise("easy")
+    exercise.generate_question()
+    regions = HitRegionIndex((0, 0, 800, 600))
+    exercise.register_hit_regions(regions)
+    handlers = exercise.input_handlers()
+
+    option_b = exercise.layout["options"][1]
+    assert handlers.click(option_b.center, regions.at(option_b.center).target) == exercise.frac2
+    option_c = exercise.layout["options"][2]
+    assert handlers.click(option_c.center, regions.at(option_c.center).target) is None
+    assert exercise.invalid_selection
+    assert handlers.click((5, 5), None) is None
+    assert not exercise.invalid_selection
+
+
+if __name__ == "__main__":
+    test_lookup_matches_rect_scan()
+    test_exercise_click_goes_through_registered_targets()
+    print("All hit region tests passed!")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Tests for the array-backed grid of MultiplicationExercise."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from exercises.multiplication_exercise import GridModel, MultiplicationExercise
+
+
+def test_hit_test_matches_cell_rects():
+    grid = GridModel(6, 6, 50, 150, 66, 66)
+    for index in range(len(grid)):
+        x, y, w, h = grid.cell_rect(index)
+        assert grid.cell_at((x, y)) == index
+        assert grid.cell_at((x + w - 1, y + h - 1)) == index
+    # Outside the grid, including the unused strip left by integer cell sizes
+    assert grid.cell_at((49, 200)) is None
+    assert grid.cell_at((50 + 6 * 66, 200)) is None
+    assert grid.cell_at((100, 150 + 6 * 66)) is None
+
+
+def test_clicks_keep_running_count():
+    exercise = MultiplicationExercise("expert")
+    exercise.generate_question()
+    first = exercise.handle_click((51, 151))
+    second = exercise.handle_click((51 + 16, 151))
+    again = exercise.handle_click((51, 151))
+    assert (first, second, again) == (1, 2, 1)
+    assert exercise.handle_click((460, 151)) is None
+    assert exercise.clicked_cells == sum(exercise.grid.clicked) == 1
+
+
+def test_correct_area_covers_product():
+    exercise = MultiplicationExercise("expert")
+    exercise.frac1, exercise.frac2 = (5, 12), (3, 4)
+    exercise._setup_grid()
+    assert exercise.grid.correct_count == sum(exercise.grid.correct) == 10 * 18
+
+
+if __name__ == "__main__":
+    test_hit_test_matches_cell_rects()
+    test_clicks_keep_running_count()
+    test_correct_area_covers_product()
+    print("All multiplication grid tests passed!")
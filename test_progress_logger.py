@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the progress loggers in core/progress_logger.py."""
+
+import sys
+import os
+import datetime
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.binary_log import BinaryLogReader, record_size
+from core.progress_logger import BackgroundProgressLogger, ProgressLogger
+
+START = datetime.datetime(2025, 3, 1, 8, 0)
+
+
+def _log(logger, count, first=0):
+    for i in range(first, first + count):
+        logger.log_attempt("multiplication_choice", f"What is {i} × 2 ?", 2 * i, 2 * i, 1.5, 1.0)
+
+
+def test_binary_log_with_half_written_last_record_reads_whole_records():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.bin")
+        logger = ProgressLogger(log_file, "binary", clock=lambda: START)
+        _log(logger, 3)
+        writer = logger._binary_writer
+        _log(logger, 2, first=3)
+        assert logger._binary_writer is writer
+        logger.close()
+
+        # A write interrupted halfway through a record
+        with open(log_file, "ab") as f:
+            f.write(b"\x01" * (record_size(log_file) // 2))
+        reader = BinaryLogReader(log_file)
+        assert len(reader) == 5
+        assert list(reader.to_dataframe()["question"]) == [f"What is {i} × 2 ?" for i in range(5)]
+
+        # The next logger drops the torn bytes before appending
+        logger = ProgressLogger(log_file, "binary", clock=lambda: START)
+        _log(logger, 1, first=5)
+        logger.close()
+        reader = BinaryLogReader(log_file)
+        assert len(reader) == 6
+        assert list(reader.to_dataframe()["question"]) == [f"What is {i} × 2 ?" for i in range(6)]
+
+
+def test_background_close_drains_every_queued_record():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.log")
+        # Neither the batch size nor the interval is reached before close()
+        logger = BackgroundProgressLogger(log_file, max_queue_size=1000, batch_size=1000,
+                                          flush_interval=60.0, clock=lambda: START)
+        _log(logger, 500)
+        logger.close()
+        stats = logger.stats()
+        with open(log_file, encoding="utf-8") as f:
+            questions = [line.split(", ")[5] for line in f]
+    assert questions == [f"What is {i} × 2 ?" for i in range(500)]
+    assert stats['records_written'] == 500 and stats['records_dropped'] == 0
+    assert stats['queue_depth'] == 0
+
+
+class _FailingLogger(BackgroundProgressLogger):
+    """Background logger whose first `failures` attempts to open the log raise."""
+
+    def __init__(self, log_file, failures):
+        self.failures = failures
+        super().__init__(log_file, batch_size=10, flush_interval=60.0, clock=lambda: START)
+
+    def _open(self):
+        if self.failures > 0:
+            self.failures -= 1
+            raise OSError("disk unavailable")
+        return super()._open()
+
+
+def test_background_write_errors_are_retried_or_counted():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "retried.log")
+        logger = _FailingLogger(log_file, failures=1)
+        _log(logger, 30)
+        logger.close()
+        with open(log_file, encoding="utf-8") as f:
+            assert len(f.readlines()) == 30
+        assert logger.stats()['records_dropped'] == 0
+
+        # Both attempts at the first batch fail; the rest is written
+        logger = _FailingLogger(os.path.join(tmp, "dropped.log"), failures=2)
+        _log(logger, 30)
+        logger.close()
+        stats = logger.stats()
+    assert stats['records_dropped'] == 10 and stats['records_written'] == 20
+
+
+if __name__ == "__main__":
+    test_binary_log_with_half_written_last_record_reads_whole_records()
+    test_background_close_drains_every_queued_record()
+    test_background_write_errors_are_retried_or_counted()
+    print("All progress logger tests passed!")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for prefetched questions (Exercise.generate_questions and core/question_pool.py)."""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from core.game_manager import GameManager
+from core.simulation import NullLogger, answer_for
+from exercises.registry import create_exercises
+
+CONFIG = [
+    {"type": "number_line"},
+    {"type": "fraction_comparison"},
+    {"type": "advanced_fraction_comparison", "params": {"difficulty": "hard"}},
+    {"type": "multiplication", "params": {"difficulty": "easy"}},
+    {"type": "multiplication_choice", "params": {"max_number": 7}},
+]
+
+
+def test_prefetching_keeps_the_current_question():
+    random.seed(4)
+    for exercise in create_exercises(CONFIG):
+        exercise.generate_question()
+        state = exercise.save_question_state()
+        prefetched = exercise.generate_questions(5)
+        assert exercise.save_question_state() == state
+        assert len(prefetched) == 5
+
+        # A prefetched question validates like a freshly generated one
+        question_text, correct, saved = prefetched[-1]
+        exercise.load_question_state(saved)
+        assert exercise.validate_guess(answer_for(exercise, correct, True, random))[0]
+
+
+def test_next_question_is_served_from_the_pool():
+    random.seed(5)
+    game = GameManager(create_exercises(CONFIG), pygame.Surface((800, 600)), {},
+                       logger=NullLogger(), question_pool_size=2)
+    assert game.question_pool.stats()['ready'] == 2 * len(CONFIG)
+
+    for _ in range(3):
+        game.next_question()
+        assert game.question_text
+        game.refill_questions()
+    stats = game.question_pool.stats()
+    assert stats['hits'] == 3 and stats['misses'] == 0
+    assert stats['ready'] == 2 * len(CONFIG)
+
+    # Clicking a grid question taken from the pool starts from an empty grid
+    grid_exercise = game.exercises[3]
+    game.current_exercise = grid_exercise
+    game.question_text, game.correct_answer, state = game.question_pool.take(grid_exercise)
+    grid_exercise.load_question_state(state)
+    assert grid_exercise.clicked_cells == 0
+
+
+if __name__ == "__main__":
+    test_prefetching_keeps_the_current_question()
+    test_next_question_is_served_from_the_pool()
+    print("All question pool tests passed!")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Tests for the no-repeat question scheduler in core/question_scheduler.py."""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from core.exercise import Exercise
+from core.game_manager import GameManager
+from core.progress_logger import ProgressLogger
+from core.question_scheduler import PermutationScheduler, SchedulerStore
+from exercises.multiplication_exercise_num import MultiplicationExerciseNum
+
+
+def test_each_pass_is_a_permutation_and_cooldown_holds_across_passes():
+    for size in (1, 2, 7, 36, 1000):
+        scheduler = PermutationScheduler(size, cooldown=min(20, size - 1), seed=size)
+        served = [scheduler.next() for _ in range(size * 3)]
+        assert sorted(served[:size]) == list(range(size))
+        window = scheduler.cooldown + 1
+        for i in range(len(served) - window + 1):
+            assert len(set(served[i:i + window])) == window, (size, i)
+
+
+def test_saved_state_continues_the_same_order():
+    scheduler = PermutationScheduler(50, cooldown=10, seed=7)
+    for _ in range(45):
+        scheduler.next()
+    restored = PermutationScheduler.from_state(scheduler.state())
+    assert [restored.next() for _ in range(80)] == [scheduler.next() for _ in range(80)]
+
+
+def test_store_restores_exercise_position_between_sessions():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scheduler.json")
+        exercise = MultiplicationExerciseNum(max_number=5)
+        store = SchedulerStore(path, cooldown=5)
+        exercise.use_scheduler(store.scheduler_for(exercise))
+        first_session = [exercise.generate_question()[0] for _ in range(10)]
+        store.save()
+
+        exercise = MultiplicationExerciseNum(max_number=5)
+        exercise.use_scheduler(SchedulerStore(path, cooldown=5).scheduler_for(exercise))
+        second_session = [exercise.generate_question()[0] for _ in range(6)]
+    # 16 questions: both sessions together are one pass without repeats
+    assert len(set(first_session + second_session)) == 16
+
+
+def test_prefetched_questions_are_not_skipped_between_sessions():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scheduler.json")
+        asked = []
+        for questions in (5, 11):
+            game = GameManager([MultiplicationExerciseNum(max_number=5)], pygame.Surface((800, 600)), {},
+                               logger=ProgressLogger(os.path.join(tmp, "progress.log")),
+                               question_pool_size=4, scheduler_store=SchedulerStore(path, cooldown=5))
+            for _ in range(questions):
+                game.next_question()
+                asked.append(game.question_text)
+                game.make_guess(game.correct_answer)
+                game.refill_questions()
+            # Four questions are still waiting in the pool
+            assert game.question_pool.stats()['ready'] == 4
+            game.shutdown()
+    # Both sessions together ask every question of one pass exactly once
+    assert len(set(asked)) == 16
+
+
+class _CountOnlyExercise(Exercise):
+    """Counts its questions but cannot make one current by index."""
+
+    def generate_question(self):
+        return "What is 1 + 1 ?", 2
+
+    def validate_guess(self, guess):
+        return guess == 2, float(guess == 2)
+
+    def get_type(self):
+        return "count_only"
+
+    def question_count(self):
+        return 3
+
+
+def test_scheduler_is_only_used_by_exercises_that_enumerate_questions():
+    exercise = _CountOnlyExercise()
+    assert not exercise.enumerates_questions()
+    assert exercise.find_question("What is 1 + 1 ?") is None
+    try:
+        exercise.use_scheduler(PermutationScheduler(3))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("use_scheduler accepted an exercise without question_at")
+
+    enumerable = MultiplicationExerciseNum(max_number=5)
+    assert enumerable.enumerates_questions()
+    with tempfile.TemporaryDirectory() as tmp:
+        game = GameManager([exercise, enumerable], pygame.Surface((800, 600)), {},
+                           logger=ProgressLogger(os.path.join(tmp, "progress.log")),
+                           scheduler_store=SchedulerStore())
+        for _ in range(10):
+            game.next_question()
+            game.make_guess(game.correct_answer)
+    assert getattr(exercise, "_scheduler", None) is None
+    assert enumerable._scheduler is not None
+
+
+if __name__ == "__main__":
+    test_each_pass_is_a_permutation_and_cooldown_holds_across_passes()
+    test_saved_state_continues_the_same_order()
+    test_store_restores_exercise_position_between_sessions()
+    test_prefetched_questions_are_not_skipped_between_sessions()
+    test_scheduler_is_only_used_by_exercises_that_enumerate_questions()
+    print("All question scheduler tests passed!")
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Tests for the enumerated question universes in core/question_universe.py."""
+
+import sys
+import os
+from fractions import Fraction
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.question_universe import FractionUniverse
+
+
+def test_universe_lists_each_distinct_value_once():
+    universe = FractionUniverse((2, 4, 6))
+    values = [universe.fraction(i) for i in range(len(universe))]
+    assert values == [Fraction(1, 6), Fraction(1, 4), Fraction(1, 3), Fraction(1, 2),
+                      Fraction(2, 3), Fraction(3, 4), Fraction(5, 6)]
+    assert len(FractionUniverse((2, 3, 4, 5, 6, 7, 8, 9, 10, 12), max_value=0.5)) == \
+        len({Fraction(n, d) for d in (2, 3, 4, 5, 6, 7, 8, 9, 10, 12) for n in range(1, d) if n <= d / 2})
+
+
+def test_pair_indices_cover_every_ordered_pair_once():
+    universe = FractionUniverse((2, 3, 4, 5))
+    pairs = [universe.pair(i) for i in range(universe.pair_count())]
+    assert len(set(pairs)) == len(pairs) == len(universe) * (len(universe) - 1)
+    assert all(first != second for first, second in pairs)
+
+
+if __name__ == "__main__":
+    test_universe_lists_each_distinct_value_once()
+    test_pair_indices_cover_every_ordered_pair_once()
+    print("All question universe tests passed!")
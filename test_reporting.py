@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Tests for report aggregation in core/reporting.py."""
+
+import sys
+import os
+import random
+import datetime
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from core.report_aggregates import TIMESCALES, ReportAggregates
+from core.reporting import generate_batch_reports, generate_report
+
+QUESTIONS = [
+    ("multiplication_choice", "What is 3 × 4 ?", "12"),
+    ("fraction_comparison", "Which is smaller: 1/2 or 1/8?", "1/8"),
+    ("number_line", "Click where you think 0.25 is", "0.25"),
+]
+
+
+def write_log(path: Path, count: int, start: datetime.datetime, seed: int = 0):
+    """Append count synthetic attempts, a few minutes apart, to a text log."""
+    rng = random.Random(seed)
+    with open(path, "a", encoding="utf-8") as f:
+        for i in range(count):
+            timestamp = start + datetime.timedelta(minutes=37 * i)
+            exercise_type, question, correct = rng.choice(QUESTIONS)
+            accuracy = 1.0 if rng.random() < 0.7 else 0.0
+            f.write(f"{timestamp.isoformat()}, {exercise_type}, {rng.uniform(1, 20):.2f}, "
+                    f"0.000, {accuracy:.2f}, {question}, {correct}, {correct}\n")
+
+
+def read_report(output_dir: Path) -> str:
+    """Report HTML without the generation timestamp and title."""
+    html = (output_dir / "report.html").read_text(encoding="utf-8")
+    return "\n".join(line for line in html.splitlines()
+                     if "generated on" not in line and "Report 🎯" not in line)
+
+
+def test_incremental_report_matches_full_rebuild():
+    """Appending to a log and re-running gives the same report as a full run."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        log_file = tmp / "progress.log"
+        write_log(log_file, 300, datetime.datetime(2026, 1, 1, 8, 0), seed=1)
+        generate_report(str(log_file), str(tmp / "incremental"))
+
+        write_log(log_file, 200, datetime.datetime(2026, 1, 9, 8, 0), seed=2)
+        generate_report(str(log_file), str(tmp / "incremental"))
+        generate_report(str(log_file), str(tmp / "full"), incremental=False)
+
+        assert read_report(tmp / "incremental") == read_report(tmp / "full")
+
+
+def test_rewritten_log_invalidates_checkpoint():
+    """A log that was replaced rather than appended to is re-read from the start."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        log_file = tmp / "progress.log"
+        write_log(log_file, 300, datetime.datetime(2026, 1, 1, 8, 0), seed=1)
+        generate_report(str(log_file), str(tmp / "incremental"))
+
+        log_file.unlink()
+        write_log(log_file, 400, datetime.datetime(2026, 2, 1, 8, 0), seed=3)
+        generate_report(str(log_file), str(tmp / "incremental"))
+        generate_report(str(log_file), str(tmp / "full"), incremental=False)
+
+        assert read_report(tmp / "incremental") == read_report(tmp / "full")
+
+
+def test_streaming_report_matches_in_memory_report():
+    """Folding the log chunk by chunk gives the same report as one full read."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        log_file = tmp / "progress.log"
+        write_log(log_file, 500, datetime.datetime(2026, 1, 1, 8, 0), seed=4)
+        generate_report(str(log_file), str(tmp / "streamed"), incremental=False, chunk_size=7)
+        generate_report(str(log_file), str(tmp / "full"), incremental=False)
+
+        assert read_report(tmp / "streamed") == read_report(tmp / "full")
+
+
+def test_parallel_ranges_split_on_line_boundaries():
+    """Worker byte ranges cover the log exactly and start at the beginning of a line."""
+    import core.reporting as reporting
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "progress.log"
+        write_log(log_file, 500, datetime.datetime(2026, 1, 1, 8, 0), seed=5)
+        raw = log_file.read_bytes()
+
+        original = reporting.MIN_PARALLEL_RANGE
+        reporting.MIN_PARALLEL_RANGE = 1000
+        try:
+            ranges = reporting._split_ranges(log_file, 0, len(raw), 6)
+            aggregates, rows, _ = reporting._aggregate_log(log_file, 0, None, workers=3)
+        finally:
+            reporting.MIN_PARALLEL_RANGE = original
+
+        assert len(ranges) == 6
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(raw)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start and raw[start - 1:start] == b"\n"
+        assert rows == 500
+        assert int(aggregates.timescale("D")["count"].sum()) == 500
+
+
+def test_class_rollup_matches_combined_log():
+    """The class report built from learner aggregates equals a report of all logs combined."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "logs").mkdir()
+        combined = tmp / "combined.log"
+        for seed, learner in enumerate(["alice", "bob", "carol"]):
+            write_log(tmp / "logs" / f"{learner}.log", 150, datetime.datetime(2026, 1, 1 + seed, 8, 0), seed)
+            write_log(combined, 150, datetime.datetime(2026, 1, 1 + seed, 8, 0), seed)
+
+        generate_batch_reports(str(tmp / "logs"), str(tmp / "batch"), workers=2)
+        generate_report(str(combined), str(tmp / "full"), incremental=False)
+
+        for learner in ["alice", "bob", "carol"]:
+            assert (tmp / "batch" / learner / "report.html").exists()
+        assert (tmp / "batch" / "index.html").exists()
+        assert read_report(tmp / "batch" / "class") == read_report(tmp / "full")
+
+
+def test_svg_report_of_log_with_zero_thinking_times():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        with open(tmp / "zero.log", "w", encoding="utf-8") as f:
+            for i in range(10):
+                timestamp = datetime.datetime(2026, 1, 1, 8, 0) + datetime.timedelta(hours=5 * i)
+                f.write(f"{timestamp.isoformat()}, multiplication_choice, 0.00, 0.000, 1.00, "
+                        f"What is 3 × 4 ?, 12, 12\n")
+        generate_report(str(tmp / "zero.log"), str(tmp / "report"), chart_format="svg")
+        assert "<svg" in (tmp / "report" / "report.html").read_text(encoding="utf-8")
+
+
+def test_questions_containing_commas_are_reported_whole():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        write_log(tmp / "progress.log", 50, datetime.datetime(2026, 1, 1, 8, 0))
+        with open(tmp / "progress.log", "a", encoding="utf-8") as f:
+            for i in range(3):
+                f.write(f"2026-02-01T08:0{i}:00, double_number_line, 7.50, 5.000, 0.00, "
+                        f"If 3.75 is 15%, what is 60%?, 15, 10\n")
+        generate_report(str(tmp / "progress.log"), str(tmp / "report"), chart_format="svg")
+        html = (tmp / "report" / "report.html").read_text(encoding="utf-8")
+    assert "If 3.75 is 15%, what is 60%?" in html
+    assert "If 3.75 is 15%<" not in html
+
+
+def test_chart_cache_rerenders_only_changed_charts():
+    """Charts whose series did not change are not redrawn."""
+    def write_lines(path, days):
+        # Every attempt has the same accuracy and time, so only new periods change a series
+        with open(path, "a", encoding="utf-8") as f:
+            for day in days:
+                f.write(f"2026-01-{day:02d}T08:00:00, multiplication_choice, 5.00, 0.000, 1.00, "
+                        f"What is 3 × 4 ?, 12, 12\n")
+
+    def rendered(output_dir):
+        """Charts written since their modification times were last reset."""
+        charts = sorted(output_dir.glob("*_progress.png"))
+        changed = {chart.name for chart in charts if chart.stat().st_mtime_ns != 0}
+        for chart in charts:
+            os.utime(chart, ns=(0, 0))
+        return changed
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        log_file = tmp / "progress.log"
+        output_dir = tmp / "report"
+        # Monday, Tuesday and Thursday of one week
+        write_lines(log_file, [5, 6, 8])
+        generate_report(str(log_file), str(output_dir), chart_workers=1)
+        assert rendered(output_dir) == {"daily_progress.png", "weekly_progress.png", "monthly_progress.png"}
+
+        generate_report(str(log_file), str(output_dir), chart_workers=1)
+        assert rendered(output_dir) == set()
+
+        # Wednesday fills a gap in the daily chart; the week and month averages stay the same
+        write_lines(log_file, [7])
+        generate_report(str(log_file), str(output_dir), chart_workers=1)
+        assert rendered(output_dir) == {"daily_progress.png"}
+
+
+def test_period_labels_match_pandas_grouper():
+    """Weekly (Sunday-ending) and month-end rollups of the daily cube label periods like pd.Grouper."""
+    rng = random.Random(5)
+    start = datetime.datetime(2026, 1, 18)
+    # Spans the end of January, with attempts just either side of midnight
+    timestamps = sorted(start + datetime.timedelta(days=rng.randrange(30), hours=rng.choice([0, 12, 23]),
+                                                   minutes=rng.choice([0, 59]), seconds=rng.choice([0, 59]))
+                        for _ in range(2000))
+    data = pd.DataFrame({
+        "timestamp": pd.to_datetime(timestamps),
+        "exercise_type": [rng.choice(QUESTIONS)[0] for _ in timestamps],
+        "thinking_time": [rng.uniform(1, 20) for _ in timestamps],
+        "accuracy": [rng.choice([0.0, 0.5, 1.0]) for _ in timestamps],
+        "question": "What is 3 × 4 ?",
+    })
+    data["is_correct"] = data["accuracy"] == 1.0
+    aggregates = ReportAggregates.from_frame(data)
+
+    for freq, _ in TIMESCALES:
+        expected = data.groupby([pd.Grouper(key="timestamp", freq=freq), "exercise_type"]).agg(
+            count=("is_correct", "size"),
+            correct=("is_correct", "sum"),
+            time_sum=("thinking_time", "sum"),
+            accuracy_sum=("accuracy", "sum"),
+        )
+        # Grouper also emits the empty periods in between
+        expected = expected[expected["count"] > 0]
+        actual = aggregates.timescale(freq).sort_index()
+        assert list(actual.index) == list(expected.index), freq
+        assert (actual["count"].to_numpy() == expected["count"].to_numpy()).all(), freq
+        assert (actual["correct"].to_numpy() == expected["correct"].to_numpy()).all(), freq
+        assert abs(actual["time_sum"].to_numpy() - expected["time_sum"].to_numpy()).max() < 1e-9, freq
+    months = {period.month for period in aggregates.timescale("ME").index.get_level_values("period")}
+    assert months == {1, 2}
+
+
+if __name__ == "__main__":
+    test_incremental_report_matches_full_rebuild()
+    test_rewritten_log_invalidates_checkpoint()
+    test_streaming_report_matches_in_memory_report()
+    test_parallel_ranges_split_on_line_boundaries()
+    test_class_rollup_matches_combined_log()
+    test_svg_report_of_log_with_zero_thinking_times()
+    test_questions_containing_commas_are_reported_whole()
+    test_chart_cache_rerenders_only_changed_charts()
+    test_period_labels_match_pandas_grouper()
+    print("All reporting tests passed!")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Tests for the spaced repetition scheduler in core/review_scheduler.py."""
+
+import sys
+import os
+import datetime
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.progress_logger import ProgressLogger
+from core.review_scheduler import FIRST_INTERVAL, RELEARN_INTERVAL, ReviewScheduler
+from core.simulation import BotLearner, ManualClock, Simulation
+from exercises.multiplication_exercise_num import MultiplicationExerciseNum
+from exercises.registry import create_exercises
+
+CONFIG = [
+    {"type": "fraction_comparison"},
+    {"type": "multiplication_choice", "params": {"max_number": 5}},
+]
+
+
+def _log(log_file, clock, attempts):
+    """Append (exercise_type, question, accuracy) attempts, one simulated minute apart."""
+    logger = ProgressLogger(log_file, clock=clock)
+    for exercise_type, question, accuracy in attempts:
+        logger.log_attempt(exercise_type, question, 1, 1, 2.0, accuracy)
+        clock.advance(60)
+    logger.close()
+
+
+def test_log_bootstrap_orders_items_by_due_time():
+    clock = ManualClock()
+    start = clock.now
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.log")
+        _log(log_file, clock, [
+            ("multiplication_choice", "What is 3 × 4 ?", 1.0),
+            ("multiplication_choice", "What is 2 × 5 ?", 0.0),
+            ("fraction_comparison", "Which is larger, 1/2 or 2/3?", 1.0),
+        ])
+        scheduler = ReviewScheduler.load(log_file)
+
+    assert len(scheduler) == 3 and scheduler.load_stats()['attempts_read'] == 3
+    # Nothing is due before the wrong answer's relearn interval has passed
+    assert scheduler.peek_due(start + datetime.timedelta(seconds=60)) is None
+    due = scheduler.peek_due(start + datetime.timedelta(seconds=60 + RELEARN_INTERVAL))
+    assert due.question == "What is 2 × 5 ?"
+    scheduler.record(due.exercise_type, due.question, 1.0, start + datetime.timedelta(seconds=200))
+    due = scheduler.peek_due(start + datetime.timedelta(seconds=FIRST_INTERVAL + 10))
+    assert due.question == "What is 3 × 4 ?"
+
+
+def test_snapshot_is_reused_and_only_new_attempts_are_read():
+    clock = ManualClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.log")
+        snapshot_file = os.path.join(tmp, "review.json")
+        _log(log_file, clock, [("multiplication_choice", f"What is {a} × 2 ?", 1.0) for a in range(2, 6)])
+        scheduler = ReviewScheduler.load(log_file, snapshot_file)
+        scheduler.save()
+
+        _log(log_file, clock, [("multiplication_choice", "What is 2 × 2 ?", 0.0)])
+        resumed = ReviewScheduler.load(log_file, snapshot_file)
+        full = ReviewScheduler.load(log_file)
+
+        # A rewritten log invalidates the snapshot
+        with open(log_file, "w", encoding="utf-8") as f:
+            f.write("")
+        _log(log_file, clock, [("multiplication_choice", "What is 3 × 3 ?", 1.0)])
+        rebuilt = ReviewScheduler.load(log_file, snapshot_file)
+
+    assert resumed.load_stats() == {'snapshot_items': 4, 'attempts_read': 1, 'items': 4}
+    assert {key: item.due for key, item in resumed.items.items()} == \
+        {key: item.due for key, item in full.items.items()}
+    assert rebuilt.load_stats()['snapshot_items'] == 0
+
+
+def test_snapshot_stops_before_a_half_written_line():
+    clock = ManualClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.log")
+        snapshot_file = os.path.join(tmp, "review.json")
+        _log(log_file, clock, [("multiplication_choice", f"What is {a} × 2 ?", 1.0) for a in range(2, 5)])
+        line = f"{clock.now.isoformat()}, multiplication_choice, 2.00, 0.000, 0.00, What is 7 × 7 ?, 49, 1\n"
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(line[:30])
+        ReviewScheduler.load(log_file, snapshot_file).save()
+
+        # The line is finished after the snapshot; it must be read whole
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(line[30:])
+        resumed = ReviewScheduler.load(log_file, snapshot_file)
+
+    assert resumed.load_stats() == {'snapshot_items': 3, 'attempts_read': 1, 'items': 4}
+    assert resumed.items[("multiplication_choice", "What is 7 × 7 ?")].repetitions == 0
+
+
+def test_game_asks_due_questions_first():
+    clock = ManualClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.log")
+        _log(log_file, clock, [
+            ("multiplication_choice", "What is 4 × 3 ?", 0.0),
+            ("multiplication_choice", "What is 9 × 9 ?", 0.0),  # Not in this configuration
+        ])
+        clock.advance(RELEARN_INTERVAL)
+        simulation = Simulation(create_exercises(CONFIG), [BotLearner("perfect", accuracy=1.0, seed=1)],
+                                clock=clock, review_scheduler=ReviewScheduler.load(log_file),
+                                review_interval=1)
+        game = simulation.game_manager
+        game.next_question()
+        assert game.question_text == "What is 4 × 3 ?"
+        assert game.correct_answer == 12
+        game.make_guess(12)
+        # 9 × 9 is due next, but no configured exercise asks it, so a new question is asked
+        game.next_question()
+    assert game.review_scheduler.peek_due(clock.now) is None
+
+
+class _FirstRowScheduler:
+    """Serves only the question indices of 2 × 2 to 2 × 12, in turn."""
+
+    def __init__(self):
+        self.served = 0
+
+    def next(self):
+        self.served += 1
+        return (self.served - 1) % 11
+
+
+def test_reviews_are_interleaved_with_new_questions():
+    clock = ManualClock()
+    exercise = MultiplicationExerciseNum(max_number=12)
+    # New questions never repeat one of these, so every one asked is a review
+    due = [exercise.question_at(i)[0] for i in range(20, 120, 10)]
+    exercise.use_scheduler(_FirstRowScheduler())
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "progress.log")
+        _log(log_file, clock, [("multiplication_choice", question, 0.0) for question in due])
+        clock.advance(RELEARN_INTERVAL)
+        simulation = Simulation([exercise], [BotLearner("perfect", accuracy=1.0, seed=1)],
+                                clock=clock, review_scheduler=ReviewScheduler.load(log_file))
+        game = simulation.game_manager
+        reviews = []
+        for i in range(9):
+            game.next_question()
+            if game.question_text in due:
+                reviews.append(i)
+            game.make_guess(game.correct_answer)
+    # All ten questions are due, but only every third question is a review
+    assert reviews == [0, 3, 6]
+
+
+if __name__ == "__main__":
+    test_log_bootstrap_orders_items_by_due_time()
+    test_snapshot_is_reused_and_only_new_attempts_are_read()
+    test_snapshot_stops_before_a_half_written_line()
+    test_game_asks_due_questions_first()
+    test_reviews_are_interleaved_with_new_questions()
+    print("All review scheduler tests passed!")
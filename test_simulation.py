@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Tests for the headless bot simulation in core/simulation.py."""
+
+import sys
+import os
+import random
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.progress_logger import ProgressLogger
+from core.simulation import BotLearner, ManualClock, Simulation
+from exercises.registry import create_exercises
+
+CONFIG = [
+    {"type": "number_line"},
+    {"type": "fraction_comparison"},
+    {"type": "advanced_fraction_comparison", "params": {"difficulty": "hard"}},
+    {"type": "multiplication", "params": {"difficulty": "medium"}},
+    {"type": "multiplication_choice", "params": {"max_number": 7}},
+]
+
+
+def test_perfect_bot_is_always_right_and_logged_with_simulated_time():
+    random.seed(1)
+    clock = ManualClock()
+    start = clock.now
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "sim.log")
+        bot = BotLearner("perfect", accuracy=1.0, mean_time=3.0, time_sd=0.0, seed=1)
+        simulation = Simulation(create_exercises(CONFIG), [bot],
+                                logger=ProgressLogger(log_file, clock=clock), clock=clock)
+        result = simulation.run(200)
+        with open(log_file, encoding="utf-8") as f:
+            lines = f.readlines()
+
+    assert result['logged'] == 200 and len(lines) == 200
+    assert set(result['accuracy_by_type']) == {
+        "number_line", "fraction_comparison", "advanced_fraction_comparison_hard",
+        "multiplication_medium", "multiplication_choice"}
+    assert all(accuracy == 1.0 for accuracy in result['accuracy_by_type'].values())
+    # Each attempt takes 3 s of thinking plus a 1 s pause, independent of wall time
+    assert result['simulated_seconds'] == 200 * 4.0
+    assert lines[0].startswith((start.replace(second=3)).isoformat())
+    assert ", 3.00, " in lines[0]
+
+
+def test_hopeless_bot_is_never_right():
+    random.seed(2)
+    bot = BotLearner("hopeless", accuracy=0.0, seed=2)
+    simulation = Simulation(create_exercises(CONFIG), [bot])
+    game = simulation.game_manager
+    for _ in range(200):
+        game.next_question()
+        guess = bot.guess(game.current_exercise, game.correct_answer)
+        assert not game.current_exercise.validate_guess(guess)[0], (game.question_text, guess)
+
+
+if __name__ == "__main__":
+    test_perfect_bot_is_always_right_and_logged_with_simulated_time()
+    test_hopeless_bot_is_never_right()
+    print("All simulation tests passed!")